@@ -0,0 +1,106 @@
+"""
+异步执行基准
+在本地模拟服务上分别用同步 run_all_tests 和异步 run_all_tests_async 执行同一批用例，
+比较总耗时和吞吐量
+
+用法:
+    python benchmarks/bench_async.py [--sheet Sheet2] [--repeat 5] [--latency-ms 20] [--concurrency 1 10 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.mock_server import start_mock_server  # noqa: E402
+from config import config  # noqa: E402
+from config.config import base_url  # noqa: E402
+from core.reporting import REPORT_LEVELS  # noqa: E402
+from core.test_executor import TestExecutor  # noqa: E402
+from utils.case_registry import get_test_cases  # noqa: E402
+
+DEFAULT_EXCEL = os.path.join(PROJECT_ROOT, "data", "mall测试用例.xlsx")
+
+
+def build_cases(excel_path: str, sheet_name: str, mock_url: str, repeat: int) -> list:
+    """
+    读取用例并将接口地址改写到模拟服务
+
+    Args:
+        excel_path (str): 用例文件路径
+        sheet_name (str): sheet名称
+        mock_url (str): 模拟服务基础URL
+        repeat (int): 用例重复次数
+
+    Returns:
+        list: 改写后的测试用例
+    """
+    cases = []
+    for case in get_test_cases(excel_path, sheet_name):
+        url = case.url.replace("{{portal.mall}}", mock_url).replace(base_url, mock_url)
+        cases.append(case.replace(url=url))
+    return cases * repeat
+
+
+def run_sync(cases: list) -> tuple:
+    executor = TestExecutor(DEFAULT_EXCEL, "")
+    executor.test_cases = cases
+    start = time.perf_counter()
+    executor.run_all_tests()
+    elapsed = time.perf_counter() - start
+    stats = executor.request_handler.connection_stats()
+    executor.close()
+    return elapsed, stats
+
+
+def run_async(cases: list, concurrency: int) -> dict:
+    executor = TestExecutor(DEFAULT_EXCEL, "")
+    executor.test_cases = cases
+    summary = asyncio.run(executor.run_all_tests_async(concurrency=concurrency))
+    executor.close()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较同步与异步执行用例的耗时")
+    parser.add_argument("--excel", default=DEFAULT_EXCEL, help="用例文件路径")
+    parser.add_argument("--sheet", default="Sheet2", help="sheet名称")
+    parser.add_argument("--repeat", type=int, default=5, help="用例重复次数")
+    parser.add_argument("--latency-ms", type=float, default=20, help="模拟服务的响应延迟（毫秒）")
+    parser.add_argument("--report-level", choices=REPORT_LEVELS, default=config.report_level,
+                        help="同步执行时的请求报告级别")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="异步并发数")
+    args = parser.parse_args()
+
+    # 基准测试只关注耗时，屏蔽逐条用例的日志
+    logging.disable(logging.CRITICAL)
+    config.report_level = args.report_level
+
+    server, mock_url = start_mock_server(latency_ms=args.latency_ms)
+    try:
+        cases = build_cases(args.excel, args.sheet, mock_url, args.repeat)
+        print(f"用例数: {len(cases)}，模拟延迟: {args.latency_ms}ms，报告级别: {args.report_level}，"
+              f"模拟服务: {mock_url}")
+        print(f"{'模式':<14}{'耗时(s)':>10}{'请求/秒':>12}{'失败数':>8}")
+
+        elapsed, stats = run_sync(cases)
+        print(f"{'同步':<14}{elapsed:>10.3f}{len(cases) / elapsed:>12.1f}{'-':>8}"
+              f"  新建连接 {stats['new_connections']}，连接复用率 {stats['reuse_rate']:.0%}")
+
+        for concurrency in args.concurrency:
+            summary = run_async(cases, concurrency)
+            label = f"异步 x{concurrency}"
+            print(f"{label:<14}{summary['elapsed_s']:>10.3f}"
+                  f"{len(cases) / max(summary['elapsed_s'], 1e-9):>12.1f}{summary['failed']:>8}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+批量发送基准
+在本地模拟服务上比较逐个调用 send_case、send_batch 顺序发送和 send_batch 并发发送
+同一批请求的耗时
+
+用法:
+    python benchmarks/bench_batch.py [--sheet Sheet2] [--repeat 5] [--latency-ms 20] [--concurrency 4 10]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.bench_async import DEFAULT_EXCEL, build_cases  # noqa: E402
+from benchmarks.mock_server import MOCK_TOKEN, start_mock_server  # noqa: E402
+from core.reporting import REPORT_OFF, RequestReporter  # noqa: E402
+from core.request_handler import RequestHandler  # noqa: E402
+
+
+def new_handler(pool_maxsize: int) -> RequestHandler:
+    handler = RequestHandler(pool_maxsize=pool_maxsize, shared_pool=False,
+                             reporter=RequestReporter(REPORT_OFF))
+    handler.set_token(MOCK_TOKEN)
+    return handler
+
+
+def run_loop(cases: list) -> tuple:
+    handler = new_handler(1)
+    start = time.perf_counter()
+    failed = 0
+    for case in cases:
+        try:
+            handler.send_case(case)
+        except Exception:
+            failed += 1
+    elapsed = time.perf_counter() - start
+    handler.close()
+    return elapsed, failed
+
+
+def run_batch(cases: list, concurrency: int, ordered: bool) -> tuple:
+    handler = new_handler(concurrency)
+    start = time.perf_counter()
+    results = handler.send_batch(cases, concurrency=concurrency, ordered=ordered)
+    elapsed = time.perf_counter() - start
+    handler.close()
+    return elapsed, sum(isinstance(result, Exception) for result in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较逐个发送与批量发送请求的耗时")
+    parser.add_argument("--excel", default=DEFAULT_EXCEL, help="用例文件路径")
+    parser.add_argument("--sheet", default="Sheet2", help="sheet名称")
+    parser.add_argument("--repeat", type=int, default=5, help="用例重复次数")
+    parser.add_argument("--latency-ms", type=float, default=20, help="模拟服务的响应延迟（毫秒）")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 10], help="并发发送时的并发数")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    server, mock_url = start_mock_server(latency_ms=args.latency_ms)
+    try:
+        cases = build_cases(args.excel, args.sheet, mock_url, args.repeat)
+        print(f"请求数: {len(cases)}，模拟延迟: {args.latency_ms}ms，模拟服务: {mock_url}")
+        print(f"{'模式':<16}{'耗时(s)':>10}{'请求/秒':>12}{'失败数':>8}")
+
+        rows = [("逐个 send_case", run_loop(cases)), ("批量 顺序", run_batch(cases, 1, True))]
+        rows += [(f"批量 并发x{concurrency}", run_batch(cases, concurrency, False))
+                 for concurrency in args.concurrency]
+        for label, (elapsed, failed) in rows:
+            print(f"{label:<16}{elapsed:>10.3f}{len(cases) / max(elapsed, 1e-9):>12.1f}{failed:>8}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+请求模板基准
+在本地模拟服务上重复发送同一批用例，比较 send_case（每次构建请求）和
+send_template（预先编译）每个请求占用的CPU时间
+（模拟服务运行在同一进程中，CPU时间包含服务端开销，只用于两种方式的对比）
+
+用法:
+    python benchmarks/bench_template.py [--sheet Sheet2] [--repeat 50]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.bench_async import DEFAULT_EXCEL, build_cases  # noqa: E402
+from benchmarks.mock_server import MOCK_TOKEN, start_mock_server  # noqa: E402
+from core.reporting import REPORT_OFF, RequestReporter  # noqa: E402
+from core.request_handler import RequestHandler  # noqa: E402
+
+
+def measure(send, items: list) -> tuple:
+    """
+    逐个发送请求
+
+    Returns:
+        tuple: (总耗时, 每个请求的CPU时间（微秒）)
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    for item in items:
+        send(item)
+    return time.perf_counter() - wall, (time.process_time() - cpu) / len(items) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="比较逐次构建请求与预编译请求模板的客户端CPU开销")
+    parser.add_argument("--excel", default=DEFAULT_EXCEL, help="用例文件路径")
+    parser.add_argument("--sheet", default="Sheet2", help="sheet名称")
+    parser.add_argument("--repeat", type=int, default=50, help="用例重复次数")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    server, mock_url = start_mock_server()
+    try:
+        cases = build_cases(args.excel, args.sheet, mock_url, 1)
+        handler = RequestHandler(shared_pool=False, reporter=RequestReporter(REPORT_OFF))
+        handler.metrics = None
+        handler.set_token(MOCK_TOKEN)
+        cases = [case for case in cases if case.body_encoding is not None]
+        templates = [handler.compile_case(case) for case in cases]
+        # 预热连接
+        measure(handler.send_case, cases)
+
+        print(f"请求数: {len(cases) * args.repeat}，模拟服务: {mock_url}")
+        print(f"{'模式':<16}{'耗时(s)':>10}{'请求/秒':>12}{'CPU/请求(us)':>16}")
+        for label, send, items in (("send_case", handler.send_case, cases * args.repeat),
+                                   ("send_template", handler.send_template, templates * args.repeat)):
+            elapsed, cpu_us = measure(send, items)
+            print(f"{label:<16}{elapsed:>10.3f}{len(items) / elapsed:>12.1f}{cpu_us:>16.1f}")
+        handler.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
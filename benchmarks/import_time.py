@@ -0,0 +1,103 @@
+"""
+导入耗时基准
+使用 python -X importtime 统计 pytest --collect-only 的模块导入开销，
+输出导入总耗时和耗时最多的顶层模块，可写入JSON用于按版本跟踪启动开销
+
+用法:
+    python benchmarks/import_time.py [pytest参数...] [--top N] [--json 输出文件]
+    例如: python benchmarks/import_time.py tests/test_cart --json import-time.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# -X importtime 输出格式: "import time: self [us] | cumulative | imported package"
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    解析 -X importtime 的输出
+
+    Args:
+        stderr (str): 子进程的标准错误输出
+
+    Returns:
+        list: 每个模块一项 {"module", "self_us", "cumulative_us", "depth"}
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append({
+            "module": module.strip(),
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            # 输出中每一级嵌套缩进两个空格
+            "depth": (len(indent) - 1) // 2,
+        })
+    return records
+
+
+def measure(pytest_args: list) -> dict:
+    """
+    运行一次 pytest --collect-only 并统计导入耗时
+
+    Args:
+        pytest_args (list): 传给pytest的额外参数
+
+    Returns:
+        dict: 统计结果
+    """
+    cmd = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q",
+           "-p", "no:cacheprovider", *pytest_args]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    wall_s = time.perf_counter() - start
+
+    records = parse_importtime(result.stderr)
+    top_level = [record for record in records if record["depth"] == 0]
+    return {
+        "command": " ".join(cmd[1:]),
+        "returncode": result.returncode,
+        "wall_s": round(wall_s, 3),
+        "module_count": len(records),
+        "total_import_us": sum(record["self_us"] for record in records),
+        "top_level": sorted(top_level, key=lambda record: record["cumulative_us"], reverse=True),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="统计 pytest --collect-only 的导入耗时")
+    parser.add_argument("--top", type=int, default=15, help="显示耗时最多的前N个顶层模块")
+    parser.add_argument("--json", dest="json_path", help="结果写入的JSON文件")
+    args, pytest_args = parser.parse_known_args()
+
+    report = measure(pytest_args)
+    print(f"命令: {report['command']}")
+    print(f"总耗时: {report['wall_s']:.3f}s，导入模块数: {report['module_count']}，"
+          f"导入总耗时: {report['total_import_us'] / 1000:.1f}ms")
+    print(f"{'累计(ms)':>10}  {'自身(ms)':>10}  模块")
+    for record in report["top_level"][:args.top]:
+        print(f"{record['cumulative_us'] / 1000:>10.1f}  {record['self_us'] / 1000:>10.1f}  {record['module']}")
+    if report["returncode"] not in (0, 5):
+        print(f"警告: pytest 返回码为 {report['returncode']}，收集过程可能出错")
+
+    if args.json_path:
+        report["top_level"] = report["top_level"][:args.top]
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"结果已写入 {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+本地模拟服务
+用于基准测试的多线程HTTP服务，对所有接口返回 {"code": 200} 形式的JSON，
+登录接口返回token，可设置固定的响应延迟以模拟网络和服务端耗时
+
+用法:
+    python benchmarks/mock_server.py [--port 8085] [--latency-ms 20]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+MOCK_TOKEN = "mock-token-0123456789"
+
+
+def _make_handler(latency_s: float):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 响应头和响应体分两次写出，关闭Nagle算法避免与客户端的延迟确认叠加出约40ms的等待
+        disable_nagle_algorithm = True
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            if latency_s:
+                time.sleep(latency_s)
+
+            if "login" in self.path:
+                payload = {"code": 200, "message": "操作成功", "data": {"token": MOCK_TOKEN, "tokenHead": "Bearer "}}
+            else:
+                payload = {"code": 200, "message": "操作成功", "data": None}
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        def log_message(self, format, *args):
+            # 基准测试时不输出访问日志
+            pass
+
+    return MockHandler
+
+
+class MockHTTPServer(ThreadingHTTPServer):
+    # 默认监听队列只有5，并发建立连接时队列溢出，客户端要等SYN重传（约1秒）才能连上
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def start_mock_server(port: int = 0, latency_ms: float = 0) -> Tuple[MockHTTPServer, str]:
+    """
+    在后台线程中启动模拟服务
+
+    Args:
+        port (int): 监听端口，0 表示由系统分配
+        latency_ms (float): 每个请求的固定响应延迟（毫秒）
+
+    Returns:
+        Tuple[MockHTTPServer, str]: 服务对象和基础URL，用完后调用 server.shutdown()
+    """
+    server = MockHTTPServer(("127.0.0.1", port), _make_handler(latency_ms / 1000))
+    thread = threading.Thread(target=server.serve_forever, name="mock-server", daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="启动本地模拟服务")
+    parser.add_argument("--port", type=int, default=8085, help="监听端口")
+    parser.add_argument("--latency-ms", type=float, default=0, help="每个请求的响应延迟（毫秒）")
+    args = parser.parse_args()
+
+    server = MockHTTPServer(("127.0.0.1", args.port), _make_handler(args.latency_ms / 1000))
+    print(f"模拟服务已启动: http://127.0.0.1:{args.port}（延迟 {args.latency_ms}ms）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
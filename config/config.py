@@ -1,3 +1,43 @@
 # 基础URL（根据实际环境修改）
 base_url = "http://localhost:8085"
-use_token = False
\ No newline at end of file
+# 多个后端实例（如 ["http://10.0.0.1:8085", "http://10.0.0.2:8085"]），为空时只使用 base_url；
+# 配置后 {{portal.mall}} 和以 base_url 开头的请求按分发策略发往各实例
+base_urls = []
+load_balance_strategy = "round_robin"  # round_robin / least_outstanding / hash_user（按token固定实例）
+use_token = False
+# 是否启用用例编译缓存（缓存在工作簿同级的 .case_cache 目录中）
+use_case_cache = True
+# HTTP连接池配置
+pool_connections = 10  # 缓存的连接池数量（每个主机一个）
+pool_maxsize = 10  # 每个主机保留的最大连接数，多线程执行时应不小于线程数
+keep_alive = True  # 是否复用长连接
+tcp_nodelay = True  # 新建连接是否设置TCP_NODELAY
+connect_timeout = 5  # 建立连接超时时间（秒）
+read_timeout = 30  # 读取响应超时时间（秒）
+share_connection_pool = True  # 各请求处理器是否共享按基础URL缓存的进程级连接池
+# 请求报告级别：off / summary / sampled（每N个请求抽样一次）/ failed（仅失败用例）/ full
+report_level = "full"
+report_sample_every = 10  # sampled 级别的抽样间隔
+report_body_limit = 0  # 日志和附件中请求参数、响应内容的最大字符数，0 表示不截断
+# 流式读取响应体（大列表接口），关闭时一次性读取完整响应体
+stream_responses = False
+max_body_bytes = 0  # 响应体大小上限（字节），超过时请求失败，0 表示不限制
+stream_chunk_size = 65536  # 每次读取的块大小（字节）
+stream_keep_body = True  # 关闭时只保留SHA-256摘要和前 stream_preview_bytes 字节用于报告（无法解析JSON）
+stream_preview_bytes = 65536
+# 重试策略（默认只重试幂等请求）
+retry_max_retries = 2  # 最大重试次数，0 表示不重试
+retry_backoff_base = 0.2  # 第一次重试前的最大等待时间（秒），之后每次翻倍并随机抖动
+retry_backoff_max = 5.0  # 单次重试等待时间上限（秒）
+retry_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+retry_statuses = (502, 503, 504)
+# 按主机划分的熔断器
+circuit_breaker_enabled = True
+circuit_failure_threshold = 0.5  # 最近请求的失败率达到该值时熔断
+circuit_min_requests = 10  # 计算失败率所需的最少请求数
+circuit_window = 20  # 统计的最近请求数
+circuit_open_seconds = 30  # 熔断持续时间（秒），之后放行一个试探请求
+# 接口耗时统计
+latency_metrics_enabled = True
+latency_report_path = "reports/latency.json"  # 测试结束时写入的耗时报告，为空时只在终端输出
+trace_request_phases = False  # 是否记录请求各阶段耗时（DNS、连接、TLS、发送、首字节、读取响应体）
@@ -0,0 +1,239 @@
+"""
+异步请求处理器
+基于 httpx.AsyncClient 的异步HTTP请求处理器，接口与 RequestHandler 保持一致，
+使用有上限的连接池，让多个相互独立的用例可以同时在途
+"""
+
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional, Union
+
+import httpx
+
+from config import config
+from core.body_limits import BodyPolicy
+from core.load_balancer import LoadBalancer
+from core.metrics import LatencyRecorder, latency_recorder
+from core.response_view import ResponseView
+from utils.case_model import TestCase, build_request_kwargs, select_body_encoding
+from utils.jsonpath_cache import find_value
+
+# 配置日志
+logger = logging.getLogger(__name__)
+
+
+class AsyncRequestHandler:
+    """
+    异步HTTP请求处理器类
+
+    重试策略和熔断器只在同步的 RequestHandler 中生效，异步请求失败时直接抛出异常，不经过熔断器
+    """
+
+    def __init__(self, base_url: str = "", max_connections: int = 20,
+                 max_keepalive_connections: Optional[int] = None,
+                 metrics: Optional[LatencyRecorder] = latency_recorder,
+                 body_policy: Optional[BodyPolicy] = None, load_balancer: Optional[LoadBalancer] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None):
+        """
+        初始化异步请求处理器
+
+        Args:
+            base_url (str): 基础URL，用于替换请求中的占位符
+            max_connections (int): 连接池最大连接数（即最大在途请求数）
+            max_keepalive_connections (Optional[int]): 保持空闲的最大连接数，默认与最大连接数相同
+            metrics (Optional[LatencyRecorder]): 耗时统计器，默认使用进程级统计器，传入None时不记录
+            body_policy (Optional[BodyPolicy]): 响应体流式读取策略，None 时一次性读取完整响应体
+            load_balancer (Optional[LoadBalancer]): 多后端负载均衡器，None 时所有请求发往 base_url
+            connect_timeout (Optional[float]): 建立连接超时时间（秒），默认使用 config/config.py 中的配置
+            read_timeout (Optional[float]): 读取响应超时时间（秒），默认使用 config/config.py 中的配置，
+                同时用作发送请求体和等待连接池空闲连接的超时时间
+        """
+        self.base_url = base_url
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections or max_connections,
+        )
+        self.connect_timeout = config.connect_timeout if connect_timeout is None else connect_timeout
+        self.read_timeout = config.read_timeout if read_timeout is None else read_timeout
+        timeout = httpx.Timeout(connect=self.connect_timeout, read=self.read_timeout,
+                                write=self.read_timeout, pool=self.read_timeout)
+        self.client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self.metrics = metrics
+        self.body_policy = body_policy
+        self.load_balancer = load_balancer
+        self.token = None
+
+    def set_token(self, token: str):
+        """
+        设置认证token
+
+        Args:
+            token (str): 认证token
+        """
+        self.token = token
+        self.client.headers["Authorization"] = f"Bearer {token}"
+        logger.info(f"Token已设置: {token[:10]}...")  # 只记录前10位用于调试
+
+    def clear_token(self):
+        """清除认证token"""
+        self.token = None
+        self.client.headers.pop("Authorization", None)
+        logger.info("Token已清除")
+
+    def build_request_params(self, method: str, headers: Mapping[str, str],
+                             params: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+        """
+        根据请求方法和内容类型构建请求参数
+
+        Args:
+            method (str): HTTP请求方法
+            headers (Mapping[str, str]): 请求头
+            params (Union[Dict[str, Any], str]): 请求参数
+
+        Returns:
+            Dict[str, Any]: 构建好的 httpx 请求参数
+        """
+        body_encoding = select_body_encoding(method, headers.get("Content-Type", ""))
+        if body_encoding is None:
+            raise ValueError(f"不支持的请求方法: {method}")
+        return self._to_httpx_kwargs(build_request_kwargs(body_encoding, params))
+
+    @staticmethod
+    def _to_httpx_kwargs(request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        将 requests 风格的请求参数转换为 httpx 的参数
+        （httpx 中字符串/字节请求体使用 content，data 只接受字典）
+        """
+        data = request_kwargs.get("data")
+        if data is None or isinstance(data, dict):
+            return request_kwargs
+        kwargs = dict(request_kwargs)
+        kwargs["content"] = kwargs.pop("data")
+        return kwargs
+
+    async def send_request(self, method: str, url: str, headers: Optional[Mapping[str, str]] = None,
+                           params: Optional[Union[Dict[str, Any], str]] = None,
+                           timeout: Optional[float] = None) -> ResponseView:
+        """
+        异步发送HTTP请求
+
+        Args:
+            method (str): HTTP请求方法 (GET, POST, PUT, DELETE等)
+            url (str): 请求URL
+            headers (Optional[Mapping[str, str]]): 请求头
+            params (Optional[Union[Dict[str, Any], str]]): 请求参数
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        request_headers = dict(self.client.headers)
+        if headers:
+            request_headers.update(headers)
+        request_params = self.build_request_params(method, request_headers, params or {})
+        return await self._send(method, url, headers, request_params, timeout)
+
+    async def send_case(self, case: TestCase, headers: Optional[Mapping[str, str]] = None,
+                        timeout: Optional[float] = None) -> ResponseView:
+        """
+        异步发送预处理过的测试用例请求
+
+        Args:
+            case (TestCase): 测试用例记录
+            headers (Optional[Mapping[str, str]]): 额外的请求头，覆盖用例中的同名请求头
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        if case.body_encoding is None:
+            raise ValueError(f"不支持的请求方法: {case.method}")
+        request_headers = dict(case.headers)
+        if headers:
+            request_headers.update(headers)
+        return await self._send(case.method, case.url, request_headers,
+                                self._to_httpx_kwargs(case.shared_request_kwargs), timeout)
+
+    async def _send(self, method: str, url: str, headers: Optional[Mapping[str, str]],
+                    request_params: Dict[str, Any], timeout: Optional[float]) -> ResponseView:
+        """
+        发送已构建好的请求（并发场景下不写入Allure步骤，只记录日志）
+
+        Args:
+            method (str): HTTP请求方法
+            url (str): 请求URL
+            headers (Optional[Mapping[str, str]]): 请求头（客户端默认请求头会自动合并）
+            request_params (Dict[str, Any]): httpx 请求参数
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        # 配置了多个后端实例时选择实例并改写URL，否则替换基础URL占位符
+        backend = None
+        if self.load_balancer is not None:
+            # 未设置token时（如购物车用例在请求头中携带token）按请求的 Authorization 区分用户
+            user_key = self.token or (headers.get("Authorization") if headers else None)
+            url, backend = self.load_balancer.route(url, user_key)
+        if self.base_url:
+            url = url.replace("{{portal.mall}}", self.base_url)
+
+        # httpx 中 timeout=None 表示不限时，未指定时使用客户端的默认超时
+        timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+
+        logger.info(f"发送异步请求: {method} {url}")
+        start = time.perf_counter()
+        try:
+            if self.body_policy is None:
+                response = ResponseView(await self.client.request(method, url, headers=headers, timeout=timeout,
+                                                                  **request_params))
+            else:
+                response = await self._send_streaming(method, url, headers, request_params, timeout)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            if self.metrics is not None:
+                self.metrics.record(method, url, type(e).__name__, elapsed)
+            if backend is not None:
+                self.load_balancer.release(backend, elapsed, False)
+            raise
+        elapsed = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.record(method, url, response.status_code, elapsed)
+        if backend is not None:
+            self.load_balancer.release(backend, elapsed, response.status_code < 500)
+        logger.info(f"收到异步响应: {method} {url} 状态码={response.status_code}")
+        return response
+
+    async def _send_streaming(self, method: str, url: str, headers: Optional[Mapping[str, str]],
+                              request_params: Dict[str, Any], timeout: Any) -> ResponseView:
+        """按读取策略分块读取响应体，参数同 _send"""
+        request = self.client.build_request(method, url, headers=headers, timeout=timeout, **request_params)
+        raw = await self.client.send(request, stream=True)
+        try:
+            self.body_policy.check_length(raw.headers, url)
+            body = await self.body_policy.read_async(raw.aiter_bytes(self.body_policy.chunk_size), url)
+        finally:
+            await raw.aclose()
+        return ResponseView(raw, body)
+
+    def extract_json_field(self, json_data: Dict[str, Any], path: str) -> Any:
+        """
+        从JSON数据中提取指定路径的值
+
+        Args:
+            json_data (Dict[str, Any]): JSON数据
+            path (str): JSON路径表达式
+
+        Returns:
+            Any: 提取到的值，未找到返回None
+        """
+        try:
+            return find_value(json_data, path)
+        except Exception as e:
+            logger.warning(f"提取JSON字段失败 {path}: {e}")
+            return None
+
+    async def close(self):
+        """关闭客户端及其连接池"""
+        await self.client.aclose()
+        logger.info("异步请求客户端已关闭")
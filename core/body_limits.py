@@ -0,0 +1,173 @@
+"""
+响应体大小限制
+流式分块读取响应体，边读边计算SHA-256并检查大小上限，避免大列表接口的多MB响应
+在并发时占满内存。可以只保留摘要和前 N 字节用于报告，每个在途请求的内存占用有上限
+"""
+
+import hashlib
+from typing import Any, AsyncIterable, Iterable, Optional
+
+from requests.exceptions import RequestException
+
+from config import config
+
+
+class ResponseTooLargeError(RequestException):
+    """响应体超过大小上限"""
+
+
+class CapturedBody:
+    """流式读取的响应体：保留的内容、实际大小和SHA-256摘要"""
+
+    __slots__ = ("content", "size", "sha256", "truncated")
+
+    def __init__(self, content: bytes, size: int, sha256: str, truncated: bool):
+        """
+        初始化响应体记录
+
+        Args:
+            content (bytes): 保留的内容，truncated 为 True 时只是开头部分
+            size (int): 响应体实际大小（字节）
+            sha256 (str): 完整响应体的SHA-256十六进制摘要
+            truncated (bool): 是否只保留了开头部分
+        """
+        self.content = content
+        self.size = size
+        self.sha256 = sha256
+        self.truncated = truncated
+
+    def describe(self) -> str:
+        """报告中使用的说明，如 "共 1048576 字节，sha256=..." """
+        kept = f"仅保留前 {len(self.content)} 字节，" if self.truncated else ""
+        return f"{kept}共 {self.size} 字节，sha256={self.sha256}"
+
+    def __repr__(self) -> str:
+        return f"CapturedBody(size={self.size}, truncated={self.truncated}, sha256={self.sha256[:12]}...)"
+
+
+class BodyPolicy:
+    """响应体读取策略类"""
+
+    def __init__(self, max_body_bytes: int = 0, chunk_size: int = 65536, keep_body: bool = True,
+                 preview_bytes: int = 65536):
+        """
+        初始化响应体读取策略
+
+        Args:
+            max_body_bytes (int): 响应体大小上限（字节），超过时请求失败，0 表示不限制
+            chunk_size (int): 每次读取的块大小（字节）
+            keep_body (bool): 是否保留完整响应体，为 False 时只保留摘要和前 preview_bytes 字节，
+                此时无法解析JSON，适合只关心状态码的压测
+            preview_bytes (int): 不保留完整响应体时保留的开头字节数
+        """
+        self.max_body_bytes = max_body_bytes
+        self.chunk_size = chunk_size
+        self.keep_body = keep_body
+        self.preview_bytes = preview_bytes
+
+    def check_length(self, headers: Any, url: str):
+        """
+        按 Content-Length 提前检查响应体大小，超过上限时不再读取
+
+        Args:
+            headers: 响应头
+            url (str): 请求URL（用于错误信息）
+
+        Raises:
+            ResponseTooLargeError: 声明的大小超过上限
+        """
+        length = headers.get("Content-Length")
+        if self.max_body_bytes and length and length.isdigit() and int(length) > self.max_body_bytes:
+            raise ResponseTooLargeError(f"响应体 {length} 字节超过上限 {self.max_body_bytes} 字节: {url}")
+
+    def new_capture(self, url: str) -> "BodyCapture":
+        """
+        创建一次响应体读取
+
+        Args:
+            url (str): 请求URL（用于错误信息）
+
+        Returns:
+            BodyCapture: 响应体读取器
+        """
+        return BodyCapture(self, url)
+
+    def read(self, chunks: Iterable[bytes], url: str) -> CapturedBody:
+        """
+        分块读取响应体
+
+        Args:
+            chunks (Iterable[bytes]): 响应体数据块，如 requests.Response.iter_content(chunk_size)
+            url (str): 请求URL（用于错误信息）
+
+        Returns:
+            CapturedBody: 读取结果
+
+        Raises:
+            ResponseTooLargeError: 响应体超过大小上限
+        """
+        capture = self.new_capture(url)
+        for chunk in chunks:
+            capture.feed(chunk)
+        return capture.finish()
+
+    async def read_async(self, chunks: AsyncIterable[bytes], url: str) -> CapturedBody:
+        """
+        分块读取异步响应体，如 httpx.Response.aiter_bytes(chunk_size)，参数和返回值同 read
+        """
+        capture = self.new_capture(url)
+        async for chunk in chunks:
+            capture.feed(chunk)
+        return capture.finish()
+
+
+class BodyCapture:
+    """一次响应体读取，逐块累计大小和摘要"""
+
+    __slots__ = ("policy", "url", "size", "_hash", "_buffer")
+
+    def __init__(self, policy: BodyPolicy, url: str):
+        self.policy = policy
+        self.url = url
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes):
+        """
+        处理一个数据块
+
+        Raises:
+            ResponseTooLargeError: 累计大小超过上限
+        """
+        self.size += len(chunk)
+        policy = self.policy
+        if policy.max_body_bytes and self.size > policy.max_body_bytes:
+            raise ResponseTooLargeError(f"响应体超过上限 {policy.max_body_bytes} 字节: {self.url}")
+        self._hash.update(chunk)
+        if policy.keep_body:
+            self._buffer += chunk
+        elif len(self._buffer) < policy.preview_bytes:
+            self._buffer += chunk[:policy.preview_bytes - len(self._buffer)]
+
+    def finish(self) -> CapturedBody:
+        """结束读取，返回读取结果"""
+        return CapturedBody(bytes(self._buffer), self.size, self._hash.hexdigest(),
+                            truncated=len(self._buffer) < self.size)
+
+
+def default_body_policy() -> Optional[BodyPolicy]:
+    """
+    按 config/config.py 创建响应体读取策略
+
+    Returns:
+        Optional[BodyPolicy]: 读取策略，未开启流式读取时为None（一次性读取完整响应体）
+    """
+    if not config.stream_responses:
+        return None
+    return BodyPolicy(
+        max_body_bytes=config.max_body_bytes,
+        chunk_size=config.stream_chunk_size,
+        keep_body=config.stream_keep_body,
+        preview_bytes=config.stream_preview_bytes,
+    )
@@ -0,0 +1,197 @@
+"""
+连接池
+为 requests 会话提供可配置的连接池适配器：每个主机的连接池数量和大小、
+长连接、TCP_NODELAY，并统计新建连接数和连接复用情况。
+进程级共享适配器按基础URL和连接池配置缓存，多个请求处理器各自持有会话
+（请求头、Cookie互不影响），但复用同一组TCP连接
+"""
+
+import atexit
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from core.tracing import TracedHTTPConnection, TracedHTTPSConnection, finish_trace, start_trace
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """连接统计类，记录经过适配器的请求数和新建的TCP连接数（线程安全）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record_request(self):
+        """记录一次请求"""
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self):
+        """记录一次新建连接"""
+        with self._lock:
+            self.new_connections += 1
+
+    def reset(self):
+        """清零统计"""
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取当前统计
+
+        Returns:
+            Dict[str, Any]: 请求数、新建连接数、复用连接的请求数、复用率和新建连接率
+        """
+        with self._lock:
+            requests_count, new_connections = self.requests, self.new_connections
+        reused = max(requests_count - new_connections, 0)
+        return {
+            "requests": requests_count,
+            "new_connections": new_connections,
+            "reused_connections": reused,
+            "reuse_rate": round(reused / requests_count, 4) if requests_count else 0.0,
+            "new_connection_rate": round(new_connections / requests_count, 4) if requests_count else 0.0,
+        }
+
+
+def build_socket_options(tcp_nodelay: bool = True, keep_alive: bool = True) -> List[Tuple[int, int, int]]:
+    """
+    构建新建连接时设置的socket选项
+
+    Args:
+        tcp_nodelay (bool): 是否关闭Nagle算法，小请求不等待合并直接发送
+        keep_alive (bool): 是否开启TCP keepalive探测，空闲连接不易被中间设备断开
+
+    Returns:
+        List[Tuple[int, int, int]]: socket选项列表
+    """
+    options = []
+    if tcp_nodelay:
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if keep_alive:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """可配置连接池的HTTP适配器，统计新建连接和连接复用情况"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 tcp_nodelay: bool = True, keep_alive: bool = True, trace_phases: bool = False, **kwargs):
+        """
+        初始化连接池适配器
+
+        Args:
+            pool_connections (int): 缓存的连接池数量（每个主机一个连接池）
+            pool_maxsize (int): 每个连接池保留的最大连接数
+            tcp_nodelay (bool): 新建连接是否设置TCP_NODELAY
+            keep_alive (bool): 新建连接是否开启TCP keepalive
+            trace_phases (bool): 是否记录请求各阶段耗时（挂到响应的 phases 属性上）
+            **kwargs: 传给 HTTPAdapter 的其他参数（如 max_retries）
+        """
+        self.stats = ConnectionStats()
+        self.trace_phases = trace_phases
+        self.socket_options = build_socket_options(tcp_nodelay, keep_alive)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.socket_options)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        # 连接池新建连接时计数，统计绑定到当前适配器；开启阶段计时时使用带计时的连接类
+        stats = self.stats
+        http_connection = TracedHTTPConnection if self.trace_phases else HTTPConnectionPool.ConnectionCls
+        https_connection = TracedHTTPSConnection if self.trace_phases else HTTPSConnectionPool.ConnectionCls
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = http_connection
+
+            def _new_conn(self):
+                stats.record_new_connection()
+                return super()._new_conn()
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = https_connection
+
+            def _new_conn(self):
+                stats.record_new_connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, stream=False, **kwargs):
+        self.stats.record_request()
+        if not self.trace_phases:
+            return super().send(request, stream=stream, **kwargs)
+        phases = start_trace()
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+            if not stream:
+                # requests 随后也会读取完整响应体，这里提前读取以便计时
+                start = time.perf_counter()
+                response.content
+                phases.body = time.perf_counter() - start
+        finally:
+            finish_trace()
+        response.phases = phases
+        return response
+
+
+_shared_adapters: Dict[Tuple, PooledHTTPAdapter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_adapter(base_url: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                       tcp_nodelay: bool = True, keep_alive: bool = True,
+                       trace_phases: bool = False) -> PooledHTTPAdapter:
+    """
+    获取进程级共享的连接池适配器，相同基础URL和连接池配置返回同一个适配器
+
+    共享适配器的连接在请求处理器关闭后仍然保留，供之后创建的处理器继续复用，
+    进程退出时统一关闭
+
+    Args:
+        base_url (str): 基础URL
+        pool_connections (int): 缓存的连接池数量（每个主机一个连接池）
+        pool_maxsize (int): 每个连接池保留的最大连接数
+        tcp_nodelay (bool): 新建连接是否设置TCP_NODELAY
+        keep_alive (bool): 新建连接是否开启TCP keepalive
+        trace_phases (bool): 是否记录请求各阶段耗时
+
+    Returns:
+        PooledHTTPAdapter: 共享的连接池适配器
+    """
+    key = (base_url, pool_connections, pool_maxsize, tcp_nodelay, keep_alive, trace_phases)
+    with _shared_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            adapter = PooledHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                        tcp_nodelay=tcp_nodelay, keep_alive=keep_alive,
+                                        trace_phases=trace_phases)
+            _shared_adapters[key] = adapter
+            logger.info(f"创建共享连接池: {base_url or '(无基础URL)'}")
+        return adapter
+
+
+def close_shared_adapters():
+    """关闭并清空所有共享适配器（进程退出时自动调用）"""
+    with _shared_lock:
+        adapters = list(_shared_adapters.values())
+        _shared_adapters.clear()
+    for adapter in adapters:
+        adapter.close()
+
+
+atexit.register(close_shared_adapters)
@@ -0,0 +1,187 @@
+"""
+多后端负载均衡
+测试环境有多个 mall-portal 实例且前面没有负载均衡时，把 {{portal.mall}} 和配置的 base_url
+开头的请求分发到各个实例，让压测覆盖整个集群而不是单个节点。
+
+分发策略:
+    round_robin        轮询
+    least_outstanding  在途请求最少的实例优先
+    hash_user          按用户（token）哈希固定到同一个实例，没有用户时轮询
+
+同时按实例统计请求数、错误数和耗时分布
+"""
+
+import itertools
+import logging
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import config
+from core.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER = "{{portal.mall}}"
+
+BALANCE_ROUND_ROBIN = "round_robin"
+BALANCE_LEAST_OUTSTANDING = "least_outstanding"
+BALANCE_HASH_USER = "hash_user"
+BALANCE_STRATEGIES = (BALANCE_ROUND_ROBIN, BALANCE_LEAST_OUTSTANDING, BALANCE_HASH_USER)
+
+
+class Backend:
+    """后端实例及其请求统计"""
+
+    __slots__ = ("url", "outstanding", "requests", "errors", "histogram")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+    def __repr__(self) -> str:
+        return f"Backend({self.url!r}, outstanding={self.outstanding})"
+
+
+class LoadBalancer:
+    """负载均衡器类（线程安全，可在多个请求处理器之间共享）"""
+
+    def __init__(self, base_urls: Iterable[str], strategy: str = BALANCE_ROUND_ROBIN,
+                 aliases: Iterable[str] = ()):
+        """
+        初始化负载均衡器
+
+        Args:
+            base_urls (Iterable[str]): 各后端实例的基础URL
+            strategy (str): 分发策略 (round_robin, least_outstanding, hash_user)
+            aliases (Iterable[str]): 需要分发的URL前缀（如用例加载时已替换进URL的 base_url），
+                {{portal.mall}} 始终会被分发
+        """
+        if strategy not in BALANCE_STRATEGIES:
+            raise ValueError(f"不支持的分发策略: {strategy}，可选值: {', '.join(BALANCE_STRATEGIES)}")
+        self.backends = [Backend(url.rstrip("/")) for url in dict.fromkeys(base_urls)]
+        if not self.backends:
+            raise ValueError("负载均衡至少需要一个后端实例")
+        self.strategy = strategy
+        # 按长度降序匹配，避免较短的前缀先匹配到
+        self.prefixes = tuple(sorted({PLACEHOLDER, *(alias.rstrip("/") for alias in aliases if alias)},
+                                     key=len, reverse=True))
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def route(self, url: str, user_key: Optional[str] = None,
+              unavailable: Optional[Callable[[str], bool]] = None) -> Tuple[str, Optional[Backend]]:
+        """
+        为请求选择后端实例并改写URL，选中的实例在途请求数加一
+
+        Args:
+            url (str): 请求URL
+            user_key (Optional[str]): 用户标识（hash_user 策略使用）
+            unavailable (Optional[Callable[[str], bool]]): 判断实例暂不可用（如熔断器已打开）的函数，
+                全部不可用时仍按策略选择
+
+        Returns:
+            Tuple[str, Optional[Backend]]: 改写后的URL和选中的实例，URL不需要分发时返回原URL和None，
+                选中实例时请求结束后需调用 release
+        """
+        prefix = next((prefix for prefix in self.prefixes if url.startswith(prefix)
+                       and url[len(prefix):len(prefix) + 1] in ("", "/", "?", "#")), None)
+        if prefix is None:
+            return url, None
+        backend = self._choose(user_key, unavailable)
+        return backend.url + url[len(prefix):], backend
+
+    def _choose(self, user_key: Optional[str], unavailable: Optional[Callable[[str], bool]]) -> Backend:
+        candidates = self.backends
+        if unavailable is not None and len(candidates) > 1:
+            candidates = [backend for backend in candidates if not unavailable(backend.url)] or self.backends
+        with self._lock:
+            if self.strategy == BALANCE_LEAST_OUTSTANDING:
+                # 从轮转的起点开始比较，在途请求数相同时轮流选择，避免总是落到第一个实例
+                start = next(self._counter) % len(candidates)
+                backend = min(candidates[start:] + candidates[:start], key=lambda b: b.outstanding)
+            elif self.strategy == BALANCE_HASH_USER and user_key:
+                # 按完整实例列表哈希，实例暂不可用时才改用其余实例
+                backend = self.backends[zlib.crc32(user_key.encode("utf-8")) % len(self.backends)]
+                if backend not in candidates:
+                    backend = candidates[zlib.crc32(user_key.encode("utf-8")) % len(candidates)]
+            else:
+                backend = candidates[next(self._counter) % len(candidates)]
+            backend.outstanding += 1
+        return backend
+
+    def release(self, backend: Backend, seconds: float, success: bool):
+        """
+        请求结束后调用，在途请求数减一并记录耗时
+
+        Args:
+            backend (Backend): route 选中的实例
+            seconds (float): 请求耗时（秒）
+            success (bool): 请求是否成功（请求异常或5xx响应为失败）
+        """
+        with self._lock:
+            backend.outstanding -= 1
+            backend.requests += 1
+            if not success:
+                backend.errors += 1
+            backend.histogram.record(seconds)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        生成各实例的统计
+
+        Returns:
+            List[Dict[str, Any]]: 每个实例的 url、请求数、错误数、在途请求数和耗时分布
+        """
+        with self._lock:
+            return [{
+                "url": backend.url,
+                "requests": backend.requests,
+                "errors": backend.errors,
+                "outstanding": backend.outstanding,
+                "mean_ms": round(backend.histogram.mean(), 3),
+                "p50_ms": round(backend.histogram.percentile(50), 3),
+                "p90_ms": round(backend.histogram.percentile(90), 3),
+                "p99_ms": round(backend.histogram.percentile(99), 3),
+                "max_ms": round(backend.histogram.max_us / 1000, 3),
+            } for backend in self.backends]
+
+    def format_report(self) -> List[str]:
+        """
+        把各实例的统计格式化为文本表格
+
+        Returns:
+            List[str]: 表格的各行
+        """
+        lines = [f"分发策略: {self.strategy}",
+                 f"{'次数':>7}{'错误':>7}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}  实例"]
+        for row in self.report():
+            lines.append(f"{row['requests']:>7}{row['errors']:>7}{row['p50_ms']:>10.1f}{row['p90_ms']:>10.1f}"
+                         f"{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}  {row['url']}")
+        return lines
+
+
+_default_balancers: Dict[Tuple, LoadBalancer] = {}
+_default_lock = threading.Lock()
+
+
+def default_load_balancer() -> Optional[LoadBalancer]:
+    """
+    按 config/config.py 获取进程级共享的负载均衡器，相同配置返回同一个实例
+
+    Returns:
+        Optional[LoadBalancer]: 负载均衡器，未配置 base_urls 时为None（直接使用 base_url）
+    """
+    if not config.base_urls:
+        return None
+    key = (tuple(config.base_urls), config.load_balance_strategy, config.base_url)
+    with _default_lock:
+        balancer = _default_balancers.get(key)
+        if balancer is None:
+            balancer = _default_balancers[key] = LoadBalancer(config.base_urls, config.load_balance_strategy,
+                                                              aliases=(config.base_url,))
+            logger.info(f"启用负载均衡（{config.load_balance_strategy}）: {', '.join(config.base_urls)}")
+        return balancer
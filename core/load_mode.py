@@ -0,0 +1,188 @@
+"""
+压测模式
+按固定到达速率（开环）发送工作簿用例的加权组合：请求按计划时间发出，不等待之前的请求完成，
+后端变慢时施加的负载不会随之下降。耗时从计划发送时间算起，事件循环来不及发送时的排队时间
+也计入耗时（避免协同遗漏）；在途请求达到上限时本次请求被丢弃并单独统计
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+from core.metrics import LatencyHistogram
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """
+    解析用例权重
+
+    Args:
+        spec (str): 形如 "CART-01=3,CART-02=1" 的权重配置，未写权重的用例编号权重为1
+
+    Returns:
+        Dict[str, float]: 用例编号到权重的映射
+
+    Raises:
+        ValueError: 权重不是非负数
+    """
+    weights: Dict[str, float] = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        case_id, _, weight = item.partition("=")
+        weights[case_id.strip()] = float(weight) if weight.strip() else 1.0
+        if weights[case_id.strip()] < 0:
+            raise ValueError(f"用例权重不能为负数: {item}")
+    return weights
+
+
+class CaseLoadStats:
+    """单个用例的压测统计"""
+
+    __slots__ = ("sent", "errors", "dropped", "statuses", "histogram")
+
+    def __init__(self):
+        self.sent = 0
+        self.errors = 0
+        self.dropped = 0
+        self.statuses: Dict[str, int] = {}
+        self.histogram = LatencyHistogram()
+
+
+class LoadStats:
+    """压测统计类，按用例编号记录请求数、错误数、丢弃数、状态码分布和耗时"""
+
+    def __init__(self, rate: float, duration: float):
+        """
+        初始化压测统计
+
+        Args:
+            rate (float): 目标速率（请求/秒）
+            duration (float): 计划持续时间（秒）
+        """
+        self.rate = rate
+        self.duration = duration
+        self.cases: Dict[str, CaseLoadStats] = {}
+        self.max_in_flight = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _case(self, case_id: str) -> CaseLoadStats:
+        stats = self.cases.get(case_id)
+        if stats is None:
+            stats = self.cases[case_id] = CaseLoadStats()
+        return stats
+
+    def record(self, case_id: str, status: Any, seconds: float, error: bool):
+        """
+        记录一次完成的请求
+
+        Args:
+            case_id (str): 用例编号
+            status: 响应状态码，请求异常时为异常类名
+            seconds (float): 从计划发送时间到完成的耗时（秒）
+            error (bool): 是否出错（请求异常或状态码与期望不符）
+        """
+        with self._lock:
+            stats = self._case(case_id)
+            stats.sent += 1
+            if error:
+                stats.errors += 1
+            status = str(status)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.histogram.record(seconds)
+
+    def record_dropped(self, case_id: str):
+        """
+        记录一次因在途请求达到上限而未发送的请求
+
+        Args:
+            case_id (str): 用例编号
+        """
+        with self._lock:
+            self._case(case_id).dropped += 1
+
+    def report(self) -> Dict[str, Any]:
+        """
+        生成压测报告
+
+        Returns:
+            Dict[str, Any]: {"target_rps", "duration_s", "elapsed_s", "sent", "dropped", "errors",
+                "achieved_rps", "error_rate", "max_in_flight", "cases"}，cases 为按请求数降序排列的各用例统计
+        """
+        elapsed = (self.finished or time.monotonic()) - self.started if self.started is not None else 0.0
+        with self._lock:
+            items = list(self.cases.items())
+        cases = []
+        for case_id, stats in items:
+            histogram = stats.histogram
+            cases.append({
+                "case_id": case_id,
+                "sent": stats.sent,
+                "dropped": stats.dropped,
+                "errors": stats.errors,
+                "error_rate": round(stats.errors / stats.sent, 4) if stats.sent else 0.0,
+                "achieved_rps": round(stats.sent / elapsed, 2) if elapsed > 0 else 0.0,
+                "mean_ms": round(histogram.mean(), 3),
+                "p50_ms": round(histogram.percentile(50), 3),
+                "p90_ms": round(histogram.percentile(90), 3),
+                "p99_ms": round(histogram.percentile(99), 3),
+                "max_ms": round(histogram.max_us / 1000, 3),
+                "statuses": dict(sorted(stats.statuses.items())),
+            })
+        cases.sort(key=lambda row: (-row["sent"], row["case_id"]))
+        sent = sum(row["sent"] for row in cases)
+        errors = sum(row["errors"] for row in cases)
+        return {
+            "target_rps": self.rate,
+            "duration_s": self.duration,
+            "elapsed_s": round(elapsed, 3),
+            "sent": sent,
+            "dropped": sum(row["dropped"] for row in cases),
+            "errors": errors,
+            "achieved_rps": round(sent / elapsed, 2) if elapsed > 0 else 0.0,
+            "error_rate": round(errors / sent, 4) if sent else 0.0,
+            "max_in_flight": self.max_in_flight,
+            "cases": cases,
+        }
+
+
+def format_load_report(report: Mapping[str, Any]) -> List[str]:
+    """
+    把压测报告格式化为文本表格
+
+    Args:
+        report (Mapping[str, Any]): LoadStats.report() 生成的报告
+
+    Returns:
+        List[str]: 表格的各行
+    """
+    lines = [f"目标 {report['target_rps']} 请求/秒，实际 {report['achieved_rps']} 请求/秒，"
+             f"持续 {report['elapsed_s']}s，完成 {report['sent']} 个，丢弃 {report['dropped']} 个，"
+             f"错误率 {report['error_rate']:.2%}，最大在途 {report['max_in_flight']}",
+             f"{'用例编号':<16}{'次数':>7}{'丢弃':>6}{'错误率':>9}{'rps':>9}{'p50(ms)':>10}{'p90(ms)':>10}"
+             f"{'p99(ms)':>10}{'max(ms)':>10}"]
+    for row in report["cases"]:
+        lines.append(f"{row['case_id']:<16}{row['sent']:>7}{row['dropped']:>6}{row['error_rate']:>9.2%}"
+                     f"{row['achieved_rps']:>9.1f}{row['p50_ms']:>10.1f}{row['p90_ms']:>10.1f}"
+                     f"{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+    return lines
+
+
+def write_load_report(path: str, report: Mapping[str, Any]):
+    """
+    把压测报告写入JSON文件
+
+    Args:
+        path (str): 输出文件路径
+        report (Mapping[str, Any]): 压测报告
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,266 @@
+"""
+延迟统计
+按 (请求方法, 归一化路径, 状态码) 记录每个请求的耗时，使用HDR风格的对数-线性分桶直方图：
+每个2的幂区间分为64个子桶，相对误差不超过约1.6%，内存占用与请求数无关。
+运行结束时输出各接口的 p50/p90/p99/最大耗时和吞吐量（开启阶段计时时另有各阶段平均耗时），
+并可写入JSON用于趋势跟踪
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from core.tracing import PHASES, RequestPhases
+from utils.case_index import normalize_path
+
+# 前 128 个桶为 0~127 微秒的精确值，之后每个2的幂区间 64 个子桶
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+# 路径中的数字、UUID和长十六进制段归一化为 {id}，避免按资源编号产生大量统计项
+_ID_SEGMENT = re.compile(r"^(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+                         r"|[0-9a-fA-F]{16,})$")
+
+
+def normalize_endpoint(url: str) -> str:
+    """
+    把请求URL归一化为统计用的接口路径
+
+    Args:
+        url (str): 请求URL
+
+    Returns:
+        str: 接口路径，如 /cart/delete/{id}
+    """
+    path = normalize_path(url)
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _bucket_index(value_us: int) -> int:
+    if value_us < SUB_BUCKET_COUNT:
+        return value_us
+    shift = value_us.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_COUNT + (shift - 1) * SUB_BUCKET_HALF + ((value_us >> shift) - SUB_BUCKET_HALF)
+
+
+def _bucket_value(index: int) -> int:
+    """桶内的代表值（区间中点，微秒）"""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = (index - SUB_BUCKET_COUNT) // SUB_BUCKET_HALF + 1
+    lower = ((index - SUB_BUCKET_COUNT) % SUB_BUCKET_HALF + SUB_BUCKET_HALF) << shift
+    return lower + ((1 << shift) >> 1)
+
+
+class LatencyHistogram:
+    """耗时直方图类（微秒精度，稀疏存储非空桶）"""
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float):
+        """
+        记录一次耗时
+
+        Args:
+            seconds (float): 耗时（秒）
+        """
+        value_us = max(int(seconds * 1_000_000), 0)
+        index = _bucket_index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        self.count += 1
+        self.total_us += value_us
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        合并另一个直方图
+
+        Args:
+            other (LatencyHistogram): 要合并的直方图
+        """
+        if not other.count:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min_us = other.min_us if not self.count else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def percentile(self, percent: float) -> float:
+        """
+        计算百分位耗时
+
+        Args:
+            percent (float): 百分位，如 99
+
+        Returns:
+            float: 耗时（毫秒），没有数据时为0
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                # 代表值不超出实际记录到的最小、最大值
+                return min(max(_bucket_value(index), self.min_us), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def mean(self) -> float:
+        """平均耗时（毫秒）"""
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+
+class LatencyRecorder:
+    """按接口记录耗时的统计器类（线程安全）"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        # 开启阶段计时时，每个接口各阶段的 [累计耗时(秒), 请求数]
+        self._phase_totals: Dict[Tuple[str, str, str], List[float]] = {}
+        self._lock = threading.Lock()
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+
+    def record(self, method: str, url: str, status: Any, seconds: float,
+               phases: Optional[RequestPhases] = None):
+        """
+        记录一次请求耗时
+
+        Args:
+            method (str): HTTP请求方法
+            url (str): 请求URL（按路径归一化）
+            status: 响应状态码，请求异常时为异常类名
+            seconds (float): 耗时（秒）
+            phases (Optional[RequestPhases]): 请求各阶段耗时
+        """
+        key = (method, normalize_endpoint(url), str(status))
+        now = time.monotonic()
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+            if phases is not None:
+                totals = self._phase_totals.get(key)
+                if totals is None:
+                    totals = self._phase_totals[key] = [0.0] * (len(PHASES) + 1)
+                for i, phase in enumerate(PHASES):
+                    totals[i] += getattr(phases, phase)
+                totals[-1] += 1
+            if self._first is None:
+                self._first = now - seconds
+            self._last = now
+
+    def reset(self):
+        """清空统计"""
+        with self._lock:
+            self._histograms.clear()
+            self._phase_totals.clear()
+            self._first = self._last = None
+
+    def __len__(self) -> int:
+        return sum(histogram.count for histogram in self._histograms.values())
+
+    def report(self) -> Dict[str, Any]:
+        """
+        生成统计报告
+
+        Returns:
+            Dict[str, Any]: {"generated_at", "duration_s", "requests", "throughput_rps", "endpoints"}，
+                endpoints 为按请求数降序排列的各接口统计
+        """
+        with self._lock:
+            items = [(key, histogram) for key, histogram in self._histograms.items()]
+            phase_totals = {key: list(totals) for key, totals in self._phase_totals.items()}
+            duration = (self._last - self._first) if self._first is not None else 0.0
+        endpoints = []
+        for (method, path, status), histogram in items:
+            row = {
+                "method": method,
+                "path": path,
+                "status": status,
+                "count": histogram.count,
+                "mean_ms": round(histogram.mean(), 3),
+                "p50_ms": round(histogram.percentile(50), 3),
+                "p90_ms": round(histogram.percentile(90), 3),
+                "p99_ms": round(histogram.percentile(99), 3),
+                "max_ms": round(histogram.max_us / 1000, 3),
+                "throughput_rps": round(histogram.count / duration, 2) if duration > 0 else 0.0,
+            }
+            totals = phase_totals.get((method, path, status))
+            if totals:
+                row["phases_mean_ms"] = {phase: round(totals[i] / totals[-1] * 1000, 3)
+                                         for i, phase in enumerate(PHASES)}
+            endpoints.append(row)
+        endpoints.sort(key=lambda row: (-row["count"], row["path"], row["method"], row["status"]))
+        total = sum(row["count"] for row in endpoints)
+        return {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "duration_s": round(duration, 3),
+            "requests": total,
+            "throughput_rps": round(total / duration, 2) if duration > 0 else 0.0,
+            "endpoints": endpoints,
+        }
+
+    def format_report(self, report: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        把统计报告格式化为文本表格
+
+        Args:
+            report (Optional[Dict[str, Any]]): 统计报告，默认重新生成
+
+        Returns:
+            List[str]: 表格的各行
+        """
+        report = report or self.report()
+        lines = [f"共 {report['requests']} 个请求，持续 {report['duration_s']}s，"
+                 f"吞吐量 {report['throughput_rps']} 请求/秒",
+                 f"{'方法':<7}{'状态':<8}{'次数':>7}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}"
+                 f"{'max(ms)':>10}{'rps':>9}  接口"]
+        for row in report["endpoints"]:
+            lines.append(f"{row['method']:<7}{row['status']:<8}{row['count']:>7}{row['p50_ms']:>10.1f}"
+                         f"{row['p90_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}"
+                         f"{row['throughput_rps']:>9.1f}  {row['path']}")
+            if "phases_mean_ms" in row:
+                lines.append("    阶段均值(ms): " + "  ".join(f"{phase}={value:.1f}"
+                                                         for phase, value in row["phases_mean_ms"].items()))
+        return lines
+
+    def write_json(self, path: str, report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        把统计报告写入JSON文件
+
+        Args:
+            path (str): 输出文件路径
+            report (Optional[Dict[str, Any]]): 统计报告，默认重新生成
+
+        Returns:
+            Dict[str, Any]: 写入的统计报告
+        """
+        report = report or self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+# 进程级耗时统计，所有请求处理器共用
+latency_recorder = LatencyRecorder()
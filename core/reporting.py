@@ -0,0 +1,203 @@
+"""
+请求报告
+控制每次请求写入日志和Allure附件的详细程度。请求详情只在需要输出时才格式化，
+高并发或压测时可以只记录摘要，失败或被抽样的请求再补充完整附件
+
+报告级别:
+    off      不记录请求日志，也不写Allure附件
+    summary  每个请求一行摘要日志（方法、URL、状态码、耗时）
+    sampled  摘要日志，另外每 N 个请求写一次完整的Allure附件
+    failed   摘要日志，用例失败时才写入该用例请求的完整附件
+    full     完整日志和Allure附件（请求头、请求参数、响应内容）
+"""
+
+import logging
+import threading
+from itertools import count
+from typing import Any, List, Mapping, Optional
+from utils.json_codec import dumps_pretty
+
+logger = logging.getLogger(__name__)
+
+REPORT_OFF = "off"
+REPORT_SUMMARY = "summary"
+REPORT_SAMPLED = "sampled"
+REPORT_FAILED = "failed"
+REPORT_FULL = "full"
+REPORT_LEVELS = (REPORT_OFF, REPORT_SUMMARY, REPORT_SAMPLED, REPORT_FAILED, REPORT_FULL)
+
+# failed 级别下每个用例最多保留的请求数，避免长用例占用过多内存
+MAX_PENDING_EXCHANGES = 20
+
+# sampled 级别的请求计数，所有报告器共用：测试中常为每个用例新建执行器（及报告器），
+# 每个报告器只发送一两个请求，各自计数时永远达不到抽样间隔
+_sample_counter = count(1)
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """
+    按字符数截断文本
+
+    Args:
+        text (str): 原始文本
+        limit (int): 最大字符数，0 表示不截断
+
+    Returns:
+        str: 截断后的文本
+    """
+    if not limit or len(text) <= limit:
+        return text
+    return f"{text[:limit]}...（已截断，共 {len(text)} 个字符）"
+
+
+class Exchange:
+    """一次请求和响应的记录，附件内容在写入报告时才格式化"""
+
+    __slots__ = ("method", "url", "headers", "params", "response")
+
+    def __init__(self, method: str, url: str, headers: Mapping[str, str], params: Any, response: Any = None):
+        """
+        初始化请求记录
+
+        Args:
+            method (str): HTTP请求方法
+            url (str): 请求URL
+            headers (Mapping[str, str]): 请求头
+            params: 原始请求参数
+            response: HTTP响应对象，请求尚未完成时为None
+        """
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.params = params
+        self.response = response
+
+    def elapsed_ms(self) -> Optional[float]:
+        elapsed = getattr(self.response, "elapsed", None)
+        return None if elapsed is None else elapsed.total_seconds() * 1000
+
+    def summary(self) -> str:
+        status = getattr(self.response, "status_code", "-")
+        elapsed_ms = self.elapsed_ms()
+        elapsed = "-" if elapsed_ms is None else f"{elapsed_ms:.1f}ms"
+        return f"{self.method} {self.url} -> {status} ({elapsed})"
+
+    def response_text(self, body_limit: int) -> str:
+        """响应文本（按 body_limit 截断），流式读取只保留了开头部分时附上大小和摘要"""
+        text = truncate_text(self.response.text, body_limit)
+        body = getattr(self.response, "body", None)
+        if body is not None and body.truncated:
+            text = f"{text}\n...（{body.describe()}）"
+        return text
+
+    def attach_request(self, body_limit: int):
+        """把请求头和请求参数写入Allure附件"""
+        import allure
+        allure.attach(dumps_pretty(dict(self.headers)),
+                      name="请求头", attachment_type=allure.attachment_type.JSON)
+        if self.params:
+            if isinstance(self.params, dict):
+                allure.attach(truncate_text(dumps_pretty(self.params), body_limit),
+                              name="请求参数", attachment_type=allure.attachment_type.JSON)
+            else:
+                allure.attach(truncate_text(str(self.params), body_limit), name="请求参数",
+                              attachment_type=allure.attachment_type.TEXT)
+
+    def attach_response(self, body_limit: int):
+        """把响应内容写入Allure附件"""
+        import allure
+        if self.response is not None:
+            allure.attach(self.response_text(body_limit), name="响应内容",
+                          attachment_type=allure.attachment_type.TEXT)
+
+
+class RequestReporter:
+    """请求报告器类，按报告级别决定每次请求的日志和Allure附件"""
+
+    def __init__(self, level: str = REPORT_FULL, sample_every: int = 10, body_limit: int = 0):
+        """
+        初始化请求报告器
+
+        Args:
+            level (str): 报告级别 (off, summary, sampled, failed, full)
+            sample_every (int): sampled 级别下每多少个请求写一次完整附件（按进程内所有报告器的请求总数计数）
+            body_limit (int): 日志和附件中请求参数、响应内容的最大字符数，0 表示不截断
+        """
+        if level not in REPORT_LEVELS:
+            raise ValueError(f"不支持的报告级别: {level}，可选值: {', '.join(REPORT_LEVELS)}")
+        self.level = level
+        self.sample_every = max(int(sample_every), 1)
+        self.body_limit = body_limit
+        # failed 级别下当前用例的请求记录，每个线程独立
+        self._local = threading.local()
+
+    def _pending(self) -> List[Exchange]:
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = []
+        return pending
+
+    def before_send(self, exchange: Exchange):
+        """
+        请求发送前调用
+
+        Args:
+            exchange (Exchange): 请求记录
+        """
+        if self.level != REPORT_FULL:
+            return
+        import allure
+        logger.info("发送请求: %s %s", exchange.method, exchange.url)
+        logger.info("请求头: %s", exchange.headers)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("请求参数: %s", truncate_text(str(exchange.params), self.body_limit))
+        with allure.step(f"发送 {exchange.method} 请求到 {exchange.url}"):
+            exchange.attach_request(self.body_limit)
+
+    def after_response(self, exchange: Exchange):
+        """
+        收到响应后调用
+
+        Args:
+            exchange (Exchange): 带响应的请求记录
+        """
+        if self.level == REPORT_OFF:
+            return
+        if self.level == REPORT_FULL:
+            import allure
+            status_code = exchange.response.status_code
+            logger.info("收到响应: 状态码=%s", status_code)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("响应内容: %s", exchange.response_text(self.body_limit))
+            with allure.step(f"收到响应，状态码: {status_code}"):
+                exchange.attach_response(self.body_limit)
+            return
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("请求完成: %s", exchange.summary())
+        if self.level == REPORT_SAMPLED:
+            if next(_sample_counter) % self.sample_every == 0:
+                self._attach_exchange(exchange, "抽样请求")
+        elif self.level == REPORT_FAILED:
+            pending = self._pending()
+            if len(pending) >= MAX_PENDING_EXCHANGES:
+                pending.pop(0)
+            pending.append(exchange)
+
+    def begin_case(self):
+        """开始执行新用例时调用，丢弃上一个用例留下的请求记录"""
+        self._pending().clear()
+
+    def report_failure(self):
+        """用例失败时调用，failed 级别下补充写入该用例全部请求的完整附件"""
+        pending = self._pending()
+        if self.level == REPORT_FAILED:
+            for exchange in pending:
+                self._attach_exchange(exchange, "失败用例请求")
+        pending.clear()
+
+    def _attach_exchange(self, exchange: Exchange, title: str):
+        import allure
+        with allure.step(f"{title}: {exchange.summary()}"):
+            exchange.attach_request(self.body_limit)
+            exchange.attach_response(self.body_limit)
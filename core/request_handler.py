@@ -4,29 +4,116 @@
 """
 
 import requests
-import json
-import allure
 import logging
-from typing import Dict, Any, Union, Optional
-from urllib.parse import urlencode
-from jsonpath_ng import parse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Mapping, Sequence, Tuple, Union, Optional
+from config import config
+from core.body_limits import BodyPolicy, CapturedBody, default_body_policy
+from core.connection_pool import PooledHTTPAdapter, get_shared_adapter
+from core.load_balancer import LoadBalancer, default_load_balancer
+from core.metrics import LatencyRecorder, latency_recorder
+from core.request_template import RequestTemplate
+from core.reporting import Exchange, RequestReporter
+from core.resilience import CircuitBreakerRegistry, RetryPolicy
+from core.response_view import ResponseView
+from utils.jsonpath_cache import find_value
+from utils.case_model import TestCase, select_body_encoding, build_request_kwargs
 
 # 配置日志
 logger = logging.getLogger(__name__)
 
+# 进程级熔断器，同一主机的错误率由所有请求处理器共同统计
+shared_circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=config.circuit_failure_threshold,
+    min_requests=config.circuit_min_requests,
+    window=config.circuit_window,
+    open_seconds=config.circuit_open_seconds,
+)
+
 
 class RequestHandler:
     """HTTP请求处理器类"""
 
-    def __init__(self, base_url: str = ""):
+    def __init__(self, base_url: str = "", pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None, keep_alive: Optional[bool] = None,
+                 tcp_nodelay: Optional[bool] = None, connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None, shared_pool: Optional[bool] = None,
+                 reporter: Optional[RequestReporter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 metrics: Optional[LatencyRecorder] = None, trace_phases: Optional[bool] = None,
+                 body_policy: Optional[BodyPolicy] = None, load_balancer: Optional[LoadBalancer] = None):
         """
         初始化请求处理器
         
+        未传入的连接池和超时参数使用 config/config.py 中的配置
+        
         Args:
             base_url (str): 基础URL，用于替换请求中的占位符
+            pool_connections (Optional[int]): 缓存的连接池数量（每个主机一个连接池）
+            pool_maxsize (Optional[int]): 每个主机保留的最大连接数
+            keep_alive (Optional[bool]): 是否复用长连接，关闭时每个请求都发送 Connection: close
+            tcp_nodelay (Optional[bool]): 新建连接是否设置TCP_NODELAY
+            connect_timeout (Optional[float]): 建立连接超时时间（秒）
+            read_timeout (Optional[float]): 读取响应超时时间（秒）
+            shared_pool (Optional[bool]): 是否使用按基础URL共享的进程级连接池，
+                共享时会话（请求头、Cookie、token）仍属于当前处理器，只有TCP连接被复用
+            reporter (Optional[RequestReporter]): 请求报告器，默认按配置的报告级别创建
+            retry_policy (Optional[RetryPolicy]): 重试策略，默认按配置创建
+            circuit_breakers (Optional[CircuitBreakerRegistry]): 熔断器注册表，默认使用进程级共享的熔断器，
+                配置中关闭熔断时不使用
+            metrics (Optional[LatencyRecorder]): 耗时统计器，默认使用进程级统计器，配置中关闭统计时不记录
+            trace_phases (Optional[bool]): 是否记录DNS、连接、TLS、发送、首字节和读取响应体的分阶段耗时，
+                结果见 ResponseView.phases，并汇总到耗时报告中
+            body_policy (Optional[BodyPolicy]): 响应体流式读取策略（大小上限、分块大小、是否只保留摘要），
+                默认按配置创建，配置中未开启流式读取时一次性读取完整响应体
+            load_balancer (Optional[LoadBalancer]): 多后端负载均衡器，默认使用按配置 base_urls 创建的
+                进程级负载均衡器，未配置时所有请求发往 base_url
         """
         self.base_url = base_url
+        self.keep_alive = config.keep_alive if keep_alive is None else keep_alive
+        self.connect_timeout = config.connect_timeout if connect_timeout is None else connect_timeout
+        self.read_timeout = config.read_timeout if read_timeout is None else read_timeout
+        self.shared_pool = config.share_connection_pool if shared_pool is None else shared_pool
+        pool_options = {
+            "pool_connections": config.pool_connections if pool_connections is None else pool_connections,
+            "pool_maxsize": config.pool_maxsize if pool_maxsize is None else pool_maxsize,
+            "tcp_nodelay": config.tcp_nodelay if tcp_nodelay is None else tcp_nodelay,
+            "keep_alive": self.keep_alive,
+            "trace_phases": config.trace_request_phases if trace_phases is None else trace_phases,
+        }
+        if self.shared_pool:
+            self.adapter = get_shared_adapter(base_url, **pool_options)
+        else:
+            self.adapter = PooledHTTPAdapter(**pool_options)
         self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        if not self.keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.reporter = reporter or RequestReporter(
+            level=config.report_level,
+            sample_every=config.report_sample_every,
+            body_limit=config.report_body_limit,
+        )
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=config.retry_max_retries,
+            backoff_base=config.retry_backoff_base,
+            backoff_max=config.retry_backoff_max,
+            methods=config.retry_methods,
+            statuses=config.retry_statuses,
+        )
+        if circuit_breakers is None and config.circuit_breaker_enabled:
+            circuit_breakers = shared_circuit_breakers
+        self.circuit_breakers = circuit_breakers
+        if metrics is None and config.latency_metrics_enabled:
+            metrics = latency_recorder
+        self.metrics = metrics
+        self.body_policy = body_policy or default_body_policy()
+        self.load_balancer = load_balancer or default_load_balancer()
+        self.retries = 0
+        self._stats_lock = threading.Lock()
         self.token = None
 
     def set_token(self, token: str):
@@ -61,44 +148,14 @@ class RequestHandler:
             Dict[str, Any]: 构建好的请求参数
         """
         content_type = headers.get("Content-Type", "")
-        request_params = {}
-
-        if method == "GET":
-            request_params["params"] = params
-        elif method == "POST":
-            if "application/json" in content_type:
-                request_params["json"] = params
-            elif "application/x-www-form-urlencoded" in content_type:
-                # 如果参数是字典，转换为表单编码格式
-                if isinstance(params, dict):
-                    request_params["data"] = urlencode(params)
-                else:
-                    # 如果参数是字符串，直接使用
-                    request_params["data"] = params
-            else:
-                request_params["data"] = params
-        elif method in ["PUT", "PATCH"]:
-            if "application/json" in content_type:
-                request_params["json"] = params
-            elif "application/x-www-form-urlencoded" in content_type:
-                # 如果参数是字典，转换为表单编码格式
-                if isinstance(params, dict):
-                    request_params["data"] = urlencode(params)
-                else:
-                    # 如果参数是字符串，直接使用
-                    request_params["data"] = params
-            else:
-                request_params["data"] = params
-        elif method == "DELETE":
-            request_params["params"] = params
-        else:
+        body_encoding = select_body_encoding(method, content_type)
+        if body_encoding is None:
             raise ValueError(f"不支持的请求方法: {method}")
-
-        return request_params
+        return build_request_kwargs(body_encoding, params)
 
     def send_request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
                     params: Optional[Union[Dict[str, Any], str]] = None, 
-                    timeout: int = 30) -> requests.Response:
+                    timeout: Optional[float] = None) -> ResponseView:
         """
         发送HTTP请求
         
@@ -107,58 +164,333 @@ class RequestHandler:
             url (str): 请求URL
             headers (Optional[Dict[str, str]]): 请求头
             params (Optional[Union[Dict[str, Any], str]]): 请求参数
-            timeout (int): 超时时间（秒）
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
             
         Returns:
-            requests.Response: HTTP响应对象
+            ResponseView: 响应视图（JSON只解析一次）
         """
-        # 替换基础URL占位符
-        if self.base_url:
-            url = url.replace("{{portal.mall}}", self.base_url)
+        return self._send(*self._prepare_request(method, url, headers, params), timeout)
+
+    def send_case(self, case: TestCase, headers: Optional[Mapping[str, str]] = None,
+                  timeout: Optional[float] = None) -> ResponseView:
+        """
+        发送预处理过的测试用例请求
         
-        # 合并请求头
+        用例的请求头、参数和请求体编码方式已在加载时确定，这里直接使用
+        case.shared_request_kwargs，不再重复解析和构建请求参数（也不复制）
+        
+        Args:
+            case (TestCase): 测试用例记录
+            headers (Optional[Mapping[str, str]]): 额外的请求头，覆盖用例中的同名请求头
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+            
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        return self._send(*self._prepare_case(case, headers), timeout)
+
+    def _prepare_request(self, method: str, url: str, headers: Optional[Mapping[str, str]],
+                         params: Any) -> Tuple[str, str, Dict[str, str], Dict[str, Any], Any]:
+        """合并请求头并构建请求参数，返回 _send 所需的前五个参数"""
         request_headers = dict(self.session.headers)
         if headers:
             request_headers.update(headers)
-            
-        # 构建请求参数
         request_params = self.build_request_params(method, request_headers, params or {})
+        return method, url, request_headers, request_params, params
+
+    def _prepare_case(self, case: TestCase,
+                      headers: Optional[Mapping[str, str]]) -> Tuple[str, str, Dict[str, str], Dict[str, Any], Any]:
+        """合并用例请求头，直接使用用例预先构建的请求参数，返回 _send 所需的前五个参数"""
+        if case.body_encoding is None:
+            raise ValueError(f"不支持的请求方法: {case.method}")
+        request_headers = dict(self.session.headers)
+        request_headers.update(case.headers)
+        if headers:
+            request_headers.update(headers)
+        return case.method, case.url, request_headers, case.shared_request_kwargs, case.shared_params
+
+    def send_batch(self, batch: Sequence[Union[TestCase, Mapping[str, Any]]], concurrency: int = 1,
+                   ordered: bool = True, timeout: Optional[float] = None) -> List[Union[ResponseView, Exception]]:
+        """
+        批量发送请求
+        
+        所有请求先统一合并请求头、构建请求参数，再通过连接池发送；结果始终按提交顺序返回。
+        ordered 为 True 时按顺序逐个发送（适合清空、添加、修改、删除这类前后依赖的场景），
+        为 False 时最多 concurrency 个请求同时在途
         
-        logger.info(f"发送请求: {method} {url}")
-        logger.info(f"请求头: {request_headers}")
-        logger.info(f"请求参数: {request_params}")
-        
-        # 添加Allure步骤
-        with allure.step(f"发送 {method} 请求到 {url}"):
-            allure.attach(json.dumps(request_headers, ensure_ascii=False, indent=2), 
-                         name="请求头", attachment_type=allure.attachment_type.JSON)
-            if params:
-                if isinstance(params, dict):
-                    allure.attach(json.dumps(params, ensure_ascii=False, indent=2), 
-                                 name="请求参数", attachment_type=allure.attachment_type.JSON)
+        Args:
+            batch (Sequence[Union[TestCase, Mapping[str, Any]]]): 请求列表，元素为测试用例，
+                或包含 method、url 以及可选 headers、params 的字典
+            concurrency (int): 无序发送时的最大并发数，应不超过连接池的 pool_maxsize
+            ordered (bool): 是否按提交顺序逐个发送
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+            
+        Returns:
+            List[Union[ResponseView, Exception]]: 与提交顺序一致的结果，发送失败的位置为对应的异常
+        """
+        prepared: List[Union[tuple, Exception]] = []
+        for item in batch:
+            try:
+                if isinstance(item, TestCase):
+                    prepared.append(self._prepare_case(item, None))
                 else:
-                    allure.attach(str(params), name="请求参数", 
-                                 attachment_type=allure.attachment_type.TEXT)
-        
-        # 发送请求
-        response = self.session.request(
-            method=method,
-            url=url,
-            headers=request_headers,
-            timeout=timeout,
-            **request_params
-        )
+                    prepared.append(self._prepare_request(item["method"].upper(), item["url"],
+                                                          item.get("headers"), item.get("params")))
+            except Exception as e:
+                prepared.append(e)
+        
+        def send(args: Union[tuple, Exception]) -> Union[ResponseView, Exception]:
+            if isinstance(args, Exception):
+                return args
+            try:
+                return self._send(*args, timeout)
+            except Exception as e:
+                logger.error(f"批量请求失败: {args[0]} {args[1]}: {e}")
+                return e
         
-        # 记录响应
-        logger.info(f"收到响应: 状态码={response.status_code}")
-        logger.info(f"响应内容: {response.text}")
+        if ordered or concurrency <= 1 or len(prepared) <= 1:
+            return [send(args) for args in prepared]
         
-        # 添加响应到Allure报告
-        with allure.step(f"收到响应，状态码: {response.status_code}"):
-            allure.attach(response.text, name=f"响应内容", 
-                         attachment_type=allure.attachment_type.TEXT)
+        workers = min(concurrency, len(prepared))
+        if workers > self.adapter._pool_maxsize:
+            logger.warning(f"并发数 {workers} 超过连接池大小 {self.adapter._pool_maxsize}，多出的连接用完即关闭")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="send-batch") as pool:
+            return list(pool.map(send, prepared))
+
+    def compile_case(self, case: TestCase, headers: Optional[Mapping[str, str]] = None) -> RequestTemplate:
+        """
+        把测试用例编译为请求模板，重复发送时通过 send_template 只替换动态部分
+        
+        会话当前的请求头在编译时合并进模板，之后只有 Authorization（用例或 headers 中
+        未指定时）和Cookie在每次发送时取会话的最新值
+        
+        Args:
+            case (TestCase): 测试用例记录
+            headers (Optional[Mapping[str, str]]): 额外的请求头，覆盖用例中的同名请求头
             
-        return response
+        Returns:
+            RequestTemplate: 请求模板，参数中的 {{name}} 占位符在发送时替换
+        """
+        dynamic_auth = "Authorization" not in case.headers and not (headers and "Authorization" in headers)
+        return self._compile(*self._prepare_case(case, headers), dynamic_auth=dynamic_auth)
+
+    def compile_request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                        params: Optional[Union[Dict[str, Any], str]] = None) -> RequestTemplate:
+        """
+        把请求编译为请求模板，参数含义同 send_request
+        
+        Returns:
+            RequestTemplate: 请求模板，参数中的 {{name}} 占位符在发送时替换
+        """
+        dynamic_auth = not (headers and "Authorization" in headers)
+        return self._compile(*self._prepare_request(method, url, headers, params), dynamic_auth=dynamic_auth)
+
+    def _compile(self, method: str, url: str, request_headers: Dict[str, str], request_params: Dict[str, Any],
+                 params: Any, dynamic_auth: bool) -> RequestTemplate:
+        if self.base_url:
+            url = url.replace("{{portal.mall}}", self.base_url)
+        return RequestTemplate(self.session, method, url, request_headers, request_params, params,
+                               dynamic_auth=dynamic_auth)
+
+    def send_template(self, template: RequestTemplate, values: Optional[Mapping[str, Any]] = None,
+                      timeout: Optional[float] = None) -> ResponseView:
+        """
+        发送编译好的请求模板
+        
+        Args:
+            template (RequestTemplate): 请求模板
+            values (Optional[Mapping[str, Any]]): 占位符的值，如 {"cart_id": 12}
+            timeout (Optional[float]): 超时时间（秒），默认分别使用连接超时和读取超时
+            
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        prepared = template.render(self.session.headers.get("Authorization"), self.session.cookies, values)
+        return self._send(template.method, prepared.url, prepared.headers, template.send_kwargs,
+                          template.params, timeout, prepared=prepared)
+
+    def _send(self, method: str, url: str, request_headers: Mapping[str, str],
+              request_params: Dict[str, Any], params: Any,
+              timeout: Optional[float], prepared: Optional[requests.PreparedRequest] = None) -> ResponseView:
+        """
+        发送已构建好的请求，并按报告级别记录日志和Allure报告
+        
+        Args:
+            method (str): HTTP请求方法
+            url (str): 请求URL
+            request_headers (Mapping[str, str]): 合并后的请求头
+            request_params (Dict[str, Any]): 传给 requests 的请求参数（发送模板时为 Session.send 的参数）
+            params: 原始请求参数（用于报告）
+            timeout (Optional[float]): 超时时间（秒），None 时使用 (连接超时, 读取超时)
+            prepared (Optional[requests.PreparedRequest]): 由请求模板生成的请求，直接发送
+            
+        Returns:
+            ResponseView: 响应视图（JSON只解析一次）
+        """
+        # 配置了多个后端实例时选择实例并改写URL，否则替换基础URL占位符
+        backend = None
+        if self.load_balancer is not None:
+            # 未设置token时（如购物车用例在请求头中携带token）按请求的 Authorization 区分用户
+            user_key = self.token or request_headers.get("Authorization")
+            url, backend = self.load_balancer.route(url, user_key, self._backend_unavailable)
+            if backend is not None and prepared is not None:
+                prepared.url = url
+        if self.base_url:
+            url = url.replace("{{portal.mall}}", self.base_url)
+        
+        exchange = Exchange(method, url, request_headers, params)
+        self.reporter.before_send(exchange)
+        
+        # 发送请求（按重试策略重试，熔断器打开时直接失败），记录包含重试在内的总耗时
+        start = time.perf_counter()
+        try:
+            if prepared is None:
+                request_params = dict(request_params, headers=request_headers)
+            raw = self._request_with_retry(
+                method,
+                url,
+                prepared,
+                timeout=self.timeout if timeout is None else timeout,
+                stream=self.body_policy is not None,
+                **request_params
+            )
+            exchange.response = ResponseView(raw, self._read_body(raw, url))
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            if self.metrics is not None:
+                self.metrics.record(method, url, type(e).__name__, elapsed)
+            if backend is not None:
+                self.load_balancer.release(backend, elapsed, False)
+            raise
+        elapsed = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.record(method, url, exchange.response.status_code, elapsed, exchange.response.phases)
+        if backend is not None:
+            self.load_balancer.release(backend, elapsed, exchange.response.status_code < 500)
+        
+        # 按报告级别记录响应，请求详情只在需要时才格式化
+        self.reporter.after_response(exchange)
+        
+        return exchange.response
+
+    def _backend_unavailable(self, url: str) -> bool:
+        """后端实例的熔断器已打开时，负载均衡暂时跳过该实例"""
+        return self.circuit_breakers is not None and self.circuit_breakers.for_url(url).is_open()
+
+    def _read_body(self, raw: requests.Response, url: str) -> Optional[CapturedBody]:
+        """
+        按读取策略分块读取流式响应体，未开启流式读取时返回None
+        
+        Args:
+            raw (requests.Response): 以 stream=True 发送得到的响应
+            url (str): 请求URL
+            
+        Returns:
+            Optional[CapturedBody]: 读取结果
+            
+        Raises:
+            ResponseTooLargeError: 响应体超过大小上限（连接随之关闭，不放回连接池）
+        """
+        if self.body_policy is None:
+            return None
+        start = time.perf_counter()
+        try:
+            self.body_policy.check_length(raw.headers, url)
+            body = self.body_policy.read(raw.iter_content(self.body_policy.chunk_size), url)
+        except Exception:
+            raw.close()
+            raise
+        # 读完后连接自动放回连接池
+        phases = getattr(raw, "phases", None)
+        if phases is not None:
+            phases.body = time.perf_counter() - start
+        return body
+
+    def _request_with_retry(self, method: str, url: str, prepared: Optional[requests.PreparedRequest] = None,
+                            **kwargs) -> requests.Response:
+        """
+        发送请求，连接错误、超时和网关类错误状态码按重试策略重试
+        
+        Args:
+            method (str): HTTP请求方法
+            url (str): 请求URL
+            prepared (Optional[requests.PreparedRequest]): 已准备好的请求，传入时通过 session.send 直接发送
+            **kwargs: 传给 session.request（或 session.send）的参数
+            
+        Returns:
+            requests.Response: 最后一次请求的响应
+            
+        Raises:
+            CircuitOpenError: 目标主机的熔断器已打开
+            requests.RequestException: 重试用尽后的请求异常
+        """
+        breaker = self.circuit_breakers.for_url(url) if self.circuit_breakers is not None else None
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                if prepared is None:
+                    response = self.session.request(method=method, url=url, **kwargs)
+                else:
+                    response = self.session.send(prepared, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if breaker is not None:
+                    breaker.record(False)
+                if not self.retry_policy.should_retry(method, attempt, error=e):
+                    raise
+                logger.warning(f"请求失败，准备第 {attempt + 1} 次重试: {method} {url}: {e}")
+            except Exception:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                transient = response.status_code in self.retry_policy.statuses
+                if breaker is not None:
+                    breaker.record(not transient)
+                if not transient or not self.retry_policy.should_retry(method, attempt, response.status_code):
+                    return response
+                logger.warning(f"收到状态码 {response.status_code}，准备第 {attempt + 1} 次重试: {method} {url}")
+                response.close()
+            with self._stats_lock:
+                self.retries += 1
+            time.sleep(self.retry_policy.backoff(attempt))
+            attempt += 1
+
+    def resilience_stats(self) -> Dict[str, Any]:
+        """
+        获取重试和熔断统计
+        
+        Returns:
+            Dict[str, Any]: 本处理器的重试次数，以及各主机熔断器的状态、打开次数和拒绝的请求数
+        """
+        return {
+            "retries": self.retries,
+            "circuit_breakers": self.circuit_breakers.snapshot() if self.circuit_breakers is not None else {},
+        }
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """默认超时时间 (连接超时, 读取超时)"""
+        return self.connect_timeout, self.read_timeout
+
+    def backend_stats(self) -> List[Dict[str, Any]]:
+        """
+        获取各后端实例的请求统计（使用共享负载均衡器时为所有处理器的统计）
+        
+        Returns:
+            List[Dict[str, Any]]: 每个实例的请求数、错误数、在途请求数和耗时分布，未启用负载均衡时为空
+        """
+        return self.load_balancer.report() if self.load_balancer is not None else []
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        获取连接复用统计（使用共享连接池时为整个连接池的统计）
+        
+        Returns:
+            Dict[str, Any]: 请求数、新建连接数、复用连接的请求数、复用率和新建连接率
+        """
+        return self.adapter.stats.snapshot()
 
     def extract_json_field(self, json_data: Dict[str, Any], path: str) -> Any:
         """
@@ -172,14 +504,18 @@ class RequestHandler:
             Any: 提取到的值，未找到返回None
         """
         try:
-            expr = parse(path)
-            match = expr.find(json_data)
-            return match[0].value if match else None
+            return find_value(json_data, path)
         except Exception as e:
             logger.warning(f"提取JSON字段失败 {path}: {e}")
             return None
 
     def close(self):
-        """关闭会话"""
-        self.session.close()
-        logger.info("请求会话已关闭")
\ No newline at end of file
+        """关闭会话（共享连接池中的连接保留给其他处理器复用）"""
+        stats = self.connection_stats()
+        if self.shared_pool:
+            # Session.close 会关闭所有挂载的适配器，共享时只清理本会话自己的状态
+            self.session.cookies.clear()
+        else:
+            self.session.close()
+        logger.info(f"请求会话已关闭，共 {stats['requests']} 个请求，新建连接 {stats['new_connections']} 个，"
+                    f"连接复用率 {stats['reuse_rate']:.0%}")
\ No newline at end of file
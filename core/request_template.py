@@ -0,0 +1,126 @@
+"""
+请求模板
+把用例编译为预先准备好的请求：URL、合并后的请求头和编码后的请求体只构建一次，
+重复执行（重复运行、压测）时只复制模板并替换token、Cookie和 {{变量}} 占位符，
+跳过 requests 每次请求的参数构建、请求头合并和准备流程
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+from urllib.parse import quote, quote_plus
+
+import requests
+from requests.cookies import RequestsCookieJar
+
+from utils import json_codec
+
+# {{name}} 占位符，URL和表单中会被编码为 %7B%7Bname%7D%7D
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}|%7B%7B(\w+)%7D%7D", re.IGNORECASE)
+
+
+def _find_placeholders(text: str) -> FrozenSet[str]:
+    return frozenset(plain or encoded for plain, encoded in _PLACEHOLDER.findall(text))
+
+
+def _substitute(text: str, values: Mapping[str, Any], content_type: str = "") -> str:
+    """
+    替换文本中的占位符
+
+    JSON请求体中整个字符串为占位符时按JSON值替换（数字不带引号），字符串内部的占位符按JSON转义；
+    URL和表单中编码过的占位符按URL编码替换
+    """
+    is_json = "application/json" in content_type
+    form = content_type.startswith("application/x-www-form-urlencoded")
+    for name, value in values.items():
+        plain = str(value)
+        if is_json:
+            text = text.replace(f'"{{{{{name}}}}}"', json_codec.dumps(value))
+            plain = json_codec.dumps(plain)[1:-1]
+        encoded = quote_plus(str(value)) if form else quote(str(value), safe="")
+        text = re.sub(f"%7B%7B{name}%7D%7D", lambda match: encoded, text, flags=re.IGNORECASE)
+        text = text.replace(f"{{{{{name}}}}}", plain)
+    return text
+
+
+class RequestTemplate:
+    """
+    请求模板类
+
+    由 RequestHandler.compile_case / compile_request 创建，通过 RequestHandler.send_template 发送。
+    模板不可变，可以在多个线程中同时使用
+    """
+
+    __slots__ = ("method", "url", "params", "prepared", "send_kwargs", "dynamic_auth", "variables")
+
+    def __init__(self, session: requests.Session, method: str, url: str, headers: Mapping[str, str],
+                 request_params: Mapping[str, Any], params: Any, dynamic_auth: bool = True):
+        """
+        编译请求模板
+
+        Args:
+            session (requests.Session): 发送请求的会话，用于计算代理、证书等环境配置
+            method (str): HTTP请求方法
+            url (str): 请求URL（已替换基础URL占位符）
+            headers (Mapping[str, str]): 合并后的请求头
+            request_params (Mapping[str, Any]): 传给 requests 的请求参数（params 或 data）
+            params: 原始请求参数（用于报告）
+            dynamic_auth (bool): 发送时是否使用会话当前的 Authorization 请求头
+        """
+        self.method = method
+        self.params = params
+        self.prepared = requests.Request(method=method, url=url, headers=dict(headers), **request_params).prepare()
+        self.url = self.prepared.url
+        settings = session.merge_environment_settings(self.url, {}, None, None, None)
+        settings.pop("stream", None)
+        self.send_kwargs: Dict[str, Any] = settings
+        self.dynamic_auth = dynamic_auth
+        body = self.prepared.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        self.variables = _find_placeholders(self.url) | _find_placeholders(body or "")
+
+    def render(self, authorization: Optional[str] = None, cookies: Optional[RequestsCookieJar] = None,
+               values: Optional[Mapping[str, Any]] = None) -> requests.PreparedRequest:
+        """
+        生成本次发送的请求
+
+        Args:
+            authorization (Optional[str]): 会话当前的 Authorization 请求头，模板的 dynamic_auth 为 False 时忽略
+            cookies (Optional[RequestsCookieJar]): 会话当前的Cookie
+            values (Optional[Mapping[str, Any]]): 占位符的值，如 {"cart_id": 12}
+
+        Returns:
+            requests.PreparedRequest: 可以直接交给 Session.send 的请求
+
+        Raises:
+            KeyError: 模板中的占位符没有提供值
+        """
+        prepared = self.prepared.copy()
+        if self.dynamic_auth:
+            if authorization:
+                prepared.headers["Authorization"] = authorization
+            else:
+                prepared.headers.pop("Authorization", None)
+        if cookies:
+            prepared.prepare_cookies(cookies)
+        if self.variables:
+            values = values or {}
+            missing = self.variables.difference(values)
+            if missing:
+                raise KeyError(f"请求模板缺少占位符的值: {', '.join(sorted(missing))}")
+            values = {name: values[name] for name in self.variables}
+            prepared.url = _substitute(prepared.url, values)
+            body = prepared.body
+            if body:
+                content_type = prepared.headers.get("Content-Type", "")
+                if isinstance(body, bytes):
+                    body = _substitute(body.decode("utf-8"), values, content_type).encode("utf-8")
+                else:
+                    body = _substitute(body, values, content_type)
+                prepared.body = body
+                prepared.prepare_content_length(body)
+        return prepared
+
+    def __repr__(self) -> str:
+        variables = f", variables={sorted(self.variables)}" if self.variables else ""
+        return f"RequestTemplate({self.method} {self.url!r}{variables})"
@@ -0,0 +1,227 @@
+"""
+请求容错
+重试策略（默认只重试幂等请求，指数退避加随机抖动）和按主机划分的熔断器：
+后端持续出错时熔断器打开，后续请求直接失败，不再逐个等待超时
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError, RequestException, Timeout
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+TRANSIENT_STATUSES = (502, 503, 504)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RequestException):
+    """熔断器打开时直接拒绝请求"""
+
+
+class RetryPolicy:
+    """重试策略类"""
+
+    def __init__(self, max_retries: int = 2, backoff_base: float = 0.2, backoff_max: float = 5.0,
+                 methods: Iterable[str] = IDEMPOTENT_METHODS, statuses: Iterable[int] = TRANSIENT_STATUSES):
+        """
+        初始化重试策略
+
+        Args:
+            max_retries (int): 最大重试次数，0 表示不重试
+            backoff_base (float): 第一次重试前的最大等待时间（秒），之后每次翻倍
+            backoff_max (float): 单次等待时间上限（秒）
+            methods (Iterable[str]): 允许重试的请求方法，默认只包含幂等方法
+            statuses (Iterable[int]): 需要重试的HTTP状态码
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+
+    def should_retry(self, method: str, attempt: int, status_code: Optional[int] = None,
+                     error: Optional[BaseException] = None) -> bool:
+        """
+        判断本次请求结果是否需要重试
+
+        Args:
+            method (str): HTTP请求方法
+            attempt (int): 已经重试的次数
+            status_code (Optional[int]): 响应状态码
+            error (Optional[BaseException]): 请求异常
+
+        Returns:
+            bool: 是否重试
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, (ConnectionError, Timeout)) and not isinstance(error, CircuitOpenError)
+        return status_code in self.statuses
+
+    def backoff(self, attempt: int) -> float:
+        """
+        计算第 attempt 次重试前的等待时间（指数退避，在 [0, 上限] 内随机抖动）
+
+        Args:
+            attempt (int): 已经重试的次数
+
+        Returns:
+            float: 等待时间（秒）
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    熔断器类（线程安全）
+
+    统计最近 window 个请求的失败率，请求数达到 min_requests 且失败率不低于阈值时打开；
+    打开 open_seconds 秒后进入半开状态放行一个试探请求，成功则关闭，失败则重新打开
+    """
+
+    def __init__(self, name: str, failure_threshold: float = 0.5, min_requests: int = 10,
+                 window: int = 20, open_seconds: float = 30.0):
+        """
+        初始化熔断器
+
+        Args:
+            name (str): 名称（主机地址）
+            failure_threshold (float): 打开熔断的失败率阈值
+            min_requests (int): 计算失败率所需的最少请求数
+            window (int): 统计的最近请求数
+            open_seconds (float): 熔断打开后多久进入半开状态（秒）
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.state = CIRCUIT_CLOSED
+        self.trips = 0
+        self.rejected = 0
+        self._results: Deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        请求前检查熔断状态
+
+        Raises:
+            CircuitOpenError: 熔断器打开（或半开状态下已有试探请求）时拒绝请求
+        """
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return
+            if self.state == CIRCUIT_OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self.state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == CIRCUIT_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                logger.info(f"熔断器半开，放行试探请求: {self.name}")
+                return
+            self.rejected += 1
+        raise CircuitOpenError(f"熔断器已打开，拒绝请求: {self.name}")
+
+    def record(self, success: bool):
+        """
+        记录一次请求结果
+
+        Args:
+            success (bool): 请求是否成功
+        """
+        with self._lock:
+            if self.state == CIRCUIT_HALF_OPEN:
+                self._trial_in_flight = False
+                if success:
+                    self.state = CIRCUIT_CLOSED
+                    self._results.clear()
+                    logger.info(f"试探请求成功，熔断器关闭: {self.name}")
+                else:
+                    self._open()
+                return
+            self._results.append(success)
+            if self.state == CIRCUIT_CLOSED and len(self._results) >= self.min_requests:
+                failure_rate = self._results.count(False) / len(self._results)
+                if failure_rate >= self.failure_threshold:
+                    self._open()
+
+    def release(self):
+        """请求因与后端无关的原因（如URL错误）中止时调用，不计入统计，只释放半开状态的试探名额"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def is_open(self) -> bool:
+        """熔断器是否处于打开状态且尚未到达半开时间（负载均衡时跳过该主机）"""
+        with self._lock:
+            return self.state == CIRCUIT_OPEN and time.monotonic() - self._opened_at < self.open_seconds
+
+    def _open(self):
+        self.state = CIRCUIT_OPEN
+        self._opened_at = time.monotonic()
+        self.trips += 1
+        logger.warning(f"失败率过高，熔断器打开 {self.open_seconds}s: {self.name}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取熔断器状态
+
+        Returns:
+            Dict[str, Any]: 状态、打开次数和被拒绝的请求数
+        """
+        with self._lock:
+            return {"state": self.state, "trips": self.trips, "rejected": self.rejected}
+
+
+class CircuitBreakerRegistry:
+    """按主机缓存熔断器"""
+
+    def __init__(self, **breaker_options):
+        """
+        初始化熔断器注册表
+
+        Args:
+            **breaker_options: 创建熔断器时使用的参数，见 CircuitBreaker
+        """
+        self.breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        """
+        获取URL所属主机的熔断器
+
+        Args:
+            url (str): 请求URL
+
+        Returns:
+            CircuitBreaker: 熔断器
+        """
+        host = urlsplit(url).netloc or url
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(host, **self.breaker_options)
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取所有熔断器的状态
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 主机到熔断器状态的映射
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,112 @@
+"""
+响应视图
+包装 requests/httpx 的响应对象，响应体只解析一次JSON并缓存结果，
+执行器和断言工具共用同一份解析结果，避免对大列表响应重复解码
+"""
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Optional
+from utils import json_codec
+
+if TYPE_CHECKING:
+    from core.body_limits import CapturedBody
+    from core.tracing import RequestPhases
+
+_NOT_LOADED = object()
+
+
+class ResponseView:
+    """
+    响应视图类
+
+    状态码、耗时、文本和JSON解析结果在首次访问时缓存；
+    其他属性和方法（headers、raise_for_status 等）直接转发给原始响应。
+    流式读取的响应体保存在 body 中，content、text 和 json() 都基于保留下来的内容
+    """
+
+    __slots__ = ("raw", "body", "status_code", "_elapsed", "_text", "_json", "_json_error")
+
+    def __init__(self, raw: Any, body: Optional["CapturedBody"] = None):
+        """
+        初始化响应视图
+
+        Args:
+            raw: 原始响应对象（requests.Response 或 httpx.Response）
+            body (Optional[CapturedBody]): 流式读取的响应体，None 表示由原始响应一次性读取
+        """
+        self.raw = raw
+        self.body = body
+        self.status_code: int = raw.status_code
+        self._elapsed = _NOT_LOADED
+        self._text = _NOT_LOADED
+        self._json = _NOT_LOADED
+        self._json_error: Optional[ValueError] = None
+
+    @property
+    def elapsed(self) -> Optional[timedelta]:
+        """请求耗时"""
+        if self._elapsed is _NOT_LOADED:
+            self._elapsed = getattr(self.raw, "elapsed", None)
+        return self._elapsed
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        """请求耗时（毫秒）"""
+        elapsed = self.elapsed
+        return None if elapsed is None else elapsed.total_seconds() * 1000
+
+    @property
+    def phases(self) -> Optional["RequestPhases"]:
+        """请求各阶段耗时（开启阶段计时时才有，否则为None）"""
+        return getattr(self.raw, "phases", None)
+
+    @property
+    def content(self) -> bytes:
+        """响应体字节（只保留开头部分时为保留的内容）"""
+        return self.raw.content if self.body is None else self.body.content
+
+    @property
+    def text(self) -> str:
+        """响应文本"""
+        if self._text is _NOT_LOADED:
+            if self.body is None:
+                self._text = self.raw.text
+            else:
+                self._text = self.body.content.decode(self.raw.encoding or "utf-8", errors="replace")
+        return self._text
+
+    def json(self) -> Any:
+        """
+        获取解析后的JSON响应体（只解析一次）
+
+        直接用JSON编解码器解析原始字节，非UTF-8编码的响应回退到按文本解析
+
+        Returns:
+            Any: JSON数据
+
+        Raises:
+            ValueError: 响应内容不是有效的JSON（或流式读取时只保留了开头部分），每次调用都会抛出同一个异常
+        """
+        if self._json is _NOT_LOADED:
+            try:
+                if self.body is not None and self.body.truncated:
+                    raise ValueError(f"响应体未完整保留，无法解析JSON（{self.body.describe()}）")
+                try:
+                    self._json = json_codec.loads(self.content)
+                except ValueError:
+                    self._json = self.raw.json() if self.body is None else json_codec.loads(self.text)
+            except ValueError as e:
+                self._json = None
+                self._json_error = e
+        if self._json_error is not None:
+            raise self._json_error
+        return self._json
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+    def __bool__(self) -> bool:
+        return bool(self.raw)
+
+    def __repr__(self) -> str:
+        return f"<ResponseView [{self.status_code}]>"
@@ -3,16 +3,26 @@
 负责整体测试流程的协调和管理，是测试框架的核心组件
 """
 
-import json
-import allure
+import asyncio
+import itertools
 import logging
+import random
 import re
-from typing import Dict, Any, List, Optional
-from core.request_handler import RequestHandler
-from utils.excel_reader import read_excel_test_cases
-from utils.assertion_utils import *
+import time
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Mapping, Optional, Tuple
+from utils.case_sources import iter_cases
+from utils.case_registry import case_registry, get_test_cases
+from utils.case_index import CaseIndex
+from utils.case_watcher import CaseDelta, CaseWatcher
+from utils.case_model import TestCase, identify_module_type, parse_headers, parse_params_input
+from utils.assertion_utils import assert_response_status
 from config.config import base_url
 
+# requests、allure等较重的依赖在首次使用时才导入，缩短测试收集和启动时间
+if TYPE_CHECKING:
+    from core.async_request_handler import AsyncRequestHandler
+    from core.request_handler import RequestHandler
+
 # 配置日志
 logger = logging.getLogger(__name__)
 
@@ -20,26 +30,38 @@ logger = logging.getLogger(__name__)
 class TestExecutor:
     """测试执行器类，负责协调整个测试执行流程"""
 
+    __test__ = False  # 避免被pytest当作测试类收集
+
     def __init__(self, excel_path: str, sheet_name: str):
         """
         初始化测试执行器
         
         Args:
-            excel_path (str): Excel测试用例文件路径
-            sheet_name (str): Excel工作表名称
+            excel_path (str): 测试用例文件路径（.xlsx/.csv/.jsonl/.parquet，按扩展名选择加载方式）
+            sheet_name (str): Excel工作表名称（其他格式忽略）
         """
         self.excel_path = excel_path
         self.sheet_name = sheet_name
         self.test_cases = []
-        self.request_handler = RequestHandler(base_url=base_url)
+        self._request_handler = None  # 首次使用时创建，见 request_handler 属性
         self.token_storage = {}  # 用于存储各模块的token
+        self.case_watcher = None  # 用例文件监视器（watch_test_cases 启用）
+        self._case_index = None
+        self._case_index_source = None
+        # load_test_cases 从用例注册表取得的用例元组及据此生成的用例列表，用于判断能否共享注册表的索引
+        self._registry_cases = None
+        self._registry_list = None
 
     def load_test_cases(self):
         """
         从Excel文件加载测试用例
+        
+        用例通过进程级用例注册表获取，同一文件和sheet在进程内只解析一次，
+        各执行器共享同一份只读用例视图
         """
         try:
-            self.test_cases = read_excel_test_cases(self.excel_path, self.sheet_name)
+            self._registry_cases = get_test_cases(self.excel_path, self.sheet_name)
+            self.test_cases = self._registry_list = list(self._registry_cases)
             logger.info(f"成功加载 {len(self.test_cases)} 条测试用例")
             
             # 记录用例信息到日志
@@ -52,51 +74,123 @@ class TestExecutor:
             logger.error(f"加载测试用例失败: {str(e)}")
             raise
 
-    def identify_module_type(self, case: Dict[str, Any]) -> str:
+    def iter_test_cases(self) -> Iterator[Dict[str, Any]]:
+        """
+        逐条获取测试用例
+        
+        已通过 load_test_cases 加载时直接遍历内存中的用例，否则按文件扩展名
+        以流式方式逐条读取，不会一次性构建完整的用例列表
+        
+        Returns:
+            Iterator[Dict[str, Any]]: 测试用例迭代器
+        """
+        if self.test_cases:
+            yield from self.test_cases
+        else:
+            yield from iter_cases(self.excel_path, self.sheet_name)
+
+    @property
+    def request_handler(self) -> "RequestHandler":
+        """
+        请求处理器，首次访问时才导入HTTP相关依赖并创建会话
+        
+        Returns:
+            RequestHandler: 请求处理器
+        """
+        if self._request_handler is None:
+            from core.request_handler import RequestHandler
+            self._request_handler = RequestHandler(base_url=base_url)
+        return self._request_handler
+
+    @property
+    def case_index(self) -> CaseIndex:
+        """
+        当前用例的查找索引
+        
+        用例与注册表中的一致时直接使用注册表缓存的共享索引，
+        用例列表被 apply_case_delta 替换后才为当前执行器单独建立
+        
+        Returns:
+            CaseIndex: 用例索引
+        """
+        if not self.test_cases:
+            self.load_test_cases()
+        if self._case_index_source is not self.test_cases:
+            index = None
+            if self.test_cases is self._registry_list:
+                shared = case_registry.get_index(self.excel_path, self.sheet_name)
+                # 注册表可能已被其他执行器的增量失效并重新加载，内容不同时不能共用
+                if shared.cases is self._registry_cases:
+                    index = shared
+            self._case_index = index if index is not None else CaseIndex(self.test_cases)
+            self._case_index_source = self.test_cases
+        return self._case_index
+
+    def watch_test_cases(self, interval: float = 2.0) -> CaseWatcher:
+        """
+        启用用例文件监视，文件被修改时只把新增、修改、删除的用例增量应用到当前执行器，
+        长时间运行的会话无需重启或完整重新加载即可使用最新用例
+        
+        Args:
+            interval (float): 检查文件变化的间隔（秒）
+            
+        Returns:
+            CaseWatcher: 用例文件监视器
+        """
+        if not self.test_cases:
+            self.load_test_cases()
+        if self.case_watcher is None:
+            self.case_watcher = CaseWatcher(self.excel_path, self.sheet_name, interval)
+            self.case_watcher.subscribe(self.apply_case_delta)
+            self.case_watcher.start()
+        return self.case_watcher
+
+    def apply_case_delta(self, delta: CaseDelta):
+        """
+        应用用例增量：按用例编号替换修改的用例、移除删除的用例、追加新增的用例
+        
+        新的用例列表构建完成后整体替换，正在遍历旧列表的执行流程不受影响
+        
+        Args:
+            delta (CaseDelta): 用例增量
+        """
+        changed = {case.case_id: case for case in delta.changed}
+        removed = set(delta.removed)
+        test_cases = [changed.get(case.get("用例编号"), case) for case in self.test_cases
+                      if case.get("用例编号") not in removed]
+        test_cases.extend(delta.added)
+        self.test_cases = test_cases
+        # 共享注册表中的用例已过期，后续新建的执行器重新加载
+        case_registry.invalidate(self.excel_path, self.sheet_name)
+        logger.info(f"已应用用例增量 {delta}，当前共 {len(self.test_cases)} 条测试用例")
+
+    def identify_module_type(self, case: Mapping[str, Any]) -> str:
         """
         根据URL路径识别模块类型
         
         Args:
-            case (Dict[str, Any]): 测试用例
+            case (Mapping[str, Any]): 测试用例
             
         Returns:
             str: 模块类型 (auth, cart, order, product, public)
         """
-        url = case.get("接口地址", "")
-        
-        # 根据URL路径识别模块类型
-        if "/member/" in url or "/auth/" in url or "login" in url or "register" in url:
-            return "auth"
-        elif "/cart/" in url:
-            return "cart"
-        elif "/order/" in url:
-            return "order"
-        elif "/product/" in url:
-            return "product"
-        else:
-            # 根据用例编号前缀识别
-            case_id = case.get("用例编号", "")
-            if case_id.startswith("MP-LOGIN") or case_id.startswith("MP-REGISTER"):
-                return "auth"
-            elif case_id.startswith("MP-CART"):
-                return "cart"
-            elif case_id.startswith("MP-ORDER"):
-                return "order"
-            elif case_id.startswith("MP-PRODUCT"):
-                return "product"
-            else:
-                return "public"  # 默认为公共模块
+        if isinstance(case, TestCase):
+            return case.module_type
+        return identify_module_type(case.get("接口地址", ""), case.get("用例编号", ""))
 
-    def execute_test_case(self, case: Dict[str, Any]):
+    def execute_test_case(self, case: Mapping[str, Any]):
         """
         执行单个测试用例
         
         Args:
-            case (Dict[str, Any]): 测试用例
+            case (Mapping[str, Any]): 测试用例（TestCase 或以列名为键的字典）
         """
-        case_id = case.get("用例编号", "未知用例")
-        case_title = case.get("用例标题", "未知标题")
-        module_type = self.identify_module_type(case)
+        import allure
+        
+        case = TestCase.from_mapping(case)
+        case_id = case.case_id or "未知用例"
+        case_title = case.title or "未知标题"
+        module_type = case.module_type
         
         logger.info(f"开始执行测试用例: {case_id} - {case_title} (模块: {module_type})")
         
@@ -106,56 +200,49 @@ class TestExecutor:
         allure.dynamic.story("接口测试")
         allure.dynamic.description(f"模块类型: {module_type}")
         
-        # 根据模块类型分发到相应处理器
-        if module_type == "auth":
-            self._execute_auth_case(case)
-        elif module_type == "cart":
-            self._execute_cart_case(case)
-        elif module_type == "order":
-            self._execute_order_case(case)
-        elif module_type == "product":
-            self._execute_product_case(case)
-        else:
-            self._execute_public_case(case)
+        # 根据模块类型分发到相应处理器，用例失败时按报告级别补充请求详情
+        reporter = self.request_handler.reporter
+        reporter.begin_case()
+        try:
+            if module_type == "auth":
+                self._execute_auth_case(case)
+            elif module_type == "cart":
+                self._execute_cart_case(case)
+            elif module_type == "order":
+                self._execute_order_case(case)
+            elif module_type == "product":
+                self._execute_product_case(case)
+            else:
+                self._execute_public_case(case)
+        except BaseException:
+            reporter.report_failure()
+            raise
             
         logger.info(f"测试用例执行完成: {case_id} - {case_title}")
 
-    def _execute_auth_case(self, case: Dict[str, Any]):
+    def _execute_auth_case(self, case: TestCase):
         """
         执行认证模块测试用例
         
         Args:
-            case (Dict[str, Any]): 认证模块测试用例
+            case (TestCase): 认证模块测试用例
         """
-        logger.info(f"[{case.get('用例编号', '未知')}] 执行认证模块用例")
+        import allure
         
-        # 提取用例字段
-        case_id = case.get("用例编号", "未知")
-        method = case.get("请求方式", "GET").upper()
-        url = case.get("接口地址", "")
-        headers = case.get("请求头", {})
-        params_input = case.get("参数输入", "")
-        expected_result = case.get("期望返回结果", "")
+        case_id = case.case_id or "未知"
+        logger.info(f"[{case_id}] 执行认证模块用例")
         
-        # 解析参数
-        params = self._parse_params(params_input, headers)
-        
-        # 发送请求
-        response = self.request_handler.send_request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params
-        )
+        # 发送请求（请求头、参数和请求体编码方式已在加载时确定）
+        response = self.request_handler.send_case(case)
         
         # 解析期望状态码
-        expected_status = self._extract_expected_status(case_id, expected_result)
+        expected_status = self._extract_expected_status(case_id, case.expected_result)
         
         # 断言状态码
         assert_response_status(response, expected_status)
         
         # 特殊处理：登录成功后保存token
-        if "login" in url.lower() and response.status_code == 200:
+        if "login" in case.url.lower() and response.status_code == 200:
             try:
                 response_json = response.json()
                 token = self.request_handler.extract_json_field(response_json, "$.data.token")
@@ -168,14 +255,14 @@ class TestExecutor:
             except Exception as e:
                 logger.warning(f"[{case_id}] 保存Token时出错: {e}")
 
-    def _execute_cart_case(self, case: Dict[str, Any]):
+    def _execute_cart_case(self, case: TestCase):
         """
         执行购物车模块测试用例
         
         Args:
-            case (Dict[str, Any]): 购物车模块测试用例
+            case (TestCase): 购物车模块测试用例
         """
-        logger.info(f"[{case.get('用例编号', '未知')}] 执行购物车模块用例")
+        logger.info(f"[{case.case_id or '未知'}] 执行购物车模块用例")
         
         # 如果有保存的token，则设置到请求处理器中
         if "auth" in self.token_storage:
@@ -183,14 +270,14 @@ class TestExecutor:
         
         self._execute_standard_case(case)
 
-    def _execute_order_case(self, case: Dict[str, Any]):
+    def _execute_order_case(self, case: TestCase):
         """
         执行订单模块测试用例
         
         Args:
-            case (Dict[str, Any]): 订单模块测试用例
+            case (TestCase): 订单模块测试用例
         """
-        logger.info(f"[{case.get('用例编号', '未知')}] 执行订单模块用例")
+        logger.info(f"[{case.case_id or '未知'}] 执行订单模块用例")
         
         # 如果有保存的token，则设置到请求处理器中
         if "auth" in self.token_storage:
@@ -198,53 +285,40 @@ class TestExecutor:
         
         self._execute_standard_case(case)
 
-    def _execute_product_case(self, case: Dict[str, Any]):
+    def _execute_product_case(self, case: TestCase):
         """
         执行商品模块测试用例
         
         Args:
-            case (Dict[str, Any]): 商品模块测试用例
+            case (TestCase): 商品模块测试用例
         """
-        logger.info(f"[{case.get('用例编号', '未知')}] 执行商品模块用例")
+        logger.info(f"[{case.case_id or '未知'}] 执行商品模块用例")
         self._execute_standard_case(case)
 
-    def _execute_public_case(self, case: Dict[str, Any]):
+    def _execute_public_case(self, case: TestCase):
         """
         执行公共模块测试用例
         
         Args:
-            case (Dict[str, Any]): 公共模块测试用例
+            case (TestCase): 公共模块测试用例
         """
-        logger.info(f"[{case.get('用例编号', '未知')}] 执行公共模块用例")
+        logger.info(f"[{case.case_id or '未知'}] 执行公共模块用例")
         self._execute_standard_case(case)
 
-    def _execute_standard_case(self, case):
+    def _execute_standard_case(self, case: TestCase):
         """
         执行标准测试用例（通用处理逻辑）
         
         Args:
-            case (Dict[str, Any]): 测试用例
-        """
-        case_id = case.get("用例编号", "未知")
-        method = case.get("请求方式", "GET").upper()
-        url = case.get("接口地址", "")
-        headers = self._parse_headers(case.get("请求头", {}))
-        params_input = case.get("参数输入", "")
-        expected_result = case.get("期望返回结果", "")
-        
-        # 解析参数
-        params = self._parse_params(params_input, headers)
-        
-        # 发送请求
-        response = self.request_handler.send_request(
-            method=case['请求方式'],
-            url=case['接口地址'],
-            headers=headers,
-            params=params
-        )
+            case (TestCase): 测试用例
+        """
+        case_id = case.case_id or "未知"
+        
+        # 发送请求（请求头、参数和请求体编码方式已在加载时确定）
+        response = self.request_handler.send_case(case)
         
         # 解析期望状态码
-        expected_status_code = self._extract_expected_status(case_id, expected_result)
+        expected_status_code = self._extract_expected_status(case_id, case.expected_result)
         
         # 使用断言工具检查响应状态码
         assert_response_status(response, expected_status_code)
@@ -253,6 +327,7 @@ class TestExecutor:
         try:
             response_json = response.json()
         except ValueError:
+            import pytest
             pytest.fail("响应内容不是有效的JSON格式")
 
     def _parse_headers(self, headers_input) -> Dict[str, str]:
@@ -265,54 +340,20 @@ class TestExecutor:
         Returns:
             Dict[str, str]: 解析后的请求头字典
         """
-        if isinstance(headers_input, dict):
-            return headers_input
-        elif isinstance(headers_input, str) and headers_input.strip():
-            headers = {}
-            # 分割多个请求头
-            for header in headers_input.split("; "):
-                if ": " in header:
-                    key, value = header.split(": ", 1)
-                    headers[key] = value
-            return headers
-        else:
-            return {}
+        return parse_headers(headers_input)
 
-    def _parse_params(self, params_input, headers: Dict[str, str]) -> Any:
+    def _parse_params(self, params_input, headers: Mapping[str, str]) -> Any:
         """
         解析参数输入
         
         Args:
             params_input: 参数输入
-            headers (Dict[str, str]): 请求头
+            headers (Mapping[str, str]): 请求头
             
         Returns:
             Any: 解析后的参数
         """
-        if not params_input:
-            return {}
-            
-        content_type = headers.get("Content-Type", "")
-        
-        try:
-            # 如果是JSON格式的字符串，尝试解析为JSON对象
-            if isinstance(params_input, str) and params_input.strip().startswith('{'):
-                params_dict = json.loads(params_input)
-                # 如果Content-Type是application/json，则直接返回解析后的对象
-                if "application/json" in content_type:
-                    return params_dict
-                # 如果Content-Type是application/x-www-form-urlencoded，则需要转换为表单格式
-                elif "application/x-www-form-urlencoded" in content_type:
-                    return params_dict
-                else:
-                    return params_dict
-            else:
-                # 其他情况直接返回原值
-                return params_input
-        except json.JSONDecodeError:
-            # JSON解析失败，返回原值
-            logger.warning(f"参数JSON解析失败: {params_input}")
-            return params_input
+        return parse_params_input(params_input)
 
     import re
 
@@ -352,30 +393,289 @@ class TestExecutor:
             logger.info(f"[{case_id}] 未找到明确状态码，使用默认值 200")
             return 200
 
-    def run_all_tests(self):
+    def run_all_tests(self) -> Dict[str, Any]:
         """
         执行所有测试用例
+        
+        Returns:
+            Dict[str, Any]: 执行汇总 {"total", "passed", "failed", "errors", "elapsed_s", "resilience", "backends"}，
+                errors 为每次失败执行的 (用例编号, 错误信息) 列表，用例编号重复时各自记录，
+                resilience 为重试次数和各主机熔断器的打开次数、拒绝请求数，
+                backends 为启用负载均衡时各后端实例的请求数、错误数和耗时分布
         """
-        if not self.test_cases:
-            self.load_test_cases()
-            
-        logger.info(f"开始执行全部 {len(self.test_cases)} 条测试用例")
+        if self.test_cases:
+            logger.info(f"开始执行全部 {len(self.test_cases)} 条测试用例")
+        else:
+            logger.info("开始以流式方式读取并执行测试用例")
+        
+        import allure
         
-        for i, case in enumerate(self.test_cases):
+        total = 0
+        errors: List[Tuple[str, str]] = []
+        start = time.perf_counter()
+        for i, case in enumerate(self.iter_test_cases()):
+            total += 1
             case_id = case.get("用例编号", f"用例{i+1}")
             with allure.step(f"执行用例: {case_id}"):
                 try:
                     self.execute_test_case(case)
                 except Exception as e:
+                    errors.append((case_id, str(e)))
                     logger.error(f"执行用例 {case_id} 时发生错误: {str(e)}")
                     # 继续执行下一个用例，不中断整个测试流程
                     continue
-                    
-        logger.info("所有测试用例执行完成")
+        
+        summary = {
+            "total": total,
+            "passed": total - len(errors),
+            "failed": len(errors),
+            "errors": errors,
+            "elapsed_s": round(time.perf_counter() - start, 3),
+            "resilience": self.request_handler.resilience_stats(),
+            "backends": self.request_handler.backend_stats(),
+        }
+        trips = sum(breaker["trips"] for breaker in summary["resilience"]["circuit_breakers"].values())
+        logger.info(f"所有测试用例执行完成: 共 {total} 条，通过 {summary['passed']} 条，失败 {summary['failed']} 条，"
+                    f"重试 {summary['resilience']['retries']} 次，熔断 {trips} 次")
+        return summary
+
+    async def run_all_tests_async(self, concurrency: int = 10) -> Dict[str, Any]:
+        """
+        以异步并发方式执行所有测试用例
+        
+        认证用例会保存并设置token，先按顺序执行；其余用例相互独立，
+        最多 concurrency 条同时在途，连接池大小与并发数一致
+        
+        Args:
+            concurrency (int): 最大并发用例数
+            
+        Returns:
+            Dict[str, Any]: 执行汇总 {"total", "passed", "failed", "errors", "elapsed_s"}，
+                errors 为每次失败执行的 (用例编号, 错误信息) 列表，用例编号重复时各自记录
+        """
+        from core.async_request_handler import AsyncRequestHandler
+        from core.body_limits import default_body_policy
+        from core.load_balancer import default_load_balancer
+        
+        cases = [TestCase.from_mapping(case) for case in self.iter_test_cases()]
+        auth_cases = [case for case in cases if case.module_type == "auth"]
+        other_cases = [case for case in cases if case.module_type != "auth"]
+        logger.info(f"开始并发执行全部 {len(cases)} 条测试用例（并发数: {concurrency}）")
+        
+        errors: List[Tuple[str, str]] = []
+        start = time.perf_counter()
+        handler = AsyncRequestHandler(base_url=base_url, max_connections=concurrency,
+                                      body_policy=default_body_policy(), load_balancer=default_load_balancer())
+        if "auth" in self.token_storage:
+            handler.set_token(self.token_storage["auth"])
+        try:
+            for i, case in enumerate(auth_cases):
+                await self._run_case_async(handler, case, case.case_id or f"认证用例{i+1}", errors)
+            
+            semaphore = asyncio.Semaphore(concurrency)
+            
+            async def run_limited(case: TestCase, case_id: str):
+                async with semaphore:
+                    await self._run_case_async(handler, case, case_id, errors)
+            
+            await asyncio.gather(*(run_limited(case, case.case_id or f"用例{i+1}")
+                                   for i, case in enumerate(other_cases)))
+        finally:
+            await handler.close()
+        
+        summary = {
+            "total": len(cases),
+            "passed": len(cases) - len(errors),
+            "failed": len(errors),
+            "errors": errors,
+            "elapsed_s": round(time.perf_counter() - start, 3),
+        }
+        logger.info(f"所有测试用例并发执行完成: 共 {summary['total']} 条，通过 {summary['passed']} 条，"
+                    f"失败 {summary['failed']} 条，耗时 {summary['elapsed_s']}s")
+        return summary
+
+    def run_load(self, rate: float, duration: float, weights: Optional[Mapping[str, float]] = None,
+                 max_in_flight: int = 200, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        以固定到达速率执行压测，参数和返回值见 run_load_async
+        """
+        return asyncio.run(self.run_load_async(rate, duration, weights, max_in_flight, seed))
+
+    async def run_load_async(self, rate: float, duration: float, weights: Optional[Mapping[str, float]] = None,
+                             max_in_flight: int = 200, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        以固定到达速率（开环）发送用例的加权组合，持续 duration 秒
+        
+        请求按计划时间发出，不等待之前的请求完成；耗时从计划发送时间算起。
+        没有token时先按顺序执行一次认证用例获取token，认证用例默认不参与压测。
+        启用了用例文件监视（watch_test_cases）时，压测过程中应用的用例增量会在下一个请求前生效，
+        新增用例在未指定 weights 时加入组合，删除的用例不再发送
+        
+        Args:
+            rate (float): 目标速率（请求/秒）
+            duration (float): 持续时间（秒）
+            weights (Optional[Mapping[str, float]]): 用例编号到权重的映射，只有列出的用例参与压测；
+                默认除认证用例外的全部用例权重相同
+            max_in_flight (int): 最大在途请求数（即连接池大小），达到上限时本次请求被丢弃并计入 dropped
+            seed (Optional[int]): 随机选择用例的种子，便于复现同样的请求序列
+            
+        Returns:
+            Dict[str, Any]: 压测报告，包括实际速率、错误率以及各用例的请求数、错误率和耗时百分位，
+                见 LoadStats.report
+        """
+        from core.async_request_handler import AsyncRequestHandler
+        from core.body_limits import default_body_policy
+        from core.load_balancer import default_load_balancer
+        from core.load_mode import LoadStats
+        
+        if rate <= 0 or duration <= 0:
+            raise ValueError("压测速率和持续时间必须大于0")
+        source = self.test_cases
+        cases = [TestCase.from_mapping(case) for case in self.iter_test_cases()]
+        if weights is not None:
+            unknown = set(weights).difference(case.case_id for case in cases)
+            if unknown:
+                raise ValueError(f"权重中的用例编号不存在: {', '.join(sorted(unknown))}")
+        mix = self._load_mix(cases, weights)
+        if not mix:
+            raise ValueError("没有可用于压测的用例")
+        
+        handler = AsyncRequestHandler(base_url=base_url, max_connections=max_in_flight, metrics=None,
+                                      body_policy=default_body_policy(), load_balancer=default_load_balancer())
+        stats = LoadStats(rate, duration)
+        try:
+            if "auth" not in self.token_storage:
+                errors: List[Tuple[str, str]] = []
+                for i, case in enumerate(case for case in cases if case.module_type == "auth"):
+                    await self._run_case_async(handler, case, case.case_id or f"认证用例{i+1}", errors)
+            if "auth" in self.token_storage:
+                handler.set_token(self.token_storage["auth"])
+            
+            # 组合中的每项为 (用例, 期望状态码)，期望状态码随用例一起替换，不会在用例更新后错配
+            population: List[Tuple[TestCase, int]] = []
+            cum_weights: List[float] = []
+            
+            def use_mix(new_mix: List[Tuple[TestCase, float]]):
+                nonlocal population, cum_weights
+                population = [(case, self._extract_expected_status(case.case_id, case.expected_result))
+                              for case, _ in new_mix]
+                cum_weights = list(itertools.accumulate(weight for _, weight in new_mix))
+            
+            use_mix(mix)
+            rng = random.Random(seed)
+            in_flight = 0
+            
+            async def fire(case: TestCase, expected_status: int, scheduled: float):
+                nonlocal in_flight
+                try:
+                    response = await handler.send_case(case)
+                except Exception as e:
+                    stats.record(case.case_id, type(e).__name__, loop.time() - scheduled, True)
+                else:
+                    stats.record(case.case_id, response.status_code, loop.time() - scheduled,
+                                 response.status_code != expected_status)
+                finally:
+                    in_flight -= 1
+            
+            logger.info(f"开始压测: {rate} 请求/秒，持续 {duration}s，{len(mix)} 条用例，最大在途 {max_in_flight}")
+            loop = asyncio.get_running_loop()
+            tasks = set()
+            start = loop.time()
+            stats.started = time.monotonic()
+            total = int(rate * duration)
+            for i in range(total):
+                scheduled = start + i / rate
+                delay = scheduled - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if self.test_cases is not source:
+                    # 用例文件监视器在压测过程中应用了增量，按新的用例列表重建组合
+                    source = self.test_cases
+                    new_mix = self._load_mix([TestCase.from_mapping(case) for case in source], weights)
+                    if new_mix:
+                        use_mix(new_mix)
+                        logger.info(f"用例已更新，压测组合现有 {len(new_mix)} 条用例")
+                    else:
+                        logger.warning("用例更新后没有可用于压测的用例，继续使用原来的组合")
+                case, expected_status = rng.choices(population, cum_weights=cum_weights)[0]
+                if in_flight >= max_in_flight:
+                    stats.record_dropped(case.case_id)
+                    continue
+                in_flight += 1
+                stats.max_in_flight = max(stats.max_in_flight, in_flight)
+                task = asyncio.create_task(fire(case, expected_status, scheduled))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            stats.finished = time.monotonic()
+        finally:
+            await handler.close()
+        
+        report = stats.report()
+        logger.info(f"压测完成: 实际 {report['achieved_rps']} 请求/秒，完成 {report['sent']} 个，"
+                    f"丢弃 {report['dropped']} 个，错误率 {report['error_rate']:.2%}")
+        return report
+
+    @staticmethod
+    def _load_mix(cases: List[TestCase],
+                  weights: Optional[Mapping[str, float]]) -> List[Tuple[TestCase, float]]:
+        """
+        按权重选出参与压测的用例
+        
+        Args:
+            cases (List[TestCase]): 全部用例
+            weights (Optional[Mapping[str, float]]): 用例编号到权重的映射，None 时除认证用例外权重相同
+            
+        Returns:
+            List[Tuple[TestCase, float]]: (用例, 权重) 列表，不包含不支持的请求方法
+        """
+        if weights is None:
+            return [(case, 1.0) for case in cases if case.module_type != "auth" and case.body_encoding is not None]
+        return [(case, weights[case.case_id]) for case in cases
+                if weights.get(case.case_id, 0) > 0 and case.body_encoding is not None]
+
+    async def _run_case_async(self, handler: "AsyncRequestHandler", case: TestCase, case_id: str,
+                              errors: List[Tuple[str, str]]):
+        """
+        异步执行单个测试用例，失败时记录错误信息而不中断其他用例
+        
+        Args:
+            handler (AsyncRequestHandler): 异步请求处理器
+            case (TestCase): 测试用例
+            case_id (str): 用于汇总的用例编号
+            errors (List[Tuple[str, str]]): 每次失败执行的 (用例编号, 错误信息)
+        """
+        try:
+            response = await handler.send_case(case)
+            
+            expected_status = self._extract_expected_status(case_id, case.expected_result)
+            assert_response_status(response, expected_status)
+            
+            if case.module_type == "auth":
+                # 登录成功后保存token，供后续并发用例使用
+                if "login" in case.url.lower() and response.status_code == 200:
+                    token = handler.extract_json_field(response.json(), "$.data.token")
+                    if token:
+                        self.token_storage["auth"] = token
+                        handler.set_token(token)
+                        logger.info(f"[{case_id}] Token已保存并设置")
+            else:
+                try:
+                    response.json()
+                except ValueError:
+                    raise AssertionError("响应内容不是有效的JSON格式")
+        except Exception as e:
+            errors.append((case_id, str(e)))
+            logger.error(f"执行用例 {case_id} 时发生错误: {str(e)}")
         
     def close(self):
         """
         清理资源
         """
-        self.request_handler.close()
+        if self.case_watcher is not None:
+            self.case_watcher.stop()
+            self.case_watcher = None
+        if self._request_handler is not None:
+            self._request_handler.close()
         logger.info("测试执行器资源已清理")
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+请求阶段计时
+在 urllib3 连接层记录每个请求各阶段的耗时：DNS解析、TCP连接、TLS握手、
+发送请求、首字节时间（TTFB）和读取响应体，用于判断慢请求的耗时花在哪里。
+计时结果通过线程局部变量交给适配器，再挂到响应对象上
+"""
+
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import NewConnectionError
+
+PHASES = ("dns", "connect", "tls", "write", "ttfb", "body")
+
+_local = threading.local()
+
+
+class RequestPhases:
+    """一次请求的各阶段耗时（秒），复用已有连接时DNS、连接和TLS阶段为0"""
+
+    __slots__ = PHASES + ("reused",)
+
+    def __init__(self):
+        for phase in PHASES:
+            setattr(self, phase, 0.0)
+        self.reused = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        转换为以毫秒为单位的字典
+
+        Returns:
+            Dict[str, Any]: 各阶段耗时（毫秒）和是否复用连接
+        """
+        result: Dict[str, Any] = {phase: round(getattr(self, phase) * 1000, 3) for phase in PHASES}
+        result["reused"] = self.reused
+        return result
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{phase}={getattr(self, phase) * 1000:.1f}ms" for phase in PHASES)
+        return f"RequestPhases({phases}, reused={self.reused})"
+
+
+def start_trace() -> RequestPhases:
+    """
+    开始记录当前线程的下一个请求
+
+    Returns:
+        RequestPhases: 本次请求的计时记录
+    """
+    phases = RequestPhases()
+    _local.phases = phases
+    return phases
+
+
+def finish_trace():
+    """结束当前线程的请求计时"""
+    _local.phases = None
+
+
+def current_trace() -> Optional[RequestPhases]:
+    """当前线程正在记录的请求计时，没有时返回None"""
+    return getattr(_local, "phases", None)
+
+
+class _TracedConnectionMixin:
+    """记录DNS、连接、TLS、发送和首字节耗时的连接混入类"""
+
+    def _new_conn(self):
+        phases = current_trace()
+        if phases is None:
+            return super()._new_conn()
+        phases.reused = False
+
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # 解析失败时交给 urllib3 抛出统一的异常
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        phases.dns += resolved - start
+
+        # 逐个尝试解析到的地址（与 socket.create_connection 的行为一致），只计一次DNS解析
+        dns_host = self._dns_host
+        error: Optional[Exception] = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except NewConnectionError as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = dns_host
+            phases.connect += time.perf_counter() - resolved
+
+    def connect(self):
+        phases = current_trace()
+        if phases is None:
+            return super().connect()
+        start = time.perf_counter()
+        dns_connect = phases.dns + phases.connect
+        try:
+            return super().connect()
+        finally:
+            elapsed = time.perf_counter() - start
+            if isinstance(self, HTTPSConnection):
+                # connect 中除DNS解析和TCP连接以外的耗时即TLS握手
+                phases.tls += max(elapsed - (phases.dns + phases.connect - dns_connect), 0.0)
+            self._trace_connect_elapsed = getattr(self, "_trace_connect_elapsed", 0.0) + elapsed
+
+    def request(self, *args, **kwargs):
+        phases = current_trace()
+        if phases is None:
+            return super().request(*args, **kwargs)
+        self._trace_connect_elapsed = 0.0
+        start = time.perf_counter()
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            # 纯HTTP连接在首次发送时才建立连接，扣除其中的建连耗时
+            phases.write += max(time.perf_counter() - start - self._trace_connect_elapsed, 0.0)
+            self._trace_connect_elapsed = 0.0
+
+    def getresponse(self, *args, **kwargs):
+        phases = current_trace()
+        if phases is None:
+            return super().getresponse(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            phases.ttfb += time.perf_counter() - start
+
+
+class TracedHTTPConnection(_TracedConnectionMixin, HTTPConnection):
+    """带阶段计时的HTTP连接"""
+
+
+class TracedHTTPSConnection(_TracedConnectionMixin, HTTPSConnection):
+    """带阶段计时的HTTPS连接"""
@@ -231,6 +231,52 @@ def run_ui_tests_ci():
         return False
 
 
+def run_load_test(argv):
+    """
+    以固定到达速率对工作簿用例执行压测，输出实际速率、各用例的耗时百分位和错误率
+    
+    用法: python run.py load --rate 50 --duration 60 [--sheet Sheet2] [--weights CART-01=3,CART-02=1]
+    
+    Args:
+        argv (list): load 之后的命令行参数
+        
+    Returns:
+        bool: 压测是否完成且没有错误和丢弃的请求
+    """
+    import argparse
+    from core.load_mode import format_load_report, parse_weights, write_load_report
+    from core.test_executor import TestExecutor
+    
+    parser = argparse.ArgumentParser(prog="python run.py load", description="固定到达速率压测")
+    parser.add_argument("--excel", default=os.path.join("data", "mall测试用例.xlsx"), help="用例文件路径")
+    parser.add_argument("--sheet", default="Sheet2", help="sheet名称")
+    parser.add_argument("--rate", type=float, required=True, help="目标速率（请求/秒）")
+    parser.add_argument("--duration", type=float, default=60, help="持续时间（秒）")
+    parser.add_argument("--weights", default="", help="用例权重，如 CART-01=3,CART-02=1，默认除认证用例外权重相同")
+    parser.add_argument("--max-in-flight", type=int, default=200, help="最大在途请求数，超过时丢弃请求")
+    parser.add_argument("--seed", type=int, default=None, help="随机选择用例的种子")
+    parser.add_argument("--report", default=os.path.join("reports", "load.json"), help="JSON报告路径，为空时不写入")
+    args = parser.parse_args(argv)
+    
+    print(f"开始压测: {args.rate} 请求/秒，持续 {args.duration}s...")
+    executor = TestExecutor(args.excel, args.sheet)
+    try:
+        report = executor.run_load(args.rate, args.duration, parse_weights(args.weights) or None,
+                                   max_in_flight=args.max_in_flight, seed=args.seed)
+    except Exception as e:
+        print(f"执行压测时出错: {e}")
+        return False
+    finally:
+        executor.close()
+    
+    for line in format_load_report(report):
+        print(line)
+    if args.report:
+        write_load_report(args.report, report)
+        print(f"压测报告已写入 {args.report}")
+    return report["errors"] == 0 and report["dropped"] == 0
+
+
 def show_menu_with_timeout():
     """
     显示菜单选项，带有3秒超时功能
@@ -354,6 +400,12 @@ def main():
             else:
                 print("\n某些测试执行失败！")
                 sys.exit(1)
+        elif sys.argv[1] == "load":
+            # 压测模式 - 用法: python run.py load --rate 50 --duration 60
+            success = run_load_test(sys.argv[2:])
+            if not success:
+                print("\n压测未完成，或存在错误、被丢弃的请求！")
+                sys.exit(1)
         elif sys.argv[1] == "ci":
             # CI/CD模式 - 运行所有测试（包括无头模式的UI测试）
             print("开始在CI/CD环境中执行所有测试...")
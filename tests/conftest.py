@@ -3,7 +3,6 @@
 包含测试会话和函数级别的fixtures
 """
 import pytest
-import requests
 from utils.token_manager import TokenManager
 from utils.excel_reader import read_excel_test_cases
 
@@ -12,6 +11,34 @@ from utils.excel_reader import read_excel_test_cases
 token_manager = TokenManager()
 
 
+def pytest_terminal_summary(terminalreporter):
+    """
+    测试结束时输出各接口的耗时统计（启用负载均衡时另有各后端实例的统计），并写入JSON报告用于趋势跟踪
+    
+    Args:
+        terminalreporter: pytest终端报告插件
+    """
+    from core.load_balancer import default_load_balancer
+    from core.metrics import latency_recorder
+    from config.config import latency_report_path
+    
+    if not len(latency_recorder):
+        return
+    report = latency_recorder.report()
+    terminalreporter.section("接口耗时统计")
+    for line in latency_recorder.format_report(report):
+        terminalreporter.write_line(line)
+    balancer = default_load_balancer()
+    if balancer is not None:
+        report["backends"] = balancer.report()
+        terminalreporter.section("后端实例统计")
+        for line in balancer.format_report():
+            terminalreporter.write_line(line)
+    if latency_report_path:
+        latency_recorder.write_json(latency_report_path, report)
+        terminalreporter.write_line(f"耗时报告已写入 {latency_report_path}")
+
+
 @pytest.fixture(scope="session")
 def global_token_manager():
     """
@@ -32,6 +59,8 @@ def http_session():
     Yields:
         requests.Session: HTTP会话实例
     """
+    import requests  # 仅在使用该fixture时导入
+    
     with requests.Session() as session:
         yield session
 
@@ -4,7 +4,6 @@ import logging
 import sys
 import os
 from core.test_executor import TestExecutor
-from utils.excel_reader import read_excel_test_cases
 
 # 配置日志输出到控制台
 logging.basicConfig(
@@ -20,18 +19,29 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 EXCEL_PATH = os.path.join(PROJECT_ROOT, "data", "mall测试用例.xlsx")
 SHEET_NAME = "Sheet1"
 
-# 创建全局测试执行器实例
-test_executor = TestExecutor(EXCEL_PATH, SHEET_NAME)
-
-# 读取测试用例
-try:
-    test_executor.load_test_cases()
-    test_cases = test_executor.test_cases
-    logger.info(f"成功读取到 {len(test_cases)} 条测试用例")
-    for i, case in enumerate(test_cases):
-        logger.info(f"用例 {i+1}: {case.get('用例编号', '未知')} - {case.get('用例标题', '无标题')}")
-except Exception as e:
-    pytest.fail(f"读取测试用例失败：{str(e)}")
+@pytest.fixture(scope="module")
+def login_executor():
+    """
+    登录测试执行器fixture
+    在首次使用时才创建执行器并读取用例，导入本模块（测试收集阶段）不会加载工作簿
+    
+    Yields:
+        TestExecutor: 已加载登录用例的测试执行器
+    """
+    test_executor = TestExecutor(EXCEL_PATH, SHEET_NAME)
+    
+    # 读取测试用例
+    try:
+        test_executor.load_test_cases()
+        test_cases = test_executor.test_cases
+        logger.info(f"成功读取到 {len(test_cases)} 条测试用例")
+        for i, case in enumerate(test_cases):
+            logger.info(f"用例 {i+1}: {case.get('用例编号', '未知')} - {case.get('用例标题', '无标题')}")
+    except Exception as e:
+        pytest.fail(f"读取测试用例失败：{str(e)}")
+    
+    yield test_executor
+    test_executor.close()
 
 
 @allure.feature("认证模块")
@@ -48,9 +58,14 @@ class TestLogin:
         logger.info("登录测试执行完成")
     
     @allure.title("执行所有登录相关测试用例")
-    def test_all_login_cases(self):
+    def test_all_login_cases(self, login_executor):
         """执行所有登录相关的测试用例"""
-        login_cases = [case for case in test_cases if self._is_login_case(case)]
+        # 通过用例索引筛选：URL包含login、编号以MP-LOGIN开头、或接口模块为登录/认证
+        login_cases = login_executor.case_index.select_any(
+            path_keyword="login",
+            id_prefix="MP-LOGIN",
+            module_keyword=("登录", "认证")
+        )
         
         if not login_cases:
             pytest.skip("未找到登录相关的测试用例")
@@ -61,40 +76,12 @@ class TestLogin:
             case_id = case.get("用例编号", f"用例{i+1}")
             with allure.step(f"执行用例: {case_id}"):
                 try:
-                    test_executor.execute_test_case(case)
+                    login_executor.execute_test_case(case)
                 except Exception as e:
                     logger.error(f"执行用例 {case_id} 时发生错误: {str(e)}")
                     raise
-    
-    def _is_login_case(self, case: dict) -> bool:
-        """
-        判断是否为登录相关测试用例
-        
-        Args:
-            case (dict): 测试用例
-            
-        Returns:
-            bool: 是否为登录用例
-        """
-        # 根据URL判断
-        url = case.get("接口地址", "")
-        if "login" in url:
-            return True
-            
-        # 根据用例编号判断
-        case_id = case.get("用例编号", "")
-        if case_id.startswith("MP-LOGIN"):
-            return True
-            
-        # 根据模块类型判断
-        module = case.get("接口模块", "")
-        if "登录" in module or "认证" in module:
-            return True
-            
-        return False
 
 
-def test_cleanup():
-    """测试结束后的清理工作"""
-    logger.info("执行测试清理工作")
-    test_executor.close()
\ No newline at end of file
+def test_cleanup(login_executor):
+    """测试结束后的清理工作（执行器由 login_executor fixture 在模块结束时关闭）"""
+    logger.info("执行测试清理工作")
\ No newline at end of file
@@ -7,6 +7,7 @@ import json
 import re
 from core.test_executor import TestExecutor
 from utils.token_manager import TokenManager
+from utils.case_registry import get_case_index, get_test_cases
 
 # 配置日志输出到控制台
 logging.basicConfig(
@@ -22,33 +23,6 @@ EXCEL_PATH = os.path.join(PROJECT_ROOT, "data", "mall测试用例.xlsx")
 SHEET_NAME_LOGIN = "Sheet1"  # 登录用例所在的Sheet
 SHEET_NAME_CART = "Sheet2"   # 购物车用例所在的Sheet
 
-def parse_headers(header_str):
-    """解析请求头字符串为字典格式"""
-    if not header_str:
-        return {}
-    
-    headers = {}
-    # 处理请求头字符串，格式如 "Content-Type: application/json; Authorization: Bearer xxx"
-    if isinstance(header_str, str):
-        pairs = header_str.split(';')
-        for pair in pairs:
-            if ':' in pair:
-                key, value = pair.split(':', 1)
-                headers[key.strip()] = value.strip()
-    elif isinstance(header_str, dict):
-        headers = header_str
-    return headers
-
-def format_headers(headers_dict):
-    """将字典格式的请求头转换为字符串格式"""
-    if not headers_dict:
-        return ""
-    
-    header_items = []
-    for key, value in headers_dict.items():
-        header_items.append(f"{key}: {value}")
-    return "; ".join(header_items)
-
 def clear_cart_data(auth_token):
     """清理购物车数据"""
     try:
@@ -138,10 +112,11 @@ def replace_cart_id_in_params(params_input, cart_id):
                 params_dict['id'] = cart_id
                 return json.dumps(params_dict, ensure_ascii=False)
             return params_input
-        # 如果参数是字典
+        # 如果参数是字典（用例中已解析好的参数为共享数据，复制后再修改）
         elif isinstance(params_input, dict) and 'id' in params_input:
-            params_input['id'] = cart_id
-            return params_input
+            params_dict = dict(params_input)
+            params_dict['id'] = cart_id
+            return params_dict
         else:
             # 尝试在字符串参数中替换id值（如"id=15&quantity=2"格式）
             if isinstance(params_input, str):
@@ -184,30 +159,14 @@ def auth_token(test_executors, token_manager):
     executor_login, _ = test_executors
     
     # 执行登录操作，获取token
-    login_case = next((case for case in executor_login.test_cases if case.get('用例标题') == '正常登录'), None)
+    login_case = next(iter(executor_login.case_index.find_by_title('正常登录')), None)
     if not login_case:
         pytest.fail("未找到正常登录的测试用例")
     
     with allure.step("执行登录用例，获取token"):
         try:
-            # 手动执行登录逻辑，确保返回响应
-            case_id = login_case.get("用例编号", "未知")
-            method = login_case.get("请求方式", "GET").upper()
-            url = login_case.get("接口地址", "")
-            headers = login_case.get("请求头", {})
-            params_input = login_case.get("参数输入", "")
-            expected_result = login_case.get("期望返回结果", "")
-            
-            # 解析参数
-            params = executor_login._parse_params(params_input, headers)
-            
-            # 发送请求
-            response = executor_login.request_handler.send_request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params
-            )
+            # 手动执行登录逻辑，确保返回响应（请求参数已在加载时预处理）
+            response = executor_login.request_handler.send_case(login_case)
             
             if response:
                 token_data = response.json().get('data', {})
@@ -223,32 +182,25 @@ def auth_token(test_executors, token_manager):
 # 参数化测试数据准备
 def get_cart_test_cases():
     """获取购物车测试用例数据用于参数化"""
-    executor_cart = TestExecutor(EXCEL_PATH, SHEET_NAME_CART)
     try:
-        executor_cart.load_test_cases()
-        return [(case.get("用例编号", f"用例{i+1}"), case) for i, case in enumerate(executor_cart.test_cases)]
+        cart_cases = get_test_cases(EXCEL_PATH, SHEET_NAME_CART)
+        return [(case.get("用例编号", f"用例{i+1}"), case) for i, case in enumerate(cart_cases)]
     except Exception as e:
         pytest.fail(f"读取购物车测试用例失败：{str(e)}")
         return []
-    finally:
-        executor_cart.close()
 
 def get_update_cart_quantity_test_cases():
     """获取与"修改购物车中商品数量"相关的测试用例数据用于参数化"""
-    executor_cart = TestExecutor(EXCEL_PATH, SHEET_NAME_CART)
     try:
-        executor_cart.load_test_cases()
+        cart_index = get_case_index(EXCEL_PATH, SHEET_NAME_CART)
         relevant_cases = [
             (case.get("用例编号", f"用例{i+1}"), case) 
-            for i, case in enumerate(executor_cart.test_cases) 
-            if '修改购物车中商品数量' in case.get('用例标题', '')
+            for i, case in enumerate(cart_index.search_title('修改购物车中商品数量'))
         ]
         return relevant_cases
     except Exception as e:
         pytest.fail(f"读取购物车测试用例失败：{str(e)}")
         return []
-    finally:
-        executor_cart.close()
 
 def _execute_cart_test_case(test_case, auth_token):
     """执行购物车测试用例的公共方法"""
@@ -258,9 +210,8 @@ def _execute_cart_test_case(test_case, auth_token):
     use_invalid_token = '无效Token' in case_title
     skip_id_replacement = 'id不存在' in case_title
     
-    # 解析原有请求头
-    original_headers_str = test_case.get('请求头', '')
-    headers = parse_headers(original_headers_str)
+    # 复制原有请求头（请求头已在加载时解析为字典）
+    headers = dict(test_case.headers)
     
     # 如果标题包含"无效Token"，直接使用请求头中已有的Authorization值
     # 不做任何修改，保持原样
@@ -271,34 +222,28 @@ def _execute_cart_test_case(test_case, auth_token):
         # 如果需要token且不是无效Token测试，则使用正常获取的token
         headers['Authorization'] = auth_token
     
-    # 更新测试用例的请求头
-    test_case_copy = test_case.copy()
-    test_case_copy['请求头'] = format_headers(headers)
-    
-    # 处理参数输入为None的情况
-    if test_case_copy.get('参数输入') is None:
-        test_case_copy['参数输入'] = ''
+    # 需要修改的用例字段，原用例记录保持不变
+    changes = {"headers": headers}
     
     # 如果需要替换购物车ID且不是跳过替换的情况
     if not skip_id_replacement and need_token and not use_invalid_token:
         # 检查是否需要替换ID（通过检查URL或参数中是否包含更新、删除等操作）
-        url = test_case_copy.get('接口地址', '')
-        method = test_case_copy.get('请求方式', '').upper()
+        url = test_case.url
+        method = test_case.method
         
         # 对于更新、删除等操作，获取购物车列表并替换ID
         if any(op in url.lower() for op in ['update', 'delete']) or method in ['PUT', 'DELETE']:
             cart_id = get_cart_list(auth_token)
             if cart_id:
-                # 替换参数中的ID
-                test_case_copy['参数输入'] = replace_cart_id_in_params(test_case_copy['参数输入'], cart_id)
+                # 替换参数中的ID（直接修改已解析的参数，无需重新解析JSON）
+                changes["params"] = replace_cart_id_in_params(test_case.params, cart_id)
                 logger.info(f"已替换参数中的购物车ID为: {cart_id}")
             else:
                 logger.warning("未获取到购物车ID，使用原始参数")
     
-    # 创建临时执行器执行测试用例
+    # 创建临时执行器执行测试用例（用例已在参数化时从注册表获取，无需重新加载）
     executor_cart = TestExecutor(EXCEL_PATH, SHEET_NAME_CART)
-    executor_cart.load_test_cases()
-    executor_cart.execute_test_case(test_case_copy)
+    executor_cart.execute_test_case(test_case.replace(**changes))
     executor_cart.close()
 
 @allure.feature("购物车模块")
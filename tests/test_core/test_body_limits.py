@@ -0,0 +1,150 @@
+"""
+响应体大小限制单元测试
+直接把数据块交给 BodyPolicy.read 读取，不发送真实请求
+"""
+import asyncio
+import hashlib
+
+import pytest
+
+from core.body_limits import BodyPolicy, CapturedBody, ResponseTooLargeError
+from core.response_view import ResponseView
+
+URL = "http://mall.test/product/list"
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class FakeRaw:
+    """只提供 ResponseView 用到的属性的原始响应替身"""
+
+    def __init__(self, status_code=200, encoding="utf-8"):
+        self.status_code = status_code
+        self.encoding = encoding
+
+
+class TestBodyPolicy:
+    """响应体读取策略测试类"""
+
+    def test_keep_full_body(self):
+        body = b'{"code": 200, "data": [' + b"1," * 5000 + b"1]}"
+        captured = BodyPolicy(chunk_size=1024).read(_chunks(body, 1024), URL)
+
+        assert captured.content == body
+        assert captured.size == len(body)
+        assert captured.sha256 == hashlib.sha256(body).hexdigest()
+        assert captured.truncated is False
+        assert captured.describe() == f"共 {len(body)} 字节，sha256={captured.sha256}"
+
+    def test_empty_body(self):
+        captured = BodyPolicy().read([], URL)
+
+        assert captured.content == b""
+        assert captured.size == 0
+        assert captured.sha256 == hashlib.sha256(b"").hexdigest()
+        assert captured.truncated is False
+
+    def test_body_over_limit(self):
+        policy = BodyPolicy(max_body_bytes=1000)
+        with pytest.raises(ResponseTooLargeError, match="超过上限 1000 字节") as exc_info:
+            policy.read(_chunks(b"x" * 1001, 300), URL)
+
+        assert URL in str(exc_info.value)
+
+    def test_body_at_limit(self):
+        captured = BodyPolicy(max_body_bytes=1000).read(_chunks(b"x" * 1000, 300), URL)
+
+        assert captured.size == 1000
+        assert captured.truncated is False
+
+    def test_stops_reading_after_limit(self):
+        consumed = []
+
+        def chunks():
+            for i in range(10):
+                consumed.append(i)
+                yield b"x" * 100
+
+        with pytest.raises(ResponseTooLargeError):
+            BodyPolicy(max_body_bytes=250).read(chunks(), URL)
+        assert consumed == [0, 1, 2]
+
+    def test_preview_only(self):
+        body = bytes(range(256)) * 40
+        policy = BodyPolicy(keep_body=False, preview_bytes=1000)
+        captured = policy.read(_chunks(body, 384), URL)
+
+        assert captured.content == body[:1000]
+        assert captured.size == len(body)
+        assert captured.sha256 == hashlib.sha256(body).hexdigest()
+        assert captured.truncated is True
+        assert captured.describe().startswith(f"仅保留前 1000 字节，共 {len(body)} 字节")
+
+    def test_preview_larger_than_body(self):
+        body = b'{"code": 200}'
+        captured = BodyPolicy(keep_body=False, preview_bytes=1000).read([body], URL)
+
+        assert captured.content == body
+        assert captured.truncated is False
+
+    def test_read_async(self):
+        body = b"y" * 5000
+
+        async def chunks():
+            for chunk in _chunks(body, 700):
+                yield chunk
+
+        policy = BodyPolicy(keep_body=False, preview_bytes=100)
+        captured = asyncio.run(policy.read_async(chunks(), URL))
+
+        assert captured.content == body[:100]
+        assert captured.size == 5000
+        assert captured.sha256 == hashlib.sha256(body).hexdigest()
+
+    def test_check_length_over_limit(self):
+        policy = BodyPolicy(max_body_bytes=1000)
+        with pytest.raises(ResponseTooLargeError, match="响应体 1001 字节超过上限 1000 字节"):
+            policy.check_length({"Content-Length": "1001"}, URL)
+
+    @pytest.mark.parametrize("headers", [
+        {"Content-Length": "1000"},
+        {},
+        {"Content-Length": ""},
+        {"Content-Length": "abc"},
+    ])
+    def test_check_length_passes(self, headers):
+        BodyPolicy(max_body_bytes=1000).check_length(headers, URL)
+
+    def test_check_length_without_limit(self):
+        BodyPolicy().check_length({"Content-Length": str(10 ** 12)}, URL)
+
+
+class TestResponseViewBody:
+    """流式读取响应体的响应视图测试类"""
+
+    def test_json_from_captured_body(self):
+        body = '{"code": 200, "message": "操作成功"}'.encode("utf-8")
+        view = ResponseView(FakeRaw(), BodyPolicy().read([body], URL))
+
+        assert view.json() == {"code": 200, "message": "操作成功"}
+        assert view.text == '{"code": 200, "message": "操作成功"}'
+
+    def test_json_on_truncated_body(self):
+        body = b'{"code": 200, "data": "' + b"z" * 500 + b'"}'
+        captured = BodyPolicy(keep_body=False, preview_bytes=64).read([body], URL)
+        view = ResponseView(FakeRaw(), captured)
+
+        with pytest.raises(ValueError, match="响应体未完整保留") as first:
+            view.json()
+        with pytest.raises(ValueError) as second:
+            view.json()
+        assert second.value is first.value
+        assert view.content == body[:64]
+
+    def test_truncated_flag_from_constructor(self):
+        captured = CapturedBody(b"{", 10, "0" * 64, truncated=True)
+
+        with pytest.raises(ValueError, match="仅保留前 1 字节"):
+            ResponseView(FakeRaw(), captured).json()
@@ -0,0 +1,167 @@
+"""
+负载均衡单元测试
+各分发策略的实例选择和URL改写，以及请求处理器按请求头中的token区分用户（使用本地模拟服务）
+"""
+import asyncio
+
+import pytest
+
+from benchmarks.mock_server import start_mock_server
+from core.async_request_handler import AsyncRequestHandler
+from core.load_balancer import (BALANCE_HASH_USER, BALANCE_LEAST_OUTSTANDING, BALANCE_ROUND_ROBIN,
+                                LoadBalancer)
+from core.request_handler import RequestHandler
+from utils.case_model import TestCase
+
+BACKENDS = ["http://a:8085", "http://b:8085/", "http://c:8085"]
+
+
+def _route_urls(balancer: LoadBalancer, count: int, **kwargs):
+    urls = []
+    for _ in range(count):
+        url, backend = balancer.route("{{portal.mall}}/cart/list", **kwargs)
+        balancer.release(backend, 0.001, True)
+        urls.append(url)
+    return urls
+
+
+class TestLoadBalancer:
+    """负载均衡器测试类"""
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError):
+            LoadBalancer(BACKENDS, strategy="random")
+        with pytest.raises(ValueError):
+            LoadBalancer([])
+
+    def test_rewrites_placeholder_and_aliases(self):
+        balancer = LoadBalancer(["http://a:8085"], aliases=("http://old:8085/",))
+        assert balancer.route("{{portal.mall}}/sso/login")[0] == "http://a:8085/sso/login"
+        assert balancer.route("http://old:8085?x=1")[0] == "http://a:8085?x=1"
+        # 只匹配完整的前缀
+        assert balancer.route("http://old:80850/sso/login") == ("http://old:80850/sso/login", None)
+        assert balancer.route("http://other/sso/login") == ("http://other/sso/login", None)
+
+    def test_round_robin(self):
+        balancer = LoadBalancer(BACKENDS, BALANCE_ROUND_ROBIN)
+        urls = _route_urls(balancer, 6)
+        assert urls == [f"{base.rstrip('/')}/cart/list" for base in BACKENDS] * 2
+        assert [row["requests"] for row in balancer.report()] == [2, 2, 2]
+
+    def test_round_robin_skips_unavailable(self):
+        balancer = LoadBalancer(BACKENDS, BALANCE_ROUND_ROBIN)
+        urls = _route_urls(balancer, 4, unavailable=lambda url: url == "http://b:8085")
+        assert all(not url.startswith("http://b:8085") for url in urls)
+        # 全部不可用时仍按策略选择
+        assert len(_route_urls(balancer, 3, unavailable=lambda url: True)) == 3
+
+    def test_least_outstanding(self):
+        balancer = LoadBalancer(BACKENDS, BALANCE_LEAST_OUTSTANDING)
+        held = [balancer.route("{{portal.mall}}/x")[1] for _ in range(3)]
+        assert sorted(backend.url for backend in held) == ["http://a:8085", "http://b:8085", "http://c:8085"]
+        # 释放 b 后，b 是唯一没有在途请求的实例
+        b = next(backend for backend in held if backend.url == "http://b:8085")
+        balancer.release(b, 0.001, True)
+        assert balancer.route("{{portal.mall}}/x")[1] is b
+        assert [row["outstanding"] for row in balancer.report()] == [1, 1, 1]
+
+    def test_hash_user_is_sticky(self):
+        balancer = LoadBalancer(BACKENDS, BALANCE_HASH_USER)
+        for user in ("token-1", "token-2", "token-3"):
+            urls = set(_route_urls(balancer, 5, user_key=user))
+            assert len(urls) == 1
+        # 没有用户时轮询
+        assert len(set(_route_urls(balancer, 3))) == 3
+
+    def test_hash_user_falls_back_when_unavailable(self):
+        balancer = LoadBalancer(BACKENDS, BALANCE_HASH_USER)
+        home = balancer.route("{{portal.mall}}/x", user_key="token-1")[1]
+        url, backend = balancer.route("{{portal.mall}}/x", user_key="token-1",
+                                      unavailable=lambda candidate: candidate == home.url)
+        assert backend is not home
+
+    def test_release_records_errors(self):
+        balancer = LoadBalancer(["http://a:8085"])
+        backend = balancer.route("{{portal.mall}}/x")[1]
+        balancer.release(backend, 0.05, False)
+        row = balancer.report()[0]
+        assert (row["requests"], row["errors"], row["outstanding"]) == (1, 1, 0)
+        assert row["max_ms"] == 50.0
+        assert len(balancer.format_report()) == 3
+
+
+@pytest.fixture
+def routed_balancer(monkeypatch):
+    """
+    指向本地模拟服务两个地址的 hash_user 负载均衡器，记录每次分发的用户标识和选中的实例
+
+    Returns:
+        tuple: (负载均衡器, [(用户标识, 实例URL)])
+    """
+    server, url = start_mock_server()
+    balancer = LoadBalancer([url, url.replace("127.0.0.1", "localhost")], BALANCE_HASH_USER)
+    routed = []
+    route = balancer.route
+
+    def recording_route(url, user_key=None, unavailable=None):
+        result = route(url, user_key, unavailable)
+        routed.append((user_key, result[1].url))
+        return result
+
+    monkeypatch.setattr(balancer, "route", recording_route)
+    yield balancer, routed
+    server.shutdown()
+    server.server_close()
+
+
+def _user_cases():
+    return [TestCase(case_id=f"CART-{user}{i}", headers={"Authorization": f"Bearer user-{user}"},
+                     url="{{portal.mall}}/cart/list")
+            for user in (1, 2, 5, 6) for i in range(3)]
+
+
+def _assert_sticky(routed):
+    assert [user_key for user_key, _ in routed] == [case.headers["Authorization"] for case in _user_cases()]
+    backends = {}
+    for user_key, backend in routed:
+        assert backends.setdefault(user_key, backend) == backend
+    # 不同用户分散到两个实例
+    assert len(set(backends.values())) == 2
+
+
+class TestHandlerUserKey:
+    """请求处理器的用户标识测试类"""
+
+    def test_sync_uses_case_authorization(self, routed_balancer):
+        balancer, routed = routed_balancer
+        handler = RequestHandler(load_balancer=balancer)
+        try:
+            for case in _user_cases():
+                assert handler.send_case(case).status_code == 200
+        finally:
+            handler.close()
+        _assert_sticky(routed)
+
+    def test_async_uses_case_authorization(self, routed_balancer):
+        balancer, routed = routed_balancer
+
+        async def run():
+            handler = AsyncRequestHandler(load_balancer=balancer, metrics=None)
+            try:
+                for case in _user_cases():
+                    assert (await handler.send_case(case)).status_code == 200
+            finally:
+                await handler.close()
+
+        asyncio.run(run())
+        _assert_sticky(routed)
+
+    def test_token_takes_precedence(self, routed_balancer):
+        balancer, routed = routed_balancer
+        handler = RequestHandler(load_balancer=balancer)
+        handler.set_token("session-token")
+        try:
+            handler.send_case(_user_cases()[0])
+        finally:
+            handler.close()
+        assert routed[0][0] == "session-token"
@@ -0,0 +1,133 @@
+"""
+压测模式单元测试
+权重解析、压测统计报告，以及在本地模拟服务上验证压测过程中应用的用例增量
+"""
+import csv
+import json
+import os
+import threading
+
+import pytest
+
+from benchmarks.mock_server import MOCK_TOKEN, start_mock_server
+from core.load_mode import LoadStats, format_load_report, parse_weights, write_load_report
+from core.test_executor import TestExecutor
+
+
+class TestParseWeights:
+    """权重解析测试类"""
+
+    def test_parse(self):
+        assert parse_weights("CART-01=3, CART-02 ,CART-03=0.5,") == {"CART-01": 3.0, "CART-02": 1.0, "CART-03": 0.5}
+        assert parse_weights("") == {}
+
+    def test_negative_weight(self):
+        with pytest.raises(ValueError):
+            parse_weights("CART-01=-1")
+
+
+class TestLoadStats:
+    """压测统计测试类"""
+
+    def test_report(self, tmp_path):
+        stats = LoadStats(rate=10, duration=2)
+        stats.started, stats.finished = 100.0, 102.0
+        stats.max_in_flight = 3
+        for seconds in (0.010, 0.020, 0.030):
+            stats.record("CART-01", 200, seconds, error=False)
+        stats.record("CART-01", 500, 0.040, error=True)
+        stats.record("CART-02", "ReadTimeout", 1.0, error=True)
+        stats.record_dropped("CART-02")
+        stats.record_dropped("CART-03")
+
+        report = stats.report()
+        assert (report["sent"], report["errors"], report["dropped"]) == (5, 2, 2)
+        assert report["elapsed_s"] == 2.0
+        assert report["achieved_rps"] == 2.5
+        assert report["error_rate"] == 0.4
+        assert report["max_in_flight"] == 3
+        assert [row["case_id"] for row in report["cases"]] == ["CART-01", "CART-02", "CART-03"]
+
+        cart_01 = report["cases"][0]
+        assert cart_01["statuses"] == {"200": 3, "500": 1}
+        assert cart_01["error_rate"] == 0.25
+        assert cart_01["max_ms"] == 40.0
+        cart_03 = report["cases"][2]
+        assert (cart_03["sent"], cart_03["dropped"], cart_03["error_rate"]) == (0, 1, 0.0)
+
+        assert len(format_load_report(report)) == 2 + len(report["cases"])
+        path = tmp_path / "load" / "report.json"
+        write_load_report(str(path), report)
+        assert json.loads(path.read_text(encoding="utf-8"))["sent"] == 5
+
+    def test_empty_report(self):
+        report = LoadStats(rate=10, duration=1).report()
+        assert (report["sent"], report["achieved_rps"], report["error_rate"], report["cases"]) == (0, 0.0, 0.0, [])
+
+
+class TestRunLoad:
+    """压测执行测试类（使用本地模拟服务）"""
+
+    COLUMNS = ["用例编号", "用例标题", "请求头", "请求方式", "接口地址", "参数输入", "期望返回结果"]
+
+    def _write_cases(self, path, url, case_ids, expected="HTTP状态码200"):
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            for case_id in case_ids:
+                writer.writerow([case_id, "标题", "", "GET", f"{url}/cart/list", "", expected])
+
+    def test_applies_case_delta_during_run(self, tmp_path):
+        server, url = start_mock_server()
+        path = tmp_path / "cases.csv"
+        self._write_cases(path, url, ["CART-01"])
+        executor = TestExecutor(str(path), "")
+        executor.token_storage["auth"] = MOCK_TOKEN
+        try:
+            executor.load_test_cases()
+            executor.watch_test_cases(interval=0.05)
+
+            def edit():
+                stat = os.stat(path)
+                self._write_cases(path, url, ["CART-02"])
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            timer = threading.Timer(0.3, edit)
+            timer.start()
+            report = executor.run_load(rate=50, duration=1.0, seed=1)
+            timer.join()
+        finally:
+            executor.close()
+            server.shutdown()
+            server.server_close()
+
+        sent = {row["case_id"]: row["sent"] for row in report["cases"]}
+        assert sent.keys() == {"CART-01", "CART-02"}
+        assert report["errors"] == 0
+
+    def test_expected_status_follows_updated_case(self, tmp_path):
+        server, url = start_mock_server()
+        path = tmp_path / "cases.csv"
+        self._write_cases(path, url, ["CART-01"])
+        executor = TestExecutor(str(path), "")
+        executor.token_storage["auth"] = MOCK_TOKEN
+        try:
+            executor.load_test_cases()
+            executor.watch_test_cases(interval=0.05)
+
+            def edit():
+                # 同一用例改为期望404，模拟服务仍返回200，更新后的请求都应计为错误
+                stat = os.stat(path)
+                self._write_cases(path, url, ["CART-01"], expected="HTTP状态码404")
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            timer = threading.Timer(0.3, edit)
+            timer.start()
+            report = executor.run_load(rate=50, duration=1.0, seed=1)
+            timer.join()
+        finally:
+            executor.close()
+            server.shutdown()
+            server.server_close()
+
+        assert 0 < report["errors"] < report["sent"]
@@ -0,0 +1,94 @@
+"""
+延迟统计单元测试
+直方图百分位的精度和接口路径归一化，不需要访问后端
+"""
+import json
+import random
+
+import pytest
+
+from core.metrics import LatencyHistogram, LatencyRecorder, normalize_endpoint
+
+
+def _exact_percentile(values_ms, percent):
+    ordered = sorted(values_ms)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+class TestLatencyHistogram:
+    """耗时直方图测试类"""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean() == 0.0
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for us in range(1, 101):
+            histogram.record(us / 1_000_000)
+        assert histogram.percentile(50) == 0.05
+        assert histogram.percentile(99) == 0.099
+        assert histogram.percentile(100) == 0.1
+        assert histogram.mean() == pytest.approx(0.0505)
+
+    @pytest.mark.parametrize("percent", [50, 90, 99, 99.9])
+    def test_percentile_relative_error(self, percent):
+        rng = random.Random(7)
+        values_ms = [rng.lognormvariate(3, 1) for _ in range(5000)]
+        histogram = LatencyHistogram()
+        for value in values_ms:
+            histogram.record(value / 1000)
+        expected = _exact_percentile(values_ms, percent)
+        assert histogram.percentile(percent) == pytest.approx(expected, rel=0.02)
+
+    def test_percentile_within_min_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.0123456)
+        assert histogram.percentile(1) == histogram.percentile(100) == 12.345
+        assert histogram.min_us == histogram.max_us == 12345
+
+    def test_merge(self):
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(1, 200):
+            seconds = i * 0.0007
+            (left if i % 2 else right).record(seconds)
+            combined.record(seconds)
+        left.merge(right)
+        left.merge(LatencyHistogram())
+        assert left.counts == combined.counts
+        assert (left.count, left.total_us, left.min_us, left.max_us) == \
+               (combined.count, combined.total_us, combined.min_us, combined.max_us)
+
+
+class TestLatencyRecorder:
+    """耗时统计器测试类"""
+
+    def test_normalize_endpoint(self):
+        assert normalize_endpoint("http://host:8085/cart/delete/12?ids=1") == "/cart/delete/{id}"
+        assert normalize_endpoint("http://host/order/0123456789abcdef0123/detail") == "/order/{id}/detail"
+
+    def test_report_groups_by_endpoint_and_status(self, tmp_path):
+        recorder = LatencyRecorder()
+        recorder.record("GET", "http://host/cart/list", 200, 0.010)
+        recorder.record("GET", "http://host/cart/list", 200, 0.030)
+        recorder.record("POST", "http://host/cart/delete/1", 200, 0.020)
+        recorder.record("POST", "http://host/cart/delete/2", "ReadTimeout", 1.0)
+        assert len(recorder) == 4
+
+        report = recorder.report()
+        assert report["requests"] == 4
+        rows = {(row["method"], row["path"], row["status"]): row for row in report["endpoints"]}
+        assert set(rows) == {("GET", "/cart/list", "200"), ("POST", "/cart/delete/{id}", "200"),
+                             ("POST", "/cart/delete/{id}", "ReadTimeout")}
+        assert rows[("GET", "/cart/list", "200")]["count"] == 2
+        assert rows[("GET", "/cart/list", "200")]["max_ms"] == 30.0
+        assert report["endpoints"][0]["path"] == "/cart/list"
+
+        path = tmp_path / "latency.json"
+        recorder.write_json(str(path), report)
+        assert json.loads(path.read_text(encoding="utf-8"))["requests"] == 4
+
+        recorder.reset()
+        assert len(recorder) == 0
@@ -0,0 +1,122 @@
+"""
+请求报告单元测试
+各报告级别写入的日志和Allure附件，用记录调用的替身代替 allure.attach / allure.step
+"""
+import contextlib
+import datetime
+import logging
+from itertools import count
+
+import allure
+import pytest
+
+from core import reporting
+from core.reporting import (REPORT_FAILED, REPORT_FULL, REPORT_OFF, REPORT_SAMPLED, REPORT_SUMMARY,
+                            Exchange, RequestReporter, truncate_text)
+
+
+class FakeResponse:
+    """只提供报告用到的属性的响应替身"""
+
+    def __init__(self, status_code=200, text='{"code": 200}'):
+        self.status_code = status_code
+        self.text = text
+        self.elapsed = datetime.timedelta(milliseconds=12.5)
+
+
+@pytest.fixture
+def attachments(monkeypatch):
+    """
+    记录写入的Allure步骤和附件
+
+    Returns:
+        dict: {"steps": [步骤标题], "attachments": [(附件名称, 内容)]}
+    """
+    recorded = {"steps": [], "attachments": []}
+
+    def step(title):
+        recorded["steps"].append(title)
+        return contextlib.nullcontext()
+
+    monkeypatch.setattr(allure, "step", step)
+    monkeypatch.setattr(allure, "attach", lambda body, name=None, attachment_type=None:
+                        recorded["attachments"].append((name, body)))
+    # 抽样计数为进程级，测试之间互不影响
+    monkeypatch.setattr(reporting, "_sample_counter", count(1))
+    return recorded
+
+
+def _send(reporter: RequestReporter, url="http://host/cart/list", params=None, response=None):
+    exchange = Exchange("POST", url, {"Content-Type": "application/json"}, params or {"id": 1})
+    reporter.before_send(exchange)
+    exchange.response = response or FakeResponse()
+    reporter.after_response(exchange)
+    return exchange
+
+
+class TestRequestReporter:
+    """请求报告器测试类"""
+
+    def test_invalid_level(self):
+        with pytest.raises(ValueError):
+            RequestReporter("verbose")
+
+    def test_off(self, attachments, caplog):
+        with caplog.at_level(logging.INFO, logger="core.reporting"):
+            _send(RequestReporter(REPORT_OFF))
+        assert attachments == {"steps": [], "attachments": []}
+        assert not caplog.records
+
+    def test_summary(self, attachments, caplog):
+        with caplog.at_level(logging.INFO, logger="core.reporting"):
+            _send(RequestReporter(REPORT_SUMMARY))
+        assert attachments == {"steps": [], "attachments": []}
+        assert [record.getMessage() for record in caplog.records] == \
+               ["请求完成: POST http://host/cart/list -> 200 (12.5ms)"]
+
+    def test_sampled_counts_across_reporters(self, attachments):
+        # 每个用例一个新的报告器，只发一个请求
+        for i in range(7):
+            _send(RequestReporter(REPORT_SAMPLED, sample_every=3), url=f"http://host/cart/{i}")
+        assert attachments["steps"] == ["抽样请求: POST http://host/cart/2 -> 200 (12.5ms)",
+                                        "抽样请求: POST http://host/cart/5 -> 200 (12.5ms)"]
+        assert [name for name, _ in attachments["attachments"]] == ["请求头", "请求参数", "响应内容"] * 2
+
+    def test_failed_attaches_only_failed_case(self, attachments):
+        reporter = RequestReporter(REPORT_FAILED)
+        reporter.begin_case()
+        _send(reporter, url="http://host/passed")
+        reporter.begin_case()
+        _send(reporter, url="http://host/failed/1")
+        _send(reporter, url="http://host/failed/2")
+        assert attachments["steps"] == []
+        reporter.report_failure()
+        assert [title.split(": ")[1] for title in attachments["steps"]] == \
+               ["POST http://host/failed/1 -> 200 (12.5ms)", "POST http://host/failed/2 -> 200 (12.5ms)"]
+        # 已写入的请求记录被清空
+        reporter.report_failure()
+        assert len(attachments["steps"]) == 2
+
+    def test_failed_keeps_last_exchanges(self, attachments, monkeypatch):
+        monkeypatch.setattr(reporting, "MAX_PENDING_EXCHANGES", 3)
+        reporter = RequestReporter(REPORT_FAILED)
+        reporter.begin_case()
+        for i in range(5):
+            _send(reporter, url=f"http://host/cart/{i}")
+        reporter.report_failure()
+        assert [title.split(" ")[2] for title in attachments["steps"]] == \
+               ["http://host/cart/2", "http://host/cart/3", "http://host/cart/4"]
+
+    def test_full_truncates_bodies(self, attachments):
+        reporter = RequestReporter(REPORT_FULL, body_limit=10)
+        _send(reporter, params={"name": "x" * 50}, response=FakeResponse(text="y" * 30))
+        assert attachments["steps"] == ["发送 POST 请求到 http://host/cart/list", "收到响应，状态码: 200"]
+        bodies = dict(attachments["attachments"])
+        assert bodies["请求参数"].startswith('{\n  "name"') and bodies["请求参数"].endswith("个字符）")
+        assert bodies["响应内容"] == "y" * 10 + "...（已截断，共 30 个字符）"
+
+
+def test_truncate_text():
+    assert truncate_text("abc", 0) == "abc"
+    assert truncate_text("abc", 3) == "abc"
+    assert truncate_text("abcd", 3) == "abc...（已截断，共 4 个字符）"
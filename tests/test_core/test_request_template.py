@@ -0,0 +1,79 @@
+"""
+请求模板单元测试
+{{变量}} 占位符在URL、JSON和表单请求体中的替换，以及token和Cookie的更新，不需要访问后端
+"""
+import json
+
+import pytest
+import requests
+from requests.cookies import RequestsCookieJar
+
+from core.request_template import RequestTemplate
+
+JSON_HEADERS = {"Content-Type": "application/json", "Authorization": "Bearer compile-time"}
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+@pytest.fixture
+def session():
+    with requests.Session() as s:
+        yield s
+
+
+def _template(session, method, url, headers, request_params, dynamic_auth=True):
+    return RequestTemplate(session, method, url, headers, request_params, params=None, dynamic_auth=dynamic_auth)
+
+
+class TestRequestTemplate:
+    """请求模板测试类"""
+
+    def test_url_placeholders(self, session):
+        template = _template(session, "GET", "http://host/cart/{{cart_id}}", {},
+                             {"params": {"keyword": "{{word}}"}})
+        assert template.variables == {"cart_id", "word"}
+        prepared = template.render(values={"cart_id": 12, "word": "a b&c"})
+        assert prepared.url == "http://host/cart/12?keyword=a%20b%26c"
+
+    def test_json_body_keeps_value_types(self, session):
+        body = '{"id": "{{cart_id}}", "note": "item {{name}}", "qty": 1}'
+        template = _template(session, "POST", "http://host/cart/update", JSON_HEADERS, {"data": body})
+        prepared = template.render(values={"cart_id": 12, "name": 'say "hi"'})
+        assert json.loads(prepared.body) == {"id": 12, "note": 'item say "hi"', "qty": 1}
+        assert prepared.headers["Content-Length"] == str(len(prepared.body.encode("utf-8")))
+
+    def test_json_body_structured_and_chinese_values(self, session):
+        body = '{"ids": "{{ids}}", "note": "{{note}}"}'
+        template = _template(session, "POST", "http://host/cart/delete", JSON_HEADERS, {"data": body})
+        prepared = template.render(values={"ids": [1, 2], "note": "删除\n购物车"})
+        assert prepared.body == '{"ids": [1,2], "note": "删除\\n购物车"}'
+
+    def test_form_body_is_url_encoded(self, session):
+        template = _template(session, "POST", "http://host/sso/login", FORM_HEADERS,
+                             {"data": {"username": "{{user}}", "password": "x"}})
+        prepared = template.render(values={"user": "张 三"})
+        assert prepared.body == "username=%E5%BC%A0+%E4%B8%89&password=x"
+
+    def test_missing_value(self, session):
+        template = _template(session, "GET", "http://host/cart/{{cart_id}}", {}, {})
+        with pytest.raises(KeyError, match="cart_id"):
+            template.render(values={})
+
+    def test_render_does_not_modify_template(self, session):
+        template = _template(session, "GET", "http://host/cart/{{cart_id}}", {}, {})
+        template.render(values={"cart_id": 1})
+        assert template.render(values={"cart_id": 2}).url == "http://host/cart/2"
+        assert template.url == "http://host/cart/%7B%7Bcart_id%7D%7D"
+
+    def test_dynamic_auth_and_cookies(self, session):
+        template = _template(session, "POST", "http://host/cart/add", JSON_HEADERS, {"data": "{}"})
+        cookies = RequestsCookieJar()
+        cookies.set("JSESSIONID", "abc")
+        prepared = template.render(authorization="Bearer new-token", cookies=cookies)
+        assert prepared.headers["Authorization"] == "Bearer new-token"
+        assert prepared.headers["Cookie"] == "JSESSIONID=abc"
+        assert "Authorization" not in template.render().headers
+
+    def test_static_auth_is_kept(self, session):
+        template = _template(session, "POST", "http://host/cart/add", JSON_HEADERS, {"data": "{}"},
+                             dynamic_auth=False)
+        assert template.render(authorization="Bearer new-token").headers["Authorization"] == "Bearer compile-time"
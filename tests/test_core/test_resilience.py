@@ -0,0 +1,144 @@
+"""
+请求容错单元测试
+熔断器的状态切换和重试策略的判断，不需要访问后端
+"""
+import pytest
+from requests.exceptions import ConnectionError, ReadTimeout
+
+from core import resilience
+from core.resilience import (CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, CircuitBreaker,
+                             CircuitBreakerRegistry, CircuitOpenError, RetryPolicy)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    可手动推进的时钟，替换熔断器使用的 time.monotonic
+
+    Returns:
+        list: 只有一个元素的列表，修改 clock[0] 即推进时间
+    """
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _trip(breaker: CircuitBreaker, failures: int):
+    for _ in range(failures):
+        breaker.before_request()
+        breaker.record(False)
+
+
+class TestCircuitBreaker:
+    """熔断器测试类"""
+
+    def test_stays_closed_below_min_requests(self, clock):
+        breaker = CircuitBreaker("host", min_requests=4, window=4)
+        _trip(breaker, 3)
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.before_request()
+
+    def test_opens_at_failure_threshold(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=0.5, min_requests=4, window=4, open_seconds=10)
+        for success in (True, True, False):
+            breaker.record(success)
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.record(False)
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.is_open()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        assert breaker.snapshot() == {"state": CIRCUIT_OPEN, "trips": 1, "rejected": 1}
+
+    def test_window_drops_old_results(self, clock):
+        breaker = CircuitBreaker("host", failure_threshold=0.5, min_requests=4, window=4)
+        for success in (False, True, True, True, True, False):
+            breaker.record(success)
+        # 窗口内只剩最近4个结果，失败率 1/4
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker("host", min_requests=2, window=2, open_seconds=10)
+        _trip(breaker, 2)
+        clock[0] += 10
+        assert not breaker.is_open()
+        breaker.before_request()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_trial_success_closes(self, clock):
+        breaker = CircuitBreaker("host", min_requests=2, window=2, open_seconds=10)
+        _trip(breaker, 2)
+        clock[0] += 10
+        breaker.before_request()
+        breaker.record(True)
+        assert breaker.state == CIRCUIT_CLOSED
+        # 关闭时清空了窗口，一次失败不会再次打开
+        breaker.record(False)
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_trial_failure_reopens(self, clock):
+        breaker = CircuitBreaker("host", min_requests=2, window=2, open_seconds=10)
+        _trip(breaker, 2)
+        clock[0] += 10
+        breaker.before_request()
+        breaker.record(False)
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.trips == 2
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_release_frees_trial_slot(self, clock):
+        breaker = CircuitBreaker("host", min_requests=2, window=2, open_seconds=10)
+        _trip(breaker, 2)
+        clock[0] += 10
+        breaker.before_request()
+        breaker.release()
+        breaker.before_request()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+
+
+class TestCircuitBreakerRegistry:
+    """熔断器注册表测试类"""
+
+    def test_one_breaker_per_host(self):
+        registry = CircuitBreakerRegistry(min_requests=3)
+        first = registry.for_url("http://a.example:8085/cart/list")
+        assert registry.for_url("http://a.example:8085/sso/login") is first
+        assert registry.for_url("http://b.example:8085/cart/list") is not first
+        assert first.min_requests == 3
+        assert set(registry.snapshot()) == {"a.example:8085", "b.example:8085"}
+
+
+class TestRetryPolicy:
+    """重试策略测试类"""
+
+    def test_retries_transient_status_for_idempotent_methods(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry("get", 0, status_code=503)
+        assert policy.should_retry("DELETE", 1, status_code=502)
+        assert not policy.should_retry("GET", 0, status_code=500)
+        assert not policy.should_retry("GET", 0, status_code=200)
+
+    def test_does_not_retry_post_by_default(self):
+        policy = RetryPolicy(max_retries=2)
+        assert not policy.should_retry("POST", 0, status_code=503)
+        assert RetryPolicy(methods=("POST",)).should_retry("post", 0, status_code=503)
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry("GET", 1, error=ConnectionError())
+        assert not policy.should_retry("GET", 2, error=ConnectionError())
+        assert not RetryPolicy(max_retries=0).should_retry("GET", 0, error=ConnectionError())
+
+    def test_retryable_errors(self):
+        policy = RetryPolicy()
+        assert policy.should_retry("GET", 0, error=ReadTimeout())
+        assert not policy.should_retry("GET", 0, error=CircuitOpenError("open"))
+        assert not policy.should_retry("GET", 0, error=ValueError("bad url"))
+
+    def test_backoff_is_capped_exponential(self, monkeypatch):
+        monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+        policy = RetryPolicy(backoff_base=0.2, backoff_max=1.0)
+        assert [policy.backoff(attempt) for attempt in range(4)] == [0.2, 0.4, 0.8, 1.0]
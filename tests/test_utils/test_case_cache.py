@@ -0,0 +1,81 @@
+"""
+用例编译缓存单元测试
+缓存按修改时间和大小快速命中，内容变化时失效，只被touch过时按内容摘要命中
+"""
+import os
+
+import pytest
+
+from utils import case_cache
+from utils.case_cache import cache_path_for, file_stat_key, load_cached_cases, store_cached_cases
+
+SHEET = "Sheet1"
+BASE_URL = "http://host:8085"
+CASES = [{"用例编号": "MP-LOGIN-01", "接口地址": f"{BASE_URL}/sso/login"}]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """缓存只关心文件内容，用普通文件代替工作簿"""
+    path = tmp_path / "cases.xlsx"
+    path.write_bytes(b"workbook-v1")
+    store_cached_cases(str(path), SHEET, BASE_URL, CASES, file_stat_key(str(path)))
+    return path
+
+
+def _set_mtime(path, offset_ns):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset_ns))
+
+
+class TestCaseCache:
+    """用例缓存测试类"""
+
+    def test_hit(self, workbook):
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) == CASES
+
+    def test_keyed_by_sheet_and_base_url(self, workbook):
+        assert load_cached_cases(str(workbook), "Sheet2", BASE_URL) is None
+        assert load_cached_cases(str(workbook), SHEET, "http://other:8085") is None
+        assert cache_path_for(str(workbook), SHEET, BASE_URL) != cache_path_for(str(workbook), "Sheet2", BASE_URL)
+
+    def test_hit_by_stat_skips_digest(self, workbook, monkeypatch):
+        def fail(path):
+            raise AssertionError("修改时间和大小一致时不应计算摘要")
+        monkeypatch.setattr(case_cache, "_file_digest", fail)
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) == CASES
+
+    def test_content_change_invalidates(self, workbook):
+        workbook.write_bytes(b"workbook-v2")
+        _set_mtime(workbook, 1_000_000_000)
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) is None
+
+    def test_same_size_change_invalidates(self, workbook):
+        # 大小不变、修改时间变化时按内容摘要判断
+        workbook.write_bytes(b"workbook-v9")
+        _set_mtime(workbook, 1_000_000_000)
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) is None
+
+    def test_touch_hits_by_digest_and_refreshes_stat(self, workbook, monkeypatch):
+        _set_mtime(workbook, 1_000_000_000)
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) == CASES
+        # 缓存中的文件状态已刷新，再次读取不需要计算摘要
+        monkeypatch.setattr(case_cache, "_file_digest", lambda path: "changed")
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) == CASES
+
+    def test_version_change_invalidates(self, workbook, monkeypatch):
+        monkeypatch.setattr(case_cache, "CACHE_VERSION", case_cache.CACHE_VERSION + 1)
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) is None
+
+    def test_corrupt_cache_is_ignored(self, workbook):
+        with open(cache_path_for(str(workbook), SHEET, BASE_URL), "wb") as f:
+            f.write(b"not a pickle")
+        assert load_cached_cases(str(workbook), SHEET, BASE_URL) is None
+
+    def test_store_skipped_when_file_changed_during_parse(self, tmp_path):
+        path = tmp_path / "cases.xlsx"
+        path.write_bytes(b"workbook-v1")
+        parsed_stat = file_stat_key(str(path))
+        path.write_bytes(b"workbook-v1-edited")
+        store_cached_cases(str(path), SHEET, BASE_URL, CASES, parsed_stat)
+        assert not os.path.exists(cache_path_for(str(path), SHEET, BASE_URL))
@@ -0,0 +1,112 @@
+"""
+用例索引单元测试
+标题bigram检索、编号前缀二分查找和多条件并集的结果与线性扫描一致，且按加载顺序返回
+"""
+import csv
+
+import pytest
+
+from core.test_executor import TestExecutor
+from utils.case_index import CaseIndex, normalize_path
+from utils.case_model import TestCase
+from utils.case_registry import get_case_index
+from utils.case_watcher import CaseDelta
+
+
+def _case(case_id, title, url="http://host/cart/list", module=None):
+    return TestCase(case_id=case_id, title=title, url=url, module=module)
+
+
+CASES = (
+    _case("MP-LOGIN-01", "正常登录", "http://host/sso/login", "会员登录"),
+    _case("MP-LOGIN-02", "密码错误登录失败", "http://host/sso/login", "会员登录"),
+    _case("MP-CART-01", "添加商品到购物车"),
+    _case("MP-CART-02", "购物车商品数量修改", "http://host/cart/update/quantity"),
+    _case("MP-CART-10", "删除购物车商品", "http://host/cart/delete/12"),
+    _case("MP-CARTX-01", "清空购物车", "http://host/cart/clear"),
+    _case("MP-ORDER-01", "生成订单", "http://host/order/generate"),
+    _case("A-01", "登", "http://host/x"),
+    _case("B-01", "商品购物 物车", "http://host/y"),
+)
+
+
+@pytest.fixture
+def index():
+    return CaseIndex(CASES)
+
+
+def _ids(cases):
+    return [case.case_id for case in cases]
+
+
+class TestCaseIndex:
+    """用例索引测试类"""
+
+    def test_keeps_tuple_of_cases(self, index):
+        assert index.cases is CASES
+        assert len(CaseIndex([dict(case.items()) for case in CASES])) == len(CASES)
+
+    def test_get(self, index):
+        assert index.get("MP-CART-02") is CASES[3]
+        assert index.get("MP-CART-03") is None
+
+    @pytest.mark.parametrize("keyword", ["登", "车", "购物车", "商品", "登录失败", "订单", "不存在", "车商品数"])
+    def test_search_title_matches_linear_scan(self, index, keyword):
+        assert index.search_title(keyword) == [case for case in CASES if keyword in case.title]
+
+    def test_search_title_requires_contiguous_match(self, index):
+        # B-01 的标题包含“商品购物车”的全部二元组，但不包含该子串
+        assert _ids(index.search_title("商品购物车")) == []
+        assert _ids(index.search_title("商品购物")) == ["B-01"]
+        assert len(index.search_title("")) == len(CASES)
+
+    @pytest.mark.parametrize("prefix, expected", [
+        ("MP-CART", ["MP-CART-01", "MP-CART-02", "MP-CART-10", "MP-CARTX-01"]),
+        ("MP-CART-", ["MP-CART-01", "MP-CART-02", "MP-CART-10"]),
+        ("MP-CART-1", ["MP-CART-10"]),
+        ("MP-CART-10", ["MP-CART-10"]),
+        ("MP-CART-100", []),
+        ("A", ["A-01"]),
+        ("MP-P", []),
+        ("Z", []),
+        ("", [case.case_id for case in CASES]),
+    ])
+    def test_find_by_id_prefix(self, index, prefix, expected):
+        assert _ids(index.find_by_id_prefix(prefix)) == expected
+
+    def test_find_by_path_and_module(self, index):
+        assert normalize_path("http://host/cart/list/?a=1") == "/cart/list"
+        assert _ids(index.find_by_path("/sso/login")) == ["MP-LOGIN-01", "MP-LOGIN-02"]
+        assert _ids(index.find_by_path_keyword("cart/")) == ["MP-CART-01", "MP-CART-02", "MP-CART-10", "MP-CARTX-01"]
+        assert _ids(index.find_by_module_keyword("登录")) == ["MP-LOGIN-01", "MP-LOGIN-02"]
+        assert _ids(index.find_by_module_type("order")) == ["MP-ORDER-01"]
+        assert _ids(index.find_by_title("生成订单")) == ["MP-ORDER-01"]
+
+    def test_select_any_is_union_in_load_order(self, index):
+        selected = index.select_any(id_prefix="MP-ORDER", path_keyword="login", title_keyword=("清空", "登"))
+        assert _ids(selected) == ["MP-LOGIN-01", "MP-LOGIN-02", "MP-CARTX-01", "MP-ORDER-01", "A-01"]
+        # 多个条件命中同一用例时只返回一次
+        assert _ids(index.select_any(id_prefix=("MP-LOGIN", "MP-LOGIN-0"), module_type="auth")) == \
+               ["MP-LOGIN-01", "MP-LOGIN-02"]
+        assert index.select_any() == []
+
+
+class TestExecutorCaseIndex:
+    """执行器使用共享用例索引的测试类"""
+
+    def test_shares_registry_index_until_delta(self, tmp_path):
+        path = tmp_path / "cases.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["用例编号", "用例标题", "请求方式", "接口地址"])
+            writer.writerow(["CART-01", "添加购物车", "POST", "http://host/cart/add"])
+        first, second = TestExecutor(str(path), ""), TestExecutor(str(path), "")
+        shared = get_case_index(str(path), "")
+        assert first.case_index is shared
+        assert second.case_index is shared
+
+        first.apply_case_delta(CaseDelta(added=(_case("CART-02", "删除购物车"),)))
+        assert first.case_index is not shared
+        assert _ids(first.case_index.search_title("购物车")) == ["CART-01", "CART-02"]
+        # 其他执行器的用例未变，继续使用原来的索引
+        assert second.case_index is shared
@@ -0,0 +1,75 @@
+"""
+测试用例模型单元测试
+共享的用例记录不能被调用方修改
+"""
+import pytest
+
+from utils.case_model import BODY_JSON, BODY_QUERY, TestCase
+
+ROW = {
+    "用例编号": "MP-CART-01",
+    "请求头": "Content-Type: application/json",
+    "请求方式": "get",
+    "接口地址": "http://host/cart/list",
+    "参数输入": '{"pageNum": 1, "ids": [1, 2]}',
+    "优先级": "P0",
+}
+
+
+class TestTestCase:
+    """测试用例记录测试类"""
+
+    def test_from_mapping(self):
+        case = TestCase.from_mapping(ROW)
+        assert (case.case_id, case.method, case.module_type, case.body_encoding) == \
+               ("MP-CART-01", "GET", "cart", BODY_QUERY)
+        assert case["优先级"] == "P0"
+        assert case.request_kwargs == {"params": {"pageNum": 1, "ids": [1, 2]}}
+
+    def test_read_only_views(self):
+        case = TestCase.from_mapping(ROW)
+        with pytest.raises(TypeError):
+            case.headers["Authorization"] = "Bearer x"
+        with pytest.raises(TypeError):
+            case.extra["优先级"] = "P1"
+
+    def test_params_and_request_kwargs_are_copies(self):
+        case = TestCase.from_mapping(ROW)
+        case.params["pageNum"] = 2
+        case.params["ids"].append(3)
+        case.request_kwargs["params"]["pageNum"] = 3
+        assert case.params == {"pageNum": 1, "ids": [1, 2]}
+        assert case.request_kwargs == {"params": {"pageNum": 1, "ids": [1, 2]}}
+
+    def test_params_argument_is_copied(self):
+        params = {"id": 1}
+        case = TestCase(method="GET", url="http://host/cart/delete", params=params)
+        params["id"] = 2
+        assert case.request_kwargs == {"params": {"id": 1}}
+        replaced = case.replace(params=params)
+        params["id"] = 3
+        assert replaced.params == {"id": 2}
+
+    def test_copy_is_independent(self):
+        case = TestCase.from_mapping(ROW)
+        row = case.copy()
+        row["请求头"]["Authorization"] = "Bearer x"
+        assert "Authorization" not in case.headers
+        assert row["优先级"] == "P0"
+
+    def test_replace(self):
+        case = TestCase.from_mapping(ROW)
+        post = case.replace(method="post", params_input='{"id": 5}')
+        assert post.body_encoding == BODY_JSON
+        assert post.request_kwargs == {"data": b'{"id":5}'}
+        assert case.method == "GET" and case.params == {"pageNum": 1, "ids": [1, 2]}
+        with pytest.raises(ValueError):
+            case.replace(request_kwargs={"params": {}})
+
+    def test_shared_accessors_do_not_copy(self):
+        case = TestCase.from_mapping(ROW)
+        assert case.shared_params is case.shared_params
+        assert case.shared_request_kwargs["params"] is case.shared_params
+        with pytest.raises(TypeError):
+            case.shared_request_kwargs["params"] = {}
+        assert TestCase(method="OPTIONS").shared_request_kwargs is None
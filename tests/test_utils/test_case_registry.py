@@ -0,0 +1,60 @@
+"""
+用例注册表单元测试
+并发获取用例和索引时只加载、只建立一次，失效后重新加载
+"""
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import case_registry as registry_module
+from utils.case_registry import CaseRegistry
+
+COLUMNS = ["用例编号", "用例标题", "请求头", "请求方式", "接口地址", "参数输入", "期望返回结果"]
+
+
+@pytest.fixture
+def case_file(tmp_path):
+    path = tmp_path / "cases.csv"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerow(["CART-01", "标题", "", "GET", "http://host/cart/list", "", "HTTP状态码200"])
+    return str(path)
+
+
+@pytest.fixture
+def slow_index(monkeypatch):
+    """记录建立索引的次数，并放慢建立过程以便线程交错"""
+    calls = []
+    real_index = registry_module.CaseIndex
+
+    def build(cases):
+        calls.append(cases)
+        time.sleep(0.05)
+        return real_index(cases)
+
+    monkeypatch.setattr(registry_module, "CaseIndex", build)
+    return calls
+
+
+class TestCaseRegistry:
+    """用例注册表测试类"""
+
+    def test_concurrent_get_index_builds_once(self, case_file, slow_index):
+        registry = CaseRegistry()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(pool.map(lambda _: registry.get_index(case_file, ""), range(16)))
+        assert len(slow_index) == 1
+        assert all(index is indexes[0] for index in indexes)
+        assert registry.get_index(case_file, "") is indexes[0]
+
+    def test_index_rebuilt_after_invalidate(self, case_file, slow_index):
+        registry = CaseRegistry()
+        cases = registry.get_cases(case_file, "")
+        index = registry.get_index(case_file, "")
+        registry.invalidate(case_file)
+        assert registry.get_cases(case_file, "") is not cases
+        assert registry.get_index(case_file, "") is not index
+        assert len(slow_index) == 2
@@ -0,0 +1,123 @@
+"""
+用例文件监视器单元测试
+用CSV用例文件验证新增、修改、删除用例的增量计算和订阅通知
+"""
+import csv
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.case_watcher import CaseWatcher
+
+COLUMNS = ["用例编号", "用例标题", "请求头", "请求方式", "接口地址", "参数输入", "期望返回结果"]
+
+
+def _row(case_id, title="标题", params="{}"):
+    return [case_id, title, "Content-Type: application/json", "POST", "http://host/cart/add", params, "200"]
+
+
+def _write(path, rows):
+    stat = os.stat(path) if os.path.exists(path) else None
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    if stat is not None:
+        # 保证修改时间变化，不依赖文件系统的时间精度
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    path = tmp_path / "cases.csv"
+    _write(path, [_row("CART-01"), _row("CART-02"), _row("CART-03")])
+    case_watcher = CaseWatcher(str(path))
+    case_watcher.snapshot()
+    return case_watcher
+
+
+class TestCaseWatcher:
+    """用例文件监视器测试类"""
+
+    def test_unchanged_file(self, watcher):
+        assert watcher.check() is None
+        # 只被touch过、内容不变时没有增量
+        _write(watcher.path, [_row("CART-01"), _row("CART-02"), _row("CART-03")])
+        assert watcher.check() is None
+
+    def test_delta(self, watcher):
+        received = []
+        watcher.subscribe(received.append)
+        _write(watcher.path, [_row("CART-01"), _row("CART-02", params='{"quantity": 2}'), _row("CART-04")])
+
+        delta = watcher.check()
+        assert [case.case_id for case in delta.added] == ["CART-04"]
+        assert [case.case_id for case in delta.changed] == ["CART-02"]
+        assert delta.changed[0].params == {"quantity": 2}
+        assert delta.removed == ("CART-03",)
+        assert received == [delta]
+        # 增量只发布一次
+        assert watcher.check() is None
+
+    def test_failing_subscriber_does_not_block_others(self, watcher):
+        received = []
+
+        def fail(delta):
+            raise RuntimeError("boom")
+
+        watcher.subscribe(fail)
+        watcher.subscribe(received.append)
+        _write(watcher.path, [_row("CART-01")])
+        assert watcher.check() is not None
+        assert received[0].removed == ("CART-02", "CART-03")
+
+    def test_read_failure_is_retried(self, watcher, monkeypatch):
+        _write(watcher.path, [_row("CART-01")])
+        read_rows = watcher._read_rows
+
+        def fail():
+            raise ValueError("文件正在保存")
+
+        monkeypatch.setattr(watcher, "_read_rows", fail)
+        assert watcher.check() is None
+        # 读取失败时不更新比对基准，下次轮询仍能发现变化
+        monkeypatch.setattr(watcher, "_read_rows", read_rows)
+        assert watcher.check().removed == ("CART-02", "CART-03")
+
+
+TRUNCATE_SCRIPT = r"""
+import sys
+from utils import case_watcher
+from utils.case_watcher import CaseWatcher
+
+path = sys.argv[1]
+read_rows = case_watcher.iter_raw_rows
+
+
+def truncate_after_first_row(*args, **kwargs):
+    for i, row in enumerate(read_rows(*args, **kwargs)):
+        if i == 0:
+            # 模拟编辑器原地保存：读取过程中文件被截断
+            open(path, "w").close()
+        yield row
+
+
+case_watcher.iter_raw_rows = truncate_after_first_row
+watcher = CaseWatcher(path)
+watcher.snapshot()
+print(len(watcher._rows))
+"""
+
+
+def test_file_truncated_while_reading(tmp_path):
+    """读取期间文件被截断时不能因SIGBUS退出（在子进程中执行）"""
+    path = tmp_path / "cases.csv"
+    _write(path, [_row(f"CART-{i:05d}", title="标题" * 50) for i in range(20000)])
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = subprocess.run([sys.executable, "-c", TRUNCATE_SCRIPT, str(path)], cwd=project_root,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    # 读取的是截断前的完整内容
+    assert result.stdout.strip() == "20000"
@@ -0,0 +1,65 @@
+"""
+JSONPath缓存单元测试
+简单路径的直接取值结果必须与 jsonpath_ng 一致
+"""
+import pytest
+from jsonpath_ng import parse
+
+from utils.jsonpath_cache import SimplePath, compile_path, find_value
+
+DATA = {
+    "code": 200,
+    "message": "操作成功",
+    "data": {
+        "token": "abc",
+        "tokenHead": "Bearer ",
+        "empty": None,
+        "list": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}],
+        "text": "hello",
+    },
+}
+
+SIMPLE_PATHS = [
+    "$",
+    "$.code",
+    "$.data.token",
+    "$.data.tokenHead",
+    "$.data.empty",
+    "$.data.list[0].id",
+    "$.data.list[1].id",
+    "$.data.list[-1].id",
+    "$.data.list[0].tags[1]",
+    "$.data.list[1].tags[0]",
+    "$.data.list[5].id",
+    "$.data.missing",
+    "$.data.missing.deeper",
+    "$.code.deeper",
+    "$.data[0]",
+    "$.data.list.id",
+    "$.data.text[0]",
+]
+
+
+class TestJsonPathCache:
+    """JSONPath缓存测试类"""
+
+    @pytest.mark.parametrize("path", SIMPLE_PATHS)
+    def test_simple_path_matches_jsonpath_ng(self, path):
+        expr = compile_path(path)
+        assert isinstance(expr, SimplePath)
+        assert [match.value for match in expr.find(DATA)] == [match.value for match in parse(path).find(DATA)]
+
+    @pytest.mark.parametrize("path", ["$.data.list[*].id", "$..id", "$.data['token']"])
+    def test_other_paths_use_jsonpath_ng(self, path):
+        expr = compile_path(path)
+        assert not isinstance(expr, SimplePath)
+        assert [match.value for match in expr.find(DATA)] == [match.value for match in parse(path).find(DATA)]
+
+    def test_compiled_paths_are_cached(self):
+        assert compile_path("$.data.token") is compile_path("$.data.token")
+
+    def test_find_value(self):
+        assert find_value(DATA, "$.data.token") == "abc"
+        assert find_value(DATA, "$.data.empty", default="x") is None
+        assert find_value(DATA, "$.data.missing", default="x") == "x"
+        assert find_value(DATA, "$..id") == 1
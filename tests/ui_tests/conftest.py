@@ -4,7 +4,6 @@ UI测试配置文件
 """
 import pytest
 import allure
-from tests.ui_tests.utils.web_driver import WebDriverManager
 
 
 @pytest.fixture(scope="session")
@@ -19,6 +18,9 @@ def driver_manager(request):
     Returns:
         WebDriverManager: WebDriver管理器实例
     """
+    # selenium及webdriver_manager导入较慢，只在UI测试真正使用浏览器时导入
+    from tests.ui_tests.utils.web_driver import WebDriverManager
+    
     # 检查是否需要无头模式
     headless = request.config.getoption("--headless", False)
     
@@ -1,8 +1,14 @@
 # 断言工具
-import allure
-import pytest
-from jsonpath_ng import parse
+# allure在断言执行时才导入，导入本模块不会带来额外的启动开销
+# JSONPath表达式通过 compile_path 编译并缓存，简单路径不经过 jsonpath_ng
 from typing import Any, Dict, Union
+from utils.jsonpath_cache import compile_path
+
+
+def _json_body(json_data: Any) -> Any:
+    """断言工具既接受解析好的JSON数据，也接受响应对象（ResponseView 只解析一次JSON）"""
+    json_method = getattr(json_data, "json", None)
+    return json_method() if callable(json_method) else json_data
 
 
 def assert_response_status(response, expected_status):
@@ -10,9 +16,10 @@ def assert_response_status(response, expected_status):
     断言响应状态码，优先检查响应体中的code字段，如果没有则使用HTTP状态码
     
     Args:
-        response: HTTP响应对象
+        response: HTTP响应对象（ResponseView 或原始响应）
         expected_status: 期望的状态码
     """
+    import allure
     actual_status = response.status_code  # 默认使用HTTP状态码
     
     # 尝试从响应体中的code字段获取状态码
@@ -34,11 +41,12 @@ def assert_json_field_exists(json_data: Dict[str, Any], path: str):
     断言JSON字段存在
     
     Args:
-        json_data: JSON数据
+        json_data: JSON数据或响应对象
         path: JSON路径表达式
     """
-    expr = parse(path)
-    match = expr.find(json_data)
+    import allure
+    expr = compile_path(path)
+    match = expr.find(_json_body(json_data))
     with allure.step(f"验证字段 {path} 存在"):
         assert match, f"未找到字段：{path}"
 
@@ -48,12 +56,13 @@ def assert_json_field_value(json_data: Dict[str, Any], path: str, expected_value
     断言JSON字段值
     
     Args:
-        json_data: JSON数据
+        json_data: JSON数据或响应对象
         path: JSON路径表达式
         expected_value: 期望的值
     """
-    expr = parse(path)
-    match = expr.find(json_data)
+    import allure
+    expr = compile_path(path)
+    match = expr.find(_json_body(json_data))
     with allure.step(f"验证字段 {path} 值为 {expected_value}"):
         assert match, f"未找到字段：{path}"
         assert match[0].value == expected_value, \
@@ -65,12 +74,13 @@ def assert_json_field_contains(json_data: Dict[str, Any], path: str, expected_su
     断言JSON字段包含指定子串
     
     Args:
-        json_data: JSON数据
+        json_data: JSON数据或响应对象
         path: JSON路径表达式
         expected_substring: 期望包含的子串
     """
-    expr = parse(path)
-    match = expr.find(json_data)
+    import allure
+    expr = compile_path(path)
+    match = expr.find(_json_body(json_data))
     with allure.step(f"验证字段 {path} 包含 '{expected_substring}'"):
         assert match, f"未找到字段：{path}"
         actual_value = match[0].value
@@ -84,12 +94,13 @@ def assert_json_field_type(json_data: Dict[str, Any], path: str, expected_type:
     断言JSON字段类型
     
     Args:
-        json_data: JSON数据
+        json_data: JSON数据或响应对象
         path: JSON路径表达式
         expected_type: 期望的类型
     """
-    expr = parse(path)
-    match = expr.find(json_data)
+    import allure
+    expr = compile_path(path)
+    match = expr.find(_json_body(json_data))
     with allure.step(f"验证字段 {path} 类型为 {expected_type.__name__}"):
         assert match, f"未找到字段：{path}"
         actual_value = match[0].value
@@ -105,6 +116,7 @@ def assert_greater_than(value: Union[int, float], expected_minimum: Union[int, f
         value: 实际值
         expected_minimum: 期望的最小值
     """
+    import allure
     with allure.step(f"验证值 {value} 大于 {expected_minimum}"):
         assert value > expected_minimum, \
             f"值断言失败：期望大于{expected_minimum}，实际{value}"
@@ -118,6 +130,7 @@ def assert_less_than(value: Union[int, float], expected_maximum: Union[int, floa
         value: 实际值
         expected_maximum: 期望的最大值
     """
+    import allure
     with allure.step(f"验证值 {value} 小于 {expected_maximum}"):
         assert value < expected_maximum, \
             f"值断言失败：期望小于{expected_maximum}，实际{value}"
@@ -128,12 +141,13 @@ def assert_list_length(json_data: Dict[str, Any], path: str, expected_length: in
     断言列表长度
     
     Args:
-        json_data: JSON数据
+        json_data: JSON数据或响应对象
         path: JSON路径表达式（应指向一个列表）
         expected_length: 期望的列表长度
     """
-    expr = parse(path)
-    match = expr.find(json_data)
+    import allure
+    expr = compile_path(path)
+    match = expr.find(_json_body(json_data))
     with allure.step(f"验证列表 {path} 长度为 {expected_length}"):
         assert match, f"未找到字段：{path}"
         actual_value = match[0].value
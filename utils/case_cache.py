@@ -0,0 +1,159 @@
+"""
+用例编译缓存
+将规范化后的测试用例以pickle形式缓存在工作簿旁的 .case_cache 目录中，
+缓存按工作簿内容哈希、sheet名称和base_url区分，工作簿被修改后自动失效
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 缓存格式版本，规范化逻辑变化时递增以淘汰旧缓存
+CACHE_VERSION = 1
+CACHE_DIR_NAME = ".case_cache"
+
+
+def _file_digest(path: str) -> str:
+    """
+    计算文件内容的SHA-1摘要
+
+    Args:
+        path (str): 文件路径
+
+    Returns:
+        str: 十六进制摘要
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path_for(excel_path: str, sheet_name: str, base_url: str) -> str:
+    """
+    获取指定工作簿、sheet和base_url对应的缓存文件路径
+
+    Args:
+        excel_path (str): Excel文件路径
+        sheet_name (str): sheet名称
+        base_url (str): 替换 {{portal.mall}} 使用的基础URL
+
+    Returns:
+        str: 缓存文件路径
+    """
+    excel_path = os.path.abspath(excel_path)
+    key = hashlib.sha1(f"{sheet_name}\0{base_url}".encode("utf-8")).hexdigest()[:16]
+    file_name = f"{os.path.basename(excel_path)}.{key}.pkl"
+    return os.path.join(os.path.dirname(excel_path), CACHE_DIR_NAME, file_name)
+
+
+def load_cached_cases(excel_path: str, sheet_name: str, base_url: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    读取缓存的用例，缓存不存在或已失效时返回None
+
+    先比较文件的修改时间和大小，一致时直接命中；不一致时再比较内容哈希，
+    只是被touch过而内容未变的工作簿同样可以命中缓存
+
+    Args:
+        excel_path (str): Excel文件路径
+        sheet_name (str): sheet名称
+        base_url (str): 基础URL
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: 缓存的用例列表
+    """
+    path = cache_path_for(excel_path, sheet_name, base_url)
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"用例缓存读取失败，将重新解析工作簿: {e}")
+        return None
+
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    if entry.get("sheet_name") != sheet_name or entry.get("base_url") != base_url:
+        return None
+
+    stat_key = file_stat_key(excel_path)
+    if entry.get("stat") == stat_key:
+        return entry["cases"]
+
+    if entry.get("digest") != _file_digest(excel_path):
+        return None
+
+    # 内容未变化，刷新缓存中的文件状态，下次可直接命中
+    entry["stat"] = stat_key
+    _write_entry(path, entry)
+    return entry["cases"]
+
+
+def file_stat_key(path: str) -> Tuple[int, int]:
+    """
+    获取用于快速判断文件是否变化的 (修改时间, 大小)
+
+    Args:
+        path (str): 文件路径
+
+    Returns:
+        Tuple[int, int]: (st_mtime_ns, st_size)
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def store_cached_cases(excel_path: str, sheet_name: str, base_url: str,
+                       cases: List[Dict[str, Any]], parsed_stat: Tuple[int, int]):
+    """
+    写入用例缓存
+
+    Args:
+        excel_path (str): Excel文件路径
+        sheet_name (str): sheet名称
+        base_url (str): 基础URL
+        cases (List[Dict[str, Any]]): 规范化后的用例列表
+        parsed_stat (Tuple[int, int]): 解析前获取的文件状态，
+            解析期间文件被修改时放弃写入，避免缓存旧内容
+    """
+    if file_stat_key(excel_path) != parsed_stat:
+        logger.info("解析期间工作簿发生变化，本次不写入用例缓存")
+        return
+    entry = {
+        "version": CACHE_VERSION,
+        "sheet_name": sheet_name,
+        "base_url": base_url,
+        "stat": parsed_stat,
+        "digest": _file_digest(excel_path),
+        "cases": cases,
+    }
+    _write_entry(cache_path_for(excel_path, sheet_name, base_url), entry)
+
+
+def _write_entry(path: str, entry: Dict[str, Any]):
+    """
+    以原子替换的方式写入缓存文件，写入失败只记录警告
+
+    Args:
+        path (str): 缓存文件路径
+        entry (Dict[str, Any]): 缓存内容
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"用例缓存写入失败: {e}")
@@ -0,0 +1,230 @@
+"""
+用例索引
+加载用例后一次性建立的查找索引，支持按用例编号、编号前缀、模块类型、
+接口路径和标题关键字查找，避免每次筛选都线性扫描全部用例
+"""
+
+import bisect
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import urlsplit
+from utils.case_model import TestCase
+
+
+def normalize_path(url: str) -> str:
+    """
+    提取URL中的路径部分作为索引键（去掉协议、主机、查询参数和末尾的斜杠）
+
+    Args:
+        url (str): 接口地址
+
+    Returns:
+        str: 路径，如 /cart/list
+    """
+    path = urlsplit(url).path if "://" in url else url.split("?", 1)[0]
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path or "/"
+
+
+class CaseIndex:
+    """
+    用例索引类
+
+    所有查找结果都按用例的加载顺序返回。标题关键字查找使用字符二元组（bigram）
+    倒排索引，先求候选集合的交集再确认子串，中文标题无需分词
+    """
+
+    def __init__(self, cases: Sequence[TestCase]):
+        """
+        根据用例建立索引
+
+        Args:
+            cases (Sequence[TestCase]): 测试用例记录，传入 TestCase 元组时直接引用，不复制
+        """
+        if isinstance(cases, tuple) and all(isinstance(case, TestCase) for case in cases):
+            self.cases: Tuple[TestCase, ...] = cases
+        else:
+            self.cases = tuple(TestCase.from_mapping(case) for case in cases)
+        self._by_id: Dict[str, int] = {}
+        self._by_module_type: Dict[str, List[int]] = defaultdict(list)
+        self._by_module: Dict[str, List[int]] = defaultdict(list)
+        self._by_path: Dict[str, List[int]] = defaultdict(list)
+        self._by_title: Dict[str, List[int]] = defaultdict(list)
+        self._title_grams: Dict[str, Set[int]] = defaultdict(set)
+
+        for position, case in enumerate(self.cases):
+            if case.case_id:
+                self._by_id.setdefault(case.case_id, position)
+            self._by_module_type[case.module_type].append(position)
+            self._by_module[case.module or ""].append(position)
+            self._by_path[normalize_path(case.url)].append(position)
+            self._by_title[case.title].append(position)
+            for gram in self._grams(case.title):
+                self._title_grams[gram].add(position)
+
+        # 排序后的 (用例编号, 位置) 列表，用于前缀二分查找
+        self._sorted_ids: List[Tuple[str, int]] = sorted(self._by_id.items())
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        """标题的单字和相邻二字组合"""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def _collect(self, positions: Iterable[int]) -> List[TestCase]:
+        return [self.cases[position] for position in sorted(set(positions))]
+
+    def _id_prefix_positions(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self._sorted_ids, (prefix,))
+        positions = []
+        for case_id, position in self._sorted_ids[start:]:
+            if not case_id.startswith(prefix):
+                break
+            positions.append(position)
+        return positions
+
+    def _title_positions(self, keyword: str) -> Set[int]:
+        if not keyword:
+            return set(range(len(self.cases)))
+        grams = [keyword] if len(keyword) == 1 else [keyword[i:i + 2] for i in range(len(keyword) - 1)]
+        postings = sorted((self._title_grams.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {position for position in candidates if keyword in self.cases[position].title}
+
+    def _keyword_positions(self, index: Dict[str, List[int]], keyword: str) -> List[int]:
+        # 只扫描去重后的键（接口路径、接口模块的种类远少于用例数）
+        return [position for key, positions in index.items() if keyword in key for position in positions]
+
+    def get(self, case_id: str) -> Optional[TestCase]:
+        """
+        按用例编号查找
+
+        Args:
+            case_id (str): 用例编号
+
+        Returns:
+            Optional[TestCase]: 测试用例，不存在时返回None
+        """
+        position = self._by_id.get(case_id)
+        return None if position is None else self.cases[position]
+
+    def find_by_id_prefix(self, prefix: str) -> List[TestCase]:
+        """
+        按用例编号前缀查找，如 MP-LOGIN、CART_
+
+        Args:
+            prefix (str): 编号前缀
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._id_prefix_positions(prefix))
+
+    def find_by_module_type(self, module_type: str) -> List[TestCase]:
+        """
+        按模块类型查找
+
+        Args:
+            module_type (str): 模块类型 (auth, cart, order, product, public)
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._by_module_type.get(module_type, ()))
+
+    def find_by_path(self, path: str) -> List[TestCase]:
+        """
+        按接口路径精确查找（可传完整URL，只比较路径部分）
+
+        Args:
+            path (str): 接口路径，如 /cart/list
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._by_path.get(normalize_path(path), ()))
+
+    def find_by_path_keyword(self, keyword: str) -> List[TestCase]:
+        """
+        查找接口路径包含指定关键字的用例
+
+        Args:
+            keyword (str): 路径关键字，如 login
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._keyword_positions(self._by_path, keyword))
+
+    def find_by_module_keyword(self, keyword: str) -> List[TestCase]:
+        """
+        查找“接口模块”列包含指定关键字的用例
+
+        Args:
+            keyword (str): 模块关键字，如 登录
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._keyword_positions(self._by_module, keyword))
+
+    def find_by_title(self, title: str) -> List[TestCase]:
+        """
+        按用例标题精确查找
+
+        Args:
+            title (str): 用例标题
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._by_title.get(title, ()))
+
+    def search_title(self, keyword: str) -> List[TestCase]:
+        """
+        查找标题包含指定关键字的用例
+
+        Args:
+            keyword (str): 标题关键字
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        return self._collect(self._title_positions(keyword))
+
+    def select_any(self, id_prefix: Union[str, Sequence[str]] = (), path_keyword: Union[str, Sequence[str]] = (),
+                   module_keyword: Union[str, Sequence[str]] = (), module_type: Union[str, Sequence[str]] = (),
+                   title_keyword: Union[str, Sequence[str]] = ()) -> List[TestCase]:
+        """
+        查找满足任一条件的用例（各条件取并集），每个条件可传单个值或多个值
+
+        Args:
+            id_prefix: 用例编号前缀
+            path_keyword: 接口路径关键字
+            module_keyword: 接口模块关键字
+            module_type: 模块类型
+            title_keyword: 标题关键字
+
+        Returns:
+            List[TestCase]: 匹配的测试用例
+        """
+        def values(value):
+            return (value,) if isinstance(value, str) else tuple(value)
+
+        positions: Set[int] = set()
+        for prefix in values(id_prefix):
+            positions.update(self._id_prefix_positions(prefix))
+        for keyword in values(path_keyword):
+            positions.update(self._keyword_positions(self._by_path, keyword))
+        for keyword in values(module_keyword):
+            positions.update(self._keyword_positions(self._by_module, keyword))
+        for value in values(module_type):
+            positions.update(self._by_module_type.get(value, ()))
+        for keyword in values(title_keyword):
+            positions.update(self._title_positions(keyword))
+        return self._collect(positions)
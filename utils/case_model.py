@@ -0,0 +1,331 @@
+"""
+测试用例模型
+使用 __slots__ 的紧凑用例记录，替代以中文列名为键的字典，
+加载时预先解析请求头、参数、模块类型并确定请求体编码方式，
+同时保留只读字典接口以兼容现有调用方
+"""
+
+import copy
+import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlencode
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Excel列名与 TestCase 属性的对应关系（顺序即字典视图的键顺序）
+COLUMN_FIELDS = {
+    "用例编号": "case_id",
+    "接口模块": "module",
+    "用例标题": "title",
+    "请求头": "headers",
+    "请求方式": "method",
+    "接口地址": "url",
+    "参数输入": "params_input",
+    "期望返回结果": "expected_result",
+    "实际结果": "actual_result",
+    "备注": "remark",
+}
+
+# 请求体编码方式
+BODY_QUERY = "query"  # 作为URL查询参数发送
+BODY_JSON = "json"    # 作为JSON请求体发送
+BODY_FORM = "form"    # 作为表单编码请求体发送
+BODY_RAW = "data"     # 原样作为请求体发送
+
+# 未传入已解析参数时的占位值
+_UNPARSED = object()
+
+
+def identify_module_type(url: str, case_id: str) -> str:
+    """
+    根据URL路径和用例编号识别模块类型
+
+    Args:
+        url (str): 接口地址
+        case_id (str): 用例编号
+
+    Returns:
+        str: 模块类型 (auth, cart, order, product, public)
+    """
+    # 根据URL路径识别模块类型
+    if "/member/" in url or "/auth/" in url or "login" in url or "register" in url:
+        return "auth"
+    elif "/cart/" in url:
+        return "cart"
+    elif "/order/" in url:
+        return "order"
+    elif "/product/" in url:
+        return "product"
+    # 根据用例编号前缀识别
+    elif case_id.startswith("MP-LOGIN") or case_id.startswith("MP-REGISTER"):
+        return "auth"
+    elif case_id.startswith("MP-CART"):
+        return "cart"
+    elif case_id.startswith("MP-ORDER"):
+        return "order"
+    elif case_id.startswith("MP-PRODUCT"):
+        return "product"
+    else:
+        return "public"  # 默认为公共模块
+
+
+def parse_headers(headers_input: Any) -> Dict[str, str]:
+    """
+    解析请求头
+
+    Args:
+        headers_input: 请求头输入（字符串如 "Content-Type: application/json; Authorization: xxx"，或字典）
+
+    Returns:
+        Dict[str, str]: 解析后的请求头字典
+    """
+    if isinstance(headers_input, Mapping):
+        return dict(headers_input)
+    headers = {}
+    if isinstance(headers_input, str):
+        for header in headers_input.split(";"):
+            if ":" in header:
+                key, value = header.split(":", 1)
+                headers[key.strip()] = value.strip()
+    return headers
+
+
+def parse_params_input(params_input: Any) -> Any:
+    """
+    解析参数输入，JSON格式的字符串解析为对象，其余情况返回原值
+
+    Args:
+        params_input: 参数输入
+
+    Returns:
+        Any: 解析后的参数
+    """
+    if not params_input:
+        return {}
+    if isinstance(params_input, str) and params_input.strip().startswith('{'):
+        try:
+            return json_codec.loads(params_input)
+        except ValueError:
+            # JSON解析失败，返回原值
+            logger.warning(f"参数JSON解析失败: {params_input}")
+    return params_input
+
+
+def select_body_encoding(method: str, content_type: str) -> Optional[str]:
+    """
+    根据请求方法和Content-Type确定请求体编码方式
+
+    Args:
+        method (str): HTTP请求方法（大写）
+        content_type (str): 请求头中的Content-Type
+
+    Returns:
+        Optional[str]: 编码方式，不支持的请求方法返回None
+    """
+    if method in ("GET", "DELETE"):
+        return BODY_QUERY
+    if method in ("POST", "PUT", "PATCH"):
+        if "application/json" in content_type:
+            return BODY_JSON
+        if "application/x-www-form-urlencoded" in content_type:
+            return BODY_FORM
+        return BODY_RAW
+    return None
+
+
+def build_request_kwargs(body_encoding: Optional[str], params: Any) -> Optional[Dict[str, Any]]:
+    """
+    按编码方式构建传给 requests 的请求参数
+
+    JSON请求体在这里预先序列化为UTF-8字节并通过 data 发送（Content-Type 已由请求头给出），
+    用例加载时只序列化一次，发送时不再重复编码
+
+    Args:
+        body_encoding (Optional[str]): 编码方式
+        params: 已解析的请求参数
+
+    Returns:
+        Optional[Dict[str, Any]]: 请求参数，编码方式为None时返回None
+    """
+    if body_encoding == BODY_QUERY:
+        return {"params": params}
+    if body_encoding == BODY_JSON:
+        return {"data": json_codec.dumps_bytes(params)}
+    if body_encoding == BODY_FORM:
+        # 如果参数是字典，转换为表单编码格式；如果参数是字符串，直接使用
+        return {"data": urlencode(params) if isinstance(params, dict) else params}
+    if body_encoding == BODY_RAW:
+        return {"data": params}
+    return None
+
+
+class TestCase(Mapping):
+    """
+    测试用例记录类
+
+    字段以属性形式访问（case.url、case.headers），同时实现只读 Mapping 接口，
+    case.get("接口地址") / case["用例编号"] 等旧写法仍然可用。
+    同一条用例记录会在多个执行器和线程之间共享：headers 和 extra 为只读视图；
+    params（加载时解析好的参数）和 request_kwargs（按预先确定的 body_encoding 构建的请求参数）
+    每次访问返回深拷贝，修改返回值不会影响用例记录，需要修改字段时使用 replace 生成新记录。
+    发送和报告等只读场景使用 shared_params / shared_request_kwargs 直接取用共享对象，避免每次发送都复制请求体
+    """
+
+    __test__ = False  # 避免被pytest当作测试类收集
+    __slots__ = ("case_id", "module", "title", "headers", "method", "url", "params_input",
+                 "expected_result", "actual_result", "remark", "extra", "module_type", "_params",
+                 "body_encoding", "_request_kwargs")
+
+    def __init__(self, case_id: str = "", module: Optional[str] = None, title: str = "",
+                 headers: Any = None, method: str = "GET", url: str = "", params_input: Any = "",
+                 expected_result: str = "", actual_result: Any = None, remark: Any = None,
+                 extra: Optional[Dict[Any, Any]] = None, params: Any = _UNPARSED):
+        """
+        初始化测试用例记录
+
+        Args:
+            case_id (str): 用例编号
+            module (Optional[str]): 接口模块
+            title (str): 用例标题
+            headers: 请求头（字符串或字典）
+            method (str): 请求方式
+            url (str): 接口地址
+            params_input: 参数输入（原始值）
+            expected_result (str): 期望返回结果
+            actual_result: 实际结果
+            remark: 备注
+            extra (Optional[Dict[Any, Any]]): 其他未识别的列
+            params: 已解析的请求参数，不传时由 params_input 解析（传入的对象会被复制）
+        """
+        self.case_id = case_id or ""
+        self.module = module
+        self.title = title or ""
+        self.headers = MappingProxyType(parse_headers(headers))
+        self.method = (method or "GET").upper()
+        self.url = url or ""
+        self.params_input = params_input
+        self.expected_result = expected_result or ""
+        self.actual_result = actual_result
+        self.remark = remark
+        self.extra = MappingProxyType(dict(extra)) if extra else None
+        self._params = parse_params_input(params_input) if params is _UNPARSED else copy.deepcopy(params)
+        self._prepare()
+
+    def _prepare(self):
+        """预先计算模块类型、请求体编码方式和请求参数"""
+        self.module_type = identify_module_type(self.url, self.case_id)
+        self.body_encoding = select_body_encoding(self.method, self.headers.get("Content-Type", ""))
+        self._request_kwargs = build_request_kwargs(self.body_encoding, self._params)
+
+    @property
+    def params(self) -> Any:
+        """已解析的请求参数（深拷贝）"""
+        return copy.deepcopy(self._params)
+
+    @property
+    def request_kwargs(self) -> Optional[Dict[str, Any]]:
+        """传给 requests 的请求参数（深拷贝），不支持的请求方法为None"""
+        return copy.deepcopy(self._request_kwargs)
+
+    @property
+    def shared_params(self) -> Any:
+        """已解析的请求参数（与用例记录共享，只读，调用方不得修改）"""
+        return self._params
+
+    @property
+    def shared_request_kwargs(self) -> Optional[Mapping]:
+        """传给 requests 的请求参数（与用例记录共享，只读，调用方不得修改），不支持的请求方法为None"""
+        return None if self._request_kwargs is None else MappingProxyType(self._request_kwargs)
+
+    @classmethod
+    def from_mapping(cls, case: Mapping) -> "TestCase":
+        """
+        由以中文列名为键的用例字典构建测试用例记录
+
+        Args:
+            case (Mapping): 用例字典
+
+        Returns:
+            TestCase: 测试用例记录（传入的已是 TestCase 时原样返回）
+        """
+        if isinstance(case, TestCase):
+            return case
+        kwargs = {}
+        extra = None
+        for key, value in case.items():
+            field = COLUMN_FIELDS.get(key)
+            if field is not None:
+                kwargs[field] = value
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        return cls(extra=extra, **kwargs)
+
+    def replace(self, **changes) -> "TestCase":
+        """
+        复制出修改了部分字段的新用例记录，原记录保持不变
+
+        Args:
+            **changes: 要修改的字段（属性名），如 headers、params、params_input，
+                module_type、body_encoding 和 request_kwargs 由其他字段计算，不能直接修改
+
+        Returns:
+            TestCase: 新的测试用例记录
+
+        Raises:
+            ValueError: 修改了由其他字段计算的属性
+        """
+        derived = {"module_type", "body_encoding", "request_kwargs"}.intersection(changes)
+        if derived:
+            raise ValueError(f"不能直接修改由其他字段计算的属性: {', '.join(sorted(derived))}")
+        new_case = TestCase.__new__(TestCase)
+        for slot in TestCase.__slots__:
+            setattr(new_case, slot, getattr(self, slot))
+        for field, value in changes.items():
+            if field == "headers":
+                value = MappingProxyType(parse_headers(value))
+            elif field == "method":
+                value = (value or "GET").upper()
+            elif field == "extra":
+                value = MappingProxyType(dict(value)) if value else None
+            elif field == "params":
+                field, value = "_params", copy.deepcopy(value)
+            setattr(new_case, field, value)
+        if "params_input" in changes and "params" not in changes:
+            new_case._params = parse_params_input(new_case.params_input)
+        new_case._prepare()
+        return new_case
+
+    def __getitem__(self, key):
+        field = COLUMN_FIELDS.get(key)
+        if field is not None:
+            return getattr(self, field)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator:
+        yield from COLUMN_FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(COLUMN_FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def copy(self) -> Dict[Any, Any]:
+        """
+        复制为可修改的普通字典（以中文列名为键，值为深拷贝，请求头为普通字典）
+
+        Returns:
+            Dict[Any, Any]: 用例字典
+        """
+        case = {key: copy.deepcopy(value) for key, value in self.items() if key != "请求头"}
+        case["请求头"] = dict(self.headers)
+        return case
+
+    def __repr__(self) -> str:
+        return f"TestCase({self.case_id!r}, {self.method} {self.url!r})"
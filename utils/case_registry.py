@@ -0,0 +1,163 @@
+"""
+用例注册表
+进程级共享的测试用例仓库，每个 (文件, sheet) 只加载一次，
+多个 TestExecutor 和测试模块共享同一份只读用例记录
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+from utils.excel_reader import list_sheet_names, read_all_sheets
+from utils.case_sources import load_cases
+from utils.case_model import TestCase
+from utils.case_index import CaseIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CaseRegistry:
+    """测试用例注册表类，线程安全，按 (文件绝对路径, sheet名称) 缓存用例"""
+
+    def __init__(self):
+        """初始化用例注册表"""
+        self._cases: Dict[Tuple[str, str], Tuple[TestCase, ...]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # 用例索引及建立索引时的用例元组（CaseIndex 会复制用例，按来源判断索引是否过期）
+        self._indexes: Dict[Tuple[str, str], Tuple[Tuple[TestCase, ...], CaseIndex]] = {}
+
+    @staticmethod
+    def _make_key(excel_path: str, sheet_name: str) -> Tuple[str, str]:
+        return os.path.abspath(excel_path), sheet_name
+
+    def _key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_cases(self, excel_path: str, sheet_name: str) -> Tuple[TestCase, ...]:
+        """
+        获取指定文件和sheet的用例，首次访问时加载，之后直接返回共享的只读用例记录，
+        加载方式按文件扩展名选择（Excel/CSV/JSONL/Parquet）
+
+        Args:
+            excel_path (str): 用例文件路径
+            sheet_name (str): sheet名称
+
+        Returns:
+            Tuple[TestCase, ...]: 只读用例记录元组
+        """
+        key = self._make_key(excel_path, sheet_name)
+        cases = self._cases.get(key)
+        if cases is not None:
+            return cases
+
+        # 按键加锁，不同sheet可以并行加载，同一sheet只加载一次
+        with self._key_lock(key):
+            cases = self._cases.get(key)
+            if cases is None:
+                cases = tuple(TestCase.from_mapping(case) for case in load_cases(*key))
+                self._cases[key] = cases
+                logger.info(f"用例注册表已加载 {os.path.basename(key[0])}[{sheet_name}]，共 {len(cases)} 条")
+        return cases
+
+    def get_index(self, excel_path: str, sheet_name: str) -> CaseIndex:
+        """
+        获取指定文件和sheet的用例索引，首次访问或用例重新加载后建立（与加载用例使用同一把按键的锁，
+        并发访问时只建立一次）
+
+        Args:
+            excel_path (str): 用例文件路径
+            sheet_name (str): sheet名称
+
+        Returns:
+            CaseIndex: 用例索引
+        """
+        key = self._make_key(excel_path, sheet_name)
+        cases = self.get_cases(*key)
+        entry = self._indexes.get(key)
+        if entry is not None and entry[0] is cases:
+            return entry[1]
+
+        with self._key_lock(key):
+            entry = self._indexes.get(key)
+            if entry is None or entry[0] is not cases:
+                entry = self._indexes[key] = (cases, CaseIndex(cases))
+        return entry[1]
+
+    def preload(self, excel_path: str, sheets: Optional[Sequence[str]] = None,
+                workers: Optional[int] = None) -> Dict[str, Tuple[TestCase, ...]]:
+        """
+        使用多进程并行加载Excel中的多个sheet到注册表，已加载的sheet不会重复解析
+
+        Args:
+            excel_path (str): Excel文件路径
+            sheets (Optional[Sequence[str]]): sheet名称，默认全部sheet
+            workers (Optional[int]): 工作进程数
+
+        Returns:
+            Dict[str, Tuple[TestCase, ...]]: sheet名称到用例记录的映射
+        """
+        path = os.path.abspath(excel_path)
+        if sheets is None:
+            sheets = list_sheet_names(path)
+        missing = [sheet for sheet in sheets if (path, sheet) not in self._cases]
+        if missing:
+            loaded = read_all_sheets(path, missing, workers)
+            with self._lock:
+                for sheet_name, cases in loaded.items():
+                    self._cases.setdefault((path, sheet_name),
+                                           tuple(TestCase.from_mapping(case) for case in cases))
+            logger.info(f"用例注册表已并行加载 {os.path.basename(path)} 的 {len(loaded)} 个sheet")
+        return {sheet: self.get_cases(path, sheet) for sheet in sheets}
+
+    def invalidate(self, excel_path: Optional[str] = None, sheet_name: Optional[str] = None):
+        """
+        使注册表中的用例失效，下次访问时重新加载
+
+        Args:
+            excel_path (Optional[str]): Excel文件路径，为None时清空全部
+            sheet_name (Optional[str]): sheet名称，为None时清除该文件的所有sheet
+        """
+        with self._lock:
+            if excel_path is None:
+                self._cases.clear()
+                self._indexes.clear()
+                return
+            path = os.path.abspath(excel_path)
+            for key in list(self._cases):
+                if key[0] == path and (sheet_name is None or key[1] == sheet_name):
+                    del self._cases[key]
+                    self._indexes.pop(key, None)
+
+
+# 进程级共享的用例注册表实例
+case_registry = CaseRegistry()
+
+
+def get_test_cases(excel_path: str, sheet_name: str) -> Tuple[TestCase, ...]:
+    """
+    从进程级用例注册表获取用例
+
+    Args:
+        excel_path (str): Excel文件路径
+        sheet_name (str): sheet名称
+
+    Returns:
+        Tuple[TestCase, ...]: 只读用例记录元组
+    """
+    return case_registry.get_cases(excel_path, sheet_name)
+
+
+def get_case_index(excel_path: str, sheet_name: str) -> CaseIndex:
+    """
+    从进程级用例注册表获取用例索引
+
+    Args:
+        excel_path (str): 用例文件路径
+        sheet_name (str): sheet名称
+
+    Returns:
+        CaseIndex: 用例索引
+    """
+    return case_registry.get_index(excel_path, sheet_name)
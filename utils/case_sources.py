@@ -0,0 +1,255 @@
+"""
+用例数据源
+按文件扩展名选择用例加载方式，除Excel外还支持列结构相同的CSV、JSONL和Parquet文件。
+文本格式通过内存映射(mmap)逐行读取，Parquet通过pyarrow的内存映射读取，
+所有数据源都经过与Excel相同的规范化处理。
+可能被同时改写的文件（如用例文件监视器轮询的文件）需以 in_memory=True 读取：
+读取内存映射期间文件被截断时进程会收到SIGBUS直接退出，无法作为异常处理
+
+"""
+
+import codecs
+import csv
+import io
+import json
+import mmap
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+from utils import json_codec
+from utils.excel_reader import iter_excel_rows, normalize_case, read_excel_test_cases
+
+EXCEL_SUFFIXES = (".xlsx", ".xlsm")
+CSV_SUFFIXES = (".csv",)
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+PARQUET_SUFFIXES = (".parquet",)
+
+
+def _suffix(path: str) -> str:
+    return os.path.splitext(path)[1].lower()
+
+
+def _check_exists(path: str):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"用例文件不存在：{path}")
+
+
+def _import_pyarrow():
+    """
+    导入pyarrow（可选依赖，只有Parquet格式需要）
+
+    Returns:
+        tuple: (pyarrow, pyarrow.parquet)
+
+    Raises:
+        ImportError: 未安装pyarrow
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(f"读写Parquet用例需要安装pyarrow（pip install pyarrow，版本见 requirements.txt）：{e}") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _iter_mmap_lines(path: str, in_memory: bool = False) -> Iterator[bytes]:
+    """
+    通过内存映射逐行读取文件
+
+    Args:
+        path (str): 文件路径
+        in_memory (bool): 先把整个文件读入内存再逐行读取，不建立内存映射
+
+    Returns:
+        Iterator[bytes]: 行内容（包含换行符）
+    """
+    if in_memory:
+        with open(path, "rb") as f:
+            data = f.read()
+        yield from io.BytesIO(data)
+        return
+    with open(path, "rb") as f:
+        # 空文件无法建立内存映射
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
+def _clean_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """文本格式中的空字符串等价于Excel中的空单元格"""
+    return {key: (None if value == "" else value) for key, value in row.items()}
+
+
+def iter_csv_rows(path: str, in_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    读取CSV用例文件的原始行（第一行为列名，UTF-8编码，可带BOM）
+
+    Args:
+        path (str): CSV文件路径
+        in_memory (bool): 先读入内存，不使用内存映射
+
+    Returns:
+        Iterator[Dict[str, Any]]: 原始行生成器
+    """
+    _check_exists(path)
+    lines = codecs.iterdecode(_iter_mmap_lines(path, in_memory), "utf-8-sig")
+    for row in csv.DictReader(lines):
+        yield _clean_row(row)
+
+
+def iter_jsonl_rows(path: str, in_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    读取JSONL用例文件的原始行（每行一个以列名为键的JSON对象）
+
+    Args:
+        path (str): JSONL文件路径
+        in_memory (bool): 先读入内存，不使用内存映射
+
+    Returns:
+        Iterator[Dict[str, Any]]: 原始行生成器
+    """
+    _check_exists(path)
+    for line_no, line in enumerate(_iter_mmap_lines(path, in_memory), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json_codec.loads(line)
+        except ValueError as e:
+            raise ValueError(f"JSONL第{line_no}行解析失败：{e}") from e
+        if not isinstance(row, dict):
+            raise ValueError(f"JSONL第{line_no}行不是JSON对象")
+        yield row
+
+
+def iter_parquet_rows(path: str, in_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    读取Parquet用例文件的原始行（需要安装pyarrow）
+
+    Args:
+        path (str): Parquet文件路径
+        in_memory (bool): 不使用内存映射
+
+    Returns:
+        Iterator[Dict[str, Any]]: 原始行生成器
+    """
+    _check_exists(path)
+    _, pq = _import_pyarrow()
+    parquet_file = pq.ParquetFile(path, memory_map=not in_memory)
+    for batch in parquet_file.iter_batches():
+        yield from batch.to_pylist()
+
+
+def iter_raw_rows(path: str, sheet_name: Optional[str] = None,
+                  in_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    按文件扩展名读取原始行（未做规范化）
+
+    Args:
+        path (str): 用例文件路径
+        sheet_name (Optional[str]): sheet名称，仅Excel文件需要
+        in_memory (bool): CSV、JSONL和Parquet文件不使用内存映射（Excel始终按普通文件读取）
+
+    Returns:
+        Iterator[Dict[str, Any]]: 原始行生成器
+    """
+    suffix = _suffix(path)
+    if suffix in EXCEL_SUFFIXES:
+        if not sheet_name:
+            raise ValueError("读取Excel用例必须指定sheet名称")
+        return iter_excel_rows(path, sheet_name)
+    if suffix in CSV_SUFFIXES:
+        return iter_csv_rows(path, in_memory)
+    if suffix in JSONL_SUFFIXES:
+        return iter_jsonl_rows(path, in_memory)
+    if suffix in PARQUET_SUFFIXES:
+        return iter_parquet_rows(path, in_memory)
+    raise ValueError(f"不支持的用例文件格式：{path}")
+
+
+def iter_cases(path: str, sheet_name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    按文件扩展名逐条读取规范化后的测试用例
+
+    Args:
+        path (str): 用例文件路径（.xlsx/.csv/.jsonl/.parquet）
+        sheet_name (Optional[str]): sheet名称，仅Excel文件需要，其他格式忽略
+
+    Returns:
+        Iterator[Dict[str, Any]]: 测试用例生成器
+    """
+    for row in iter_raw_rows(path, sheet_name):
+        yield normalize_case(row)
+
+
+def load_cases(path: str, sheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    按文件扩展名读取全部测试用例，Excel文件使用带缓存的读取方式
+
+    Args:
+        path (str): 用例文件路径（.xlsx/.csv/.jsonl/.parquet）
+        sheet_name (Optional[str]): sheet名称，仅Excel文件需要，其他格式忽略
+
+    Returns:
+        List[Dict[str, Any]]: 测试用例列表
+    """
+    if _suffix(path) in EXCEL_SUFFIXES:
+        if not sheet_name:
+            raise ValueError("读取Excel用例必须指定sheet名称")
+        return read_excel_test_cases(path, sheet_name)
+    return list(iter_cases(path, sheet_name))
+
+
+def convert_excel(excel_path: str, sheet_name: str, output_path: str) -> int:
+    """
+    将Excel中的用例转换为CSV、JSONL或Parquet文件（按输出文件扩展名决定格式）
+
+    转换的是未规范化的原始单元格内容（保留 {{portal.mall}} 占位符和请求头原文），
+    加载时与Excel走相同的规范化流程；列名为空的列会被忽略
+
+    Args:
+        excel_path (str): Excel文件路径
+        sheet_name (str): sheet名称
+        output_path (str): 输出文件路径
+
+    Returns:
+        int: 转换的用例条数
+    """
+    rows = [{key: value for key, value in row.items() if key is not None}
+            for row in iter_excel_rows(excel_path, sheet_name)]
+    columns = list(rows[0]) if rows else []
+    suffix = _suffix(output_path)
+
+    if suffix in CSV_SUFFIXES:
+        with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({key: "" if value is None else value for key, value in row.items()})
+    elif suffix in JSONL_SUFFIXES:
+        with open(output_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False, default=str))
+                f.write("\n")
+    elif suffix in PARQUET_SUFFIXES:
+        pa, pq = _import_pyarrow()
+        # 统一转为字符串列，避免同一列中混合类型导致无法推断schema
+        table = pa.table({
+            column: pa.array([None if row.get(column) is None else str(row[column]) for row in rows],
+                             type=pa.string())
+            for column in columns
+        })
+        pq.write_table(table, output_path)
+    else:
+        raise ValueError(f"不支持的输出格式：{output_path}")
+    return len(rows)
+
+
+if __name__ == '__main__':
+    # 用法: python -m utils.case_sources <Excel文件> <sheet名称> <输出文件>
+    if len(sys.argv) != 4:
+        print("用法: python -m utils.case_sources <Excel文件> <sheet名称> <输出文件(.csv/.jsonl/.parquet)>")
+        sys.exit(1)
+    count = convert_excel(sys.argv[1], sys.argv[2], sys.argv[3])
+    print(f"已转换 {count} 条用例到 {sys.argv[3]}")
@@ -0,0 +1,165 @@
+"""
+用例文件监视器
+长时间运行时监视用例文件的变化，按用例编号比对原始行，
+只对新增和修改的行重新做规范化和用例构建，并把增量推送给订阅者（如 TestExecutor）
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utils.case_cache import file_stat_key
+from utils.case_model import TestCase
+from utils.case_sources import iter_raw_rows
+from utils.excel_reader import normalize_case
+
+logger = logging.getLogger(__name__)
+
+
+class CaseDelta:
+    """用例增量类，记录一次文件变化中新增、修改和删除的用例"""
+
+    __slots__ = ("added", "changed", "removed")
+
+    def __init__(self, added: Tuple[TestCase, ...] = (), changed: Tuple[TestCase, ...] = (),
+                 removed: Tuple[str, ...] = ()):
+        """
+        初始化用例增量
+
+        Args:
+            added (Tuple[TestCase, ...]): 新增的用例
+            changed (Tuple[TestCase, ...]): 内容变化的用例
+            removed (Tuple[str, ...]): 被删除的用例编号
+        """
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self) -> str:
+        return f"CaseDelta(新增={len(self.added)}, 修改={len(self.changed)}, 删除={len(self.removed)})"
+
+
+class CaseWatcher:
+    """用例文件监视器类，按固定间隔轮询文件状态，变化时计算并发布增量"""
+
+    def __init__(self, path: str, sheet_name: Optional[str] = None, interval: float = 2.0):
+        """
+        初始化用例文件监视器
+
+        Args:
+            path (str): 用例文件路径
+            sheet_name (Optional[str]): sheet名称，仅Excel文件需要
+            interval (float): 轮询间隔（秒）
+        """
+        self.path = path
+        self.sheet_name = sheet_name
+        self.interval = interval
+        self._subscribers: List[Callable[[CaseDelta], Any]] = []
+        self._rows: Dict[str, Tuple] = {}
+        self._stat_key: Optional[Tuple[int, int]] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[CaseDelta], Any]):
+        """
+        订阅用例增量
+
+        Args:
+            callback (Callable[[CaseDelta], Any]): 收到增量时调用的回调
+        """
+        self._subscribers.append(callback)
+
+    def _read_rows(self) -> Dict[str, Tuple]:
+        """
+        读取文件中的原始行，按用例编号建立快照
+
+        Returns:
+            Dict[str, Tuple]: 用例编号到原始行内容的映射
+        """
+        rows = {}
+        # 文件可能在读取期间被改写，不使用内存映射（映射区域被截断时进程会收到SIGBUS）
+        for row in iter_raw_rows(self.path, self.sheet_name, in_memory=True):
+            case_id = row.get("用例编号")
+            if not case_id:
+                continue
+            if case_id in rows:
+                logger.warning(f"用例编号重复，以后出现的行为准: {case_id}")
+            rows[case_id] = tuple(row.items())
+        return rows
+
+    def snapshot(self):
+        """记录当前文件内容作为比对基准（不发布增量）"""
+        with self._lock:
+            self._stat_key = file_stat_key(self.path)
+            self._rows = self._read_rows()
+
+    def check(self) -> Optional[CaseDelta]:
+        """
+        检查文件是否变化，变化时计算增量并通知订阅者
+
+        Returns:
+            Optional[CaseDelta]: 本次检测到的增量，文件未变化或内容无差异时返回None
+        """
+        with self._lock:
+            stat_key = file_stat_key(self.path)
+            if stat_key == self._stat_key:
+                return None
+            try:
+                new_rows = self._read_rows()
+            except Exception as e:
+                # 文件可能正在被保存，下次轮询再试
+                logger.warning(f"读取用例文件失败，稍后重试: {e}")
+                return None
+            old_rows = self._rows
+            self._stat_key = stat_key
+            self._rows = new_rows
+
+        added, changed = [], []
+        for case_id, row in new_rows.items():
+            old_row = old_rows.get(case_id)
+            if old_row == row:
+                continue
+            # 只对新增和修改的行做规范化
+            case = TestCase.from_mapping(normalize_case(dict(row)))
+            (added if old_row is None else changed).append(case)
+        removed = tuple(case_id for case_id in old_rows if case_id not in new_rows)
+
+        delta = CaseDelta(tuple(added), tuple(changed), removed)
+        if not delta:
+            return None
+        logger.info(f"检测到用例文件变化: {delta}")
+        for callback in list(self._subscribers):
+            try:
+                callback(delta)
+            except Exception as e:
+                logger.error(f"用例增量回调执行失败: {e}")
+        return delta
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning(f"检查用例文件变化时出错: {e}")
+
+    def start(self):
+        """启动后台轮询线程（首次启动时记录比对基准）"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._stat_key is None:
+            self.snapshot()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="case-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"开始监视用例文件: {self.path}")
+
+    def stop(self):
+        """停止后台轮询线程"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+        logger.info(f"停止监视用例文件: {self.path}")
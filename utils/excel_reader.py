@@ -1,66 +1,168 @@
 import os
-from openpyxl import load_workbook
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from config.config import base_url  # 从配置文件导入基础URL
+from config.config import use_case_cache
+from utils.case_cache import file_stat_key, load_cached_cases, store_cached_cases
 
 
-def read_excel_test_cases(excel_path: str, sheet_name: str) -> list:
+def normalize_case(case: Dict[str, Any]) -> Dict[str, Any]:
     """
-    读取Excel中的测试用例，转换为字典列表。
+    规范化单条测试用例（替换变量、解析请求头、整理参数输入）
+    :param case: 以列名为键的原始用例字典
+    :return: 规范化后的用例字典
+    """
+    # 替换变量（如{{portal.mall}}→base_url）
+    if "{{portal.mall}}" in (case.get("接口地址") or ""):
+        case["接口地址"] = case["接口地址"].replace("{{portal.mall}}", base_url)
+
+    # 处理请求头（字符串→字典）
+    if case.get("请求头"):
+        headers = {}
+        for header in case["请求头"].split(";"):
+            if ":" in header:
+                key, value = header.split(":", 1)
+                headers[key.strip()] = value.strip()
+        case["请求头"] = headers
+
+    # 处理参数输入（根据请求方式转换格式）
+    request_method = (case.get("请求方式") or "").upper()
+    case["请求方式"] = request_method  # 回写规范化后的请求方式
+    params_input = case.get("参数输入", "")
+    # 去除参数输入中的前后空格和换行符，并格式化为有效的JSON字符串
+    if isinstance(params_input, str):
+        # 先去除首尾空白
+        params_input = params_input.strip()
+        # 替换换行符和多余空格为单个空格，避免JSON解析错误
+        params_input = params_input.replace('\n', ' ').replace('\r', ' ').replace('  ', ' ')
+        case["参数输入"] = params_input
+    return case
+
+
+def iter_excel_rows(excel_path: str, sheet_name: str) -> Iterator[Dict[str, Any]]:
+    """
+    以只读流式方式逐行读取Excel中的原始数据（未做规范化）。
+    使用openpyxl的read_only模式和values_only迭代器，不会一次性构建整个工作表，
+    适合行数很多的用例文件。
     :param excel_path: Excel文件路径（相对/绝对路径）
     :param sheet_name:  sheet名称
-    :return: 测试用例列表（每个元素是字典，键为列名）
+    :return: 原始行生成器（每个元素是字典，键为列名）
     """
     # 1. 校验Excel文件是否存在
     if not os.path.exists(excel_path):
         raise FileNotFoundError(f"Excel文件不存在：{excel_path}")
 
+    # 2. 以只读模式加载Excel workbook（openpyxl导入较慢，命中用例缓存时无需导入）
+    from openpyxl import load_workbook
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in workbook.sheetnames:
+            raise ValueError(f"Sheet不存在：{sheet_name}")
+        sheet = workbook[sheet_name]
+
+        rows = sheet.iter_rows(values_only=True)
+        # 3. 提取列名（第一行）
+        columns = next(rows, None)
+        if columns is None:
+            return
+        # 4. 遍历行，转换为字典并逐条返回
+        for row in rows:
+            yield dict(zip(columns, row))
+    finally:
+        # 5. 关闭workbook（只读模式会持有文件句柄）
+        workbook.close()
+
+
+def iter_excel_test_cases(excel_path: str, sheet_name: str) -> Iterator[Dict[str, Any]]:
+    """
+    以只读流式方式逐条读取Excel中的测试用例。
+    :param excel_path: Excel文件路径（相对/绝对路径）
+    :param sheet_name:  sheet名称
+    :return: 测试用例生成器（每个元素是规范化后的字典，键为列名）
+    """
+    for row in iter_excel_rows(excel_path, sheet_name):
+        yield normalize_case(row)
+
+
+def read_excel_test_cases(excel_path: str, sheet_name: str, use_cache: Optional[bool] = None) -> list:
+    """
+    读取Excel中的测试用例，转换为字典列表。
+    工作簿未变化时直接返回 .case_cache 中缓存的规范化结果，工作簿被修改后自动重新解析。
+    :param excel_path: Excel文件路径（相对/绝对路径）
+    :param sheet_name:  sheet名称
+    :param use_cache: 是否使用用例缓存，默认取配置项 use_case_cache
+    :return: 测试用例列表（每个元素是字典，键为列名）
+    """
+    if use_cache is None:
+        use_cache = use_case_cache
+    if not use_cache:
+        return list(iter_excel_test_cases(excel_path, sheet_name))
+
+    if not os.path.exists(excel_path):
+        raise FileNotFoundError(f"Excel文件不存在：{excel_path}")
+    cached = load_cached_cases(excel_path, sheet_name, base_url)
+    if cached is not None:
+        return cached
 
-    # 2. 加载Excel workbook
-    workbook=load_workbook(excel_path)
-    sheet=workbook[sheet_name]
-    if not sheet:
-        raise ValueError(f"Sheet不存在：{sheet_name}")
-
-    # 3. 提取列名（第一行）
-    columns = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-    # 4. 遍历行，转换为字典
-    test_cases=[]
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        case=dict(zip(columns, row))
-
-    # 5. 替换变量（如{{portal.mall}}→base_url）
-        if "{{portal.mall}}" in case.get("接口地址", ""):
-            case["接口地址"] = case["接口地址"].replace("{{portal.mall}}", base_url)
-
-        # 6. 处理请求头（字符串→字典）
-        if case.get("请求头"):
-            headers={}
-            for header in case["请求头"].split(";"):
-                if":"in header:
-                    key, value = header.split(":",1)
-                    headers[key.strip()] = value.strip()
-            case["请求头"] = headers
-    # 7. 处理参数输入（根据请求方式转换格式）
-        request_method = case.get("请求方式", "").upper()
-        case["请求方式"] = request_method  # 回写规范化后的请求方式
-        params_input = case.get("参数输入", "")
-        # 去除参数输入中的前后空格和换行符，并格式化为有效的JSON字符串
-        if isinstance(params_input, str):
-            # 先去除首尾空白
-            params_input = params_input.strip()
-            # 替换换行符和多余空格为单个空格，避免JSON解析错误
-            params_input = params_input.replace('\n', ' ').replace('\r', ' ').replace('  ', ' ')
-            case["参数输入"] = params_input
-    # 8. 添加到测试用例列表
-        test_cases.append(case)
-
-    # 9. 关闭workbook
-    workbook.close()
-    # for case1 in test_cases:
-    #     print(case1)
-    # print(f"成功读取{len(test_cases)}条测试用例")
+    parsed_stat = file_stat_key(excel_path)
+    test_cases = list(iter_excel_test_cases(excel_path, sheet_name))
+    store_cached_cases(excel_path, sheet_name, base_url, test_cases, parsed_stat)
     return test_cases
 
 
+def list_sheet_names(excel_path: str) -> List[str]:
+    """
+    获取Excel中所有sheet的名称
+    :param excel_path: Excel文件路径
+    :return: sheet名称列表
+    """
+    if not os.path.exists(excel_path):
+        raise FileNotFoundError(f"Excel文件不存在：{excel_path}")
+    from openpyxl import load_workbook
+    workbook = load_workbook(excel_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _read_sheet_worker(excel_path: str, sheet_name: str) -> Tuple[str, list]:
+    """
+    工作进程中读取单个sheet（需为模块级函数才能被进程池序列化）
+    :param excel_path: Excel文件路径
+    :param sheet_name: sheet名称
+    :return: (sheet名称, 测试用例列表)
+    """
+    return sheet_name, read_excel_test_cases(excel_path, sheet_name)
+
+
+def read_all_sheets(excel_path: str, sheets: Optional[Sequence[str]] = None,
+                    workers: Optional[int] = None) -> Dict[str, list]:
+    """
+    使用进程池并行读取多个sheet的测试用例，每个sheet在独立的工作进程中解析。
+    :param excel_path: Excel文件路径
+    :param sheets: 要读取的sheet名称，默认读取全部sheet
+    :param workers: 工作进程数，默认取CPU核数与sheet数的较小值；为1时在当前进程中顺序读取
+    :return: sheet名称到测试用例列表的映射（顺序与sheets一致）
+    """
+    if sheets is None:
+        sheets = list_sheet_names(excel_path)
+    sheets = list(sheets)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(sheets)))
+
+    if workers == 1:
+        return {sheet: read_excel_test_cases(excel_path, sheet) for sheet in sheets}
+
+    from concurrent.futures import ProcessPoolExecutor
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_read_sheet_worker, excel_path, sheet) for sheet in sheets]
+        for future in futures:
+            sheet_name, cases = future.result()
+            results[sheet_name] = cases
+    return results
+
+
 if __name__ == '__main__':
     test_cases = read_excel_test_cases("../data/mall测试用例.xlsx", "Sheet1")
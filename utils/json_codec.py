@@ -0,0 +1,85 @@
+"""
+JSON编解码
+统一的JSON序列化和解析入口：安装了 orjson 时使用 orjson，否则回退到标准库 json。
+请求体序列化为UTF-8字节（不转义中文），可直接作为请求体发送
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 未安装时使用标准库
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    解析JSON
+
+    Args:
+        data: JSON文本或UTF-8字节
+
+    Returns:
+        Any: 解析结果
+
+    Raises:
+        ValueError: 内容不是有效的JSON（两种实现的解析异常都是 ValueError 的子类）
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    将对象序列化为紧凑的UTF-8 JSON字节，用作请求体
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        bytes: JSON字节
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # 非字符串键、超出64位的整数等 orjson 不支持的情况交给标准库
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """
+    将对象序列化为紧凑的JSON文本（不转义中文），用于替换请求体中的占位符
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        str: JSON文本
+    """
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """
+    将对象序列化为缩进两个空格的JSON文本，用于日志和Allure附件
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        str: JSON文本
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
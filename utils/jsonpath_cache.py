@@ -0,0 +1,120 @@
+"""
+JSONPath表达式缓存
+编译后的JSONPath表达式放在有上限的LRU缓存中，供请求处理器和断言工具共用。
+$.data.token、$.data.list[0].id 这类只包含字段名和下标的简单路径直接按层级取值，
+不经过 jsonpath_ng 的语法解析；其他表达式仍由 jsonpath_ng 编译
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, List, Tuple, Union
+
+# 缓存的编译结果数量上限
+JSONPATH_CACHE_SIZE = 512
+
+# 简单路径: $ 后跟若干 .字段名 或 [整数下标]
+_SIMPLE_PATH = re.compile(r"^\$((?:\.[A-Za-z_][A-Za-z0-9_]*|\[-?\d+\])*)$")
+_SIMPLE_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(-?\d+)\]")
+
+
+class PathMatch:
+    """简单路径的匹配结果，与 jsonpath_ng 的匹配结果一样通过 value 取值"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"PathMatch({self.value!r})"
+
+
+class SimplePath:
+    """只包含字段名和整数下标的JSONPath，按层级直接取值"""
+
+    __slots__ = ("path", "steps", "_expr")
+
+    def __init__(self, path: str, steps: Tuple[Union[str, int], ...]):
+        """
+        初始化简单路径
+
+        Args:
+            path (str): 原始JSONPath表达式
+            steps (Tuple[Union[str, int], ...]): 字段名（str）和下标（int）组成的取值步骤
+        """
+        self.path = path
+        self.steps = steps
+        self._expr = None
+
+    def find(self, data: Any) -> List[Any]:
+        """
+        查找路径对应的值
+
+        Args:
+            data: JSON数据
+
+        Returns:
+            List[Any]: 匹配结果列表（最多一个），未找到时为空列表
+        """
+        value = data
+        for step in self.steps:
+            if isinstance(step, str):
+                # 与 jsonpath_ng 一致：值为None的字段也算匹配
+                if not isinstance(value, dict) or step not in value:
+                    return []
+                value = value[step]
+            elif isinstance(value, list):
+                if not -len(value) <= step < len(value):
+                    return []
+                value = value[step]
+            elif isinstance(value, dict):
+                return []
+            else:
+                # 对字符串等其他类型取下标时交给 jsonpath_ng，保持结果一致
+                return self._jsonpath().find(data)
+        return [PathMatch(value)]
+
+    def _jsonpath(self):
+        if self._expr is None:
+            from jsonpath_ng import parse
+            self._expr = parse(self.path)
+        return self._expr
+
+    def __repr__(self) -> str:
+        return f"SimplePath({self.path!r})"
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def compile_path(path: str):
+    """
+    编译JSONPath表达式（结果缓存）
+
+    Args:
+        path (str): JSONPath表达式
+
+    Returns:
+        SimplePath 或 jsonpath_ng 表达式，都提供 find(data) 方法，匹配结果通过 value 取值
+    """
+    match = _SIMPLE_PATH.match(path)
+    if match:
+        steps = tuple(field if field else int(index)
+                      for field, index in _SIMPLE_STEP.findall(match.group(1)))
+        return SimplePath(path, steps)
+    from jsonpath_ng import parse
+    return parse(path)
+
+
+def find_value(data: Any, path: str, default: Any = None) -> Any:
+    """
+    提取JSONPath对应的第一个值
+
+    Args:
+        data: JSON数据
+        path (str): JSONPath表达式
+        default: 未找到时的返回值
+
+    Returns:
+        Any: 提取到的值
+    """
+    match = compile_path(path).find(data)
+    return match[0].value if match else default